@@ -0,0 +1,369 @@
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only BatchBoard needs it
+    np = None
+
+from .Board import Board
+
+
+class BatchBoard:
+    """Many independent boards of the same size played in lock-step.
+
+    Cells of all the boards live in a single NumPy array of shape
+    (n_boards, height, width), 0 is an empty cell and player ID + 1 is
+    a stone, row 0 is the bottom one. Every step puts one stone into
+    every board still being played, all boards take turns in the same
+    order, so the player to move is the same for all of them.
+
+    Lines are found with sliding-window sums over the 2*line_length-1
+    cells around the new stone in four directions, for all the boards
+    at once, so a step costs a fixed number of array operations no
+    matter how many boards there are. When a board fits into 64 bits
+    in the Board bitboard layout, every board also keeps a uint64
+    bitboard per player and lines are found with the same shifts as
+    Board._check(), which is several times faster still.
+
+    Requires NumPy.
+
+    Args:
+        n_boards: number of boards.
+        width: width of the boards.
+        height: height of the boards.
+        line_length: length of a winning line.
+        n_players: number of players taking turns.
+        seed: seed of the random generator used for playouts.
+
+    Attributes:
+        cells: int8 array (n_boards, height, width) of stones.
+        heights: int16 array (n_boards, width) of column heights.
+        masks: uint64 array (n_boards, n_players) of bitboards,
+               or None when boards do not fit into 64 bits.
+        winner: int8 array (n_boards,), ID of the winner or -1.
+        done: bool array (n_boards,), True when a board is won or full.
+        n_moves: int32 array (n_boards,), stones placed on every board.
+        turn: ID of the player to move.
+
+    Methods:
+        reset(): Empty all the boards.
+        set_position(board, next_player): Copy a Board into all boards.
+        legal_moves(): Columns that are not full.
+        random_columns(): Pick a random legal column on every board.
+        step(columns): Put a stone of the player to move on every board.
+        playout(): Play all the boards to the end at random.
+    """
+
+    # Same number of stones(colors) as a Board has
+    N_SYMBOLS: int = 42
+
+    def __init__(self,
+                 n_boards: int,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 n_players: int = 2,
+                 seed: Optional[int] = None):
+        """Allocate the arrays for all the boards.
+
+        Args:
+            n_boards: number of boards.
+            width: width of the boards.
+            height: height of the boards.
+            line_length: length of a winning line.
+            n_players: number of players taking turns.
+            seed: seed of the random generator used for playouts.
+
+        Returns:
+            None
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If n_boards or n_players is not positive.
+            ValueError: If width, height or line_length are not valid,
+                        the same way as for a Board.
+        """
+        if np is None:
+            raise ImportError(
+                "BatchBoard needs NumPy, try `pip install numpy`")
+
+        if n_boards < 1:
+            raise ValueError(
+                "Number of boards should be positive, and not", n_boards)
+
+        if not 0 < n_players <= self.N_SYMBOLS:
+            raise ValueError(
+                "Number of players should be from 1 to", self.N_SYMBOLS,
+                ", and not", n_players)
+
+        if width < 1 or height < 1:
+            raise ValueError(
+                "I am not sure how to play on a Board of", width, "x", height)
+
+        if not 0 < line_length <= min(width, height):
+            raise ValueError(
+                "Line length should be from 1 to", min(width, height),
+                ", and not", line_length)
+
+        self.n_boards: int = n_boards
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.n_players: int = n_players
+        self.rng = np.random.default_rng(seed)
+
+        # Cells are surrounded by line_length-1 always empty cells,
+        # so the cells around any stone could be read without bound
+        # checks through a flat view of the array
+        self.pad: int = line_length - 1
+        self.grid = np.zeros(
+            (n_boards, height + 2 * self.pad, width + 2 * self.pad),
+            dtype=np.int8)
+        self.flat = self.grid.reshape(-1)
+        self.cells = self.grid[:, self.pad:self.pad + height,
+                               self.pad:self.pad + width]
+        self.heights = np.zeros((n_boards, width), dtype=np.int16)
+        self.winner = np.full(n_boards, -1, dtype=np.int8)
+        self.done = np.zeros(n_boards, dtype=bool)
+        self.n_moves = np.zeros(n_boards, dtype=np.int32)
+        self.turn: int = 0
+
+        # Offsets in the flat view from a stone to the cells around it
+        # which could form a line with it: up, right, up-right, down-right
+        row_size: int = self.grid.shape[2]
+        self.board_size: int = self.grid.shape[1] * row_size
+        self.row_size: int = row_size
+        offsets = np.arange(-(line_length - 1), line_length)
+        self.line_offsets: list = [
+            offsets * step
+            for step in (row_size, 1, row_size + 1, 1 - row_size)
+        ]
+
+        # Bitboards of the players, see Board._check() for the layout
+        self.stride: int = height + 1
+        self.masks = None
+        self.line_shifts: list[list] = []
+        if width * self.stride <= 64:
+            self.masks = np.zeros((n_boards, n_players), dtype=np.uint64)
+            layout: Board = Board(width, height, line_length, quiet=True)
+            self.line_shifts = [
+                [np.uint64(shift) for shift in shifts]
+                for shifts in layout.line_shifts
+            ]
+
+    def reset(self):
+        """Empty all the boards.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.grid[:] = 0
+        if self.masks is not None:
+            self.masks[:] = 0
+        self.heights[:] = 0
+        self.winner[:] = -1
+        self.done[:] = False
+        self.n_moves[:] = 0
+        self.turn = 0
+
+    def set_position(self, board: Board, next_player: int):
+        """Copy the position of a Board into all the boards.
+
+        Args:
+            board: A board of the same size to copy the stones from.
+            next_player: ID of the player to move.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the board size is different.
+            ValueError: If next_player is not one of the players.
+        """
+        if (board.width, board.height) != (self.width, self.height):
+            raise ValueError(
+                "Board should be", self.width, "x", self.height,
+                ", and not", board.width, "x", board.height)
+
+        if not 0 <= next_player < self.n_players:
+            raise ValueError(
+                "Next player should be from 0 to", self.n_players - 1,
+                ", and not", next_player)
+
+        self.reset()
+        for player_id in board.player_ids():
+            stones: int = board.masks[player_id]
+            while stones:
+                stone: int = stones & -stones
+                column, row = divmod(stone.bit_length() - 1, board.stride)
+                self.cells[:, row, column] = player_id + 1
+                stones ^= stone
+
+            if self.masks is not None:
+                self.masks[:, player_id] = board.masks[player_id]
+
+        self.heights[:] = board.columns_height
+        self.n_moves[:] = len(board.player_moves)
+        self.winner[:] = board.winner
+        self.done[:] = board.is_solved()
+        self.turn = next_player
+
+    def legal_moves(self):
+        """Columns that are not full.
+
+        Args:
+            None
+
+        Returns:
+            bool array (n_boards, width), True for columns to play.
+
+        Raises:
+            None
+        """
+        return self.heights < self.height
+
+    def random_columns(self):
+        """Pick a random legal column on every board still in play.
+
+        Args:
+            None
+
+        Returns:
+            int array (n_boards,), -1 where the board is done.
+
+        Raises:
+            None
+        """
+        boards = np.flatnonzero(~self.done)
+        columns = np.full(self.n_boards, -1, dtype=np.int64)
+
+        # Draw any column and draw again where it is full, boards in play
+        # always have a legal column so this quickly runs out
+        while len(boards):
+            picked = self.rng.integers(0, self.width, len(boards))
+            columns[boards] = picked
+            boards = boards[self.height <= self.heights[boards, picked]]
+
+        return columns
+
+    def _lines(self, boards, rows, columns, player_id: int):
+        """Find boards where the new stones form a line.
+
+        Args:
+            boards: int array of indices of the boards to test.
+            rows: int array of rows of the new stones.
+            columns: int array of columns of the new stones.
+            player_id: ID of the player who placed the stones.
+
+        Returns:
+            bool array of the same length as boards.
+
+        Raises:
+            None
+        """
+        if self.masks is not None:
+            stones = self.masks[boards, player_id]
+            won = np.zeros(len(boards), dtype=bool)
+            for shifts in self.line_shifts:
+                line = stones
+                for shift in shifts:
+                    line = line & (line >> shift)
+                won |= line != 0
+            return won
+
+        length: int = self.line_length
+        stone = (boards * self.board_size
+                 + (rows + self.pad) * self.row_size
+                 + (columns + self.pad))[:, None]
+
+        won = np.zeros(len(boards), dtype=bool)
+        for offsets in self.line_offsets:
+            own = self.flat.take(stone + offsets) == player_id + 1
+
+            # Sum of every window of line_length cells along the line
+            sums = np.cumsum(own, axis=1, dtype=np.int16)
+            windows = sums[:, length - 1:]
+            windows[:, 1:] -= sums[:, :-length]
+            won |= (windows == length).any(axis=1)
+
+        return won
+
+    def step(self, columns):
+        """Put a stone of the player to move on every board in play.
+
+        Boards that are already done are skipped, their columns ignored.
+
+        Args:
+            columns: int array (n_boards,) of columns to play.
+
+        Returns:
+            bool array (n_boards,), True where this move won the game.
+
+        Raises:
+            ValueError: If a column is out of range or full
+                        on a board still in play.
+        """
+        columns = np.asarray(columns)
+        boards = np.flatnonzero(~self.done)
+        columns = columns[boards]
+
+        if ((columns < 0) | (self.width <= columns)).any():
+            raise ValueError(
+                "Columns should be from 0 to", self.width - 1)
+
+        rows = self.heights[boards, columns].astype(np.int64)
+        if (self.height <= rows).any():
+            raise ValueError("Cannot play a full column")
+
+        player_id: int = self.turn
+        self.cells[boards, rows, columns] = player_id + 1
+        if self.masks is not None:
+            self.masks[boards, player_id] |= np.left_shift(
+                np.uint64(1), (columns * self.stride + rows).astype(np.uint64))
+        self.heights[boards, columns] += 1
+        self.n_moves[boards] += 1
+        self.turn = (self.turn + 1) % self.n_players
+
+        won = np.zeros(self.n_boards, dtype=bool)
+        won[boards] = self._lines(boards, rows, columns, player_id)
+
+        self.winner[won] = player_id
+        self.done |= won
+        self.done |= self.n_moves == self.width * self.height
+        return won
+
+    def playout(self) -> dict:
+        """Play all the boards to the end at random.
+
+        Players pick uniformly among the columns that are not full,
+        starting from the current position of every board.
+
+        Args:
+            None
+
+        Returns:
+            dict: {"games": number of boards,
+                   "wins": list of wins of every player ID,
+                   "draws": number of boards nobody won,
+                   "mean_length": average number of stones}
+
+        Raises:
+            None
+        """
+        while not self.done.all():
+            self.step(self.random_columns())
+
+        wins = np.bincount(self.winner[self.winner >= 0],
+                           minlength=self.n_players)
+        return {
+            "games": self.n_boards,
+            "wins": wins.tolist(),
+            "draws": int((self.winner < 0).sum()),
+            "mean_length": float(self.n_moves.mean()),
+        }
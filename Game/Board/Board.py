@@ -1,5 +1,11 @@
-from random import choice, randint
-from warnings import warn
+from typing import Optional
+
+from random import Random
+from time import perf_counter
+
+from ..Metrics.MetricsRegistry import MetricsRegistry
+from ..Output.Output import Output
+from ..Output.OutputConsole import OutputConsole
 
 
 class Board:
@@ -18,11 +24,27 @@ class Board:
                          a positive integer greater than zero.
     """
 
-    def __init__(self, width: int, height: int, line_length: int):
+    # States of the game reported by get_outcome()
+    OUTCOME_PLAYING: str = "playing"
+    OUTCOME_WIN: str = "win"
+    OUTCOME_DRAW: str = "draw"  # the board is full
+    OUTCOME_BLOCKED: str = "blocked"  # nobody can complete a line anymore
+
+    # Zobrist numbers shared by all the boards of the same size,
+    # {(width, height): [numbers of player 0, numbers of player 1, ...]}
+    ZOBRIST_CACHE: dict[tuple[int, int], list[Optional[list[int]]]] = {}
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 quiet: bool = False,
+                 output: Optional[Output] = None):
         """Prepares the list of SYMBOLS(colors) that could be used for players.
 
-        By default there could be up to 42 players. Initializes the board
-        matrix, column height counter and other internal variables.
+        By default there could be up to 42 players. Initializes the
+        bitboards of the players, column height counter and other
+        internal variables.
 
         Args:
             width: width of the gaming board, expected to be positive
@@ -31,6 +53,8 @@ class Board:
                    integer greater than zero.
             line_length: line_length of the gaming board, expected to be
                          a positive integer greater than zero.
+            quiet: when True nothing is printed out to the console.
+            output: where the messages go, OutputConsole by default.
 
         Returns:
             None
@@ -49,14 +73,20 @@ class Board:
             chr(self.SYMBOLS_START + i) for i in range(0, self.N_SYMBOLS)
         ]
 
-        print("\n\nBoard says:\nI have", self.N_SYMBOLS,
-              "stones:", self.SYMBOLS)
+        self.quiet: bool = quiet
+        self.output: Output = OutputConsole() if output is None else output
+        self.metrics: Optional[MetricsRegistry] = None
+        if not self.quiet:
+            self.output.message("\n\nBoard says:\nI have", self.N_SYMBOLS,
+                                "stones:", self.SYMBOLS)
 
         self.i_symbol: int = 0
         self.EMPTY_SYMBOL: str = ' '
         self.solved: bool = False
         self.empty_cells_left: int = width*height
         self.player_moves: list[int] = []  # this would keep moves - their IDs
+        self.column_moves: list[int] = []  # and columns of these moves
+        self.solved_at: int = -1  # number of moves when board got solved
 
         # Let's dive into initializaton...
         if 0 < width:
@@ -83,16 +113,133 @@ class Board:
             raise ValueError(
                 "Line length should be greater than zero and not", line_length)
 
-        # Create a matrix for storing state of the game
-        self.board: list[list[str]] = [
-            [
-                self.EMPTY_SYMBOL for i in range(0, self.width)
-            ] for j in range(0, self.height)
+        # The state of the game is kept as bitboards, one int per player,
+        # see _check() for the layout. Each column takes height+1 bits,
+        # the topmost bit of a column is a separator and is never set
+        self.stride: int = self.height + 1
+
+        # Stones of every player and all the stones on the board
+        self.masks: list[int] = [0 for i in range(0, self.N_SYMBOLS)]
+        self.mask: int = 0
+
+        # Lowest cell of every column and all the cells of the board
+        self.bottom_mask: int = 0
+        for j in range(0, self.width):
+            self.bottom_mask |= 1 << (j * self.stride)
+        self.board_mask: int = self.bottom_mask * ((1 << self.height) - 1)
+
+        # Shifts to AND a bitboard with to find a line of line_length,
+        # for vertical, horizontal, and two diagonal directions
+        self.line_shifts: list[list[int]] = []
+        for direction in (1, self.stride, self.stride - 1, self.stride + 1):
+            shifts: list[int] = []
+            covered: int = 1
+            while covered < self.line_length:
+                step: int = min(covered, self.line_length - covered)
+                shifts.append(step * direction)
+                covered += step
+            self.line_shifts.append(shifts)
+
+        # ID of the player whose stone was placed last, and the winner
+        self.last_player: int = -1
+        self.winner: int = -1
+
+        # Zobrist key of the position, XOR of a random number
+        # for every (player, cell) that holds a stone
+        self.key: int = 0
+        self.zobrist: list[Optional[list[int]]] = [
+            None for i in range(0, self.N_SYMBOLS)
+        ]
+
+        # A stone in a column moves by mirror_shift[column] bits
+        # in the position mirrored across the vertical axis
+        self.mirror_shift: list[int] = [
+            (self.width - 1 - 2 * j) * self.stride
+            for j in range(0, self.width)
         ]
 
         # Create indexing for the columns
         self.columns_height: list[int] = [0 for i in range(0, self.width)]
 
+        # Columns that are not full, in no particular order, and the
+        # position of every column in that list, -1 for the full ones.
+        # A full column is swapped with the last one and popped, so the
+        # list is kept in O(1) per move and sampled in O(1)
+        self.open_columns: list[int] = list(range(0, self.width))
+        self.open_index: list[int] = list(range(0, self.width))
+
+    @property
+    def board(self) -> list[list[str]]:
+        """Matrix of stone symbols, the way it is printed out.
+
+        Rows go from the top of the board to the bottom, EMPTY_SYMBOL
+        marks the cells without a stone.
+
+        Args:
+            None
+
+        Returns:
+            list[list[str]]: height rows of width symbols
+
+        Raises:
+            None
+        """
+        grid: list[list[str]] = [
+            [
+                self.EMPTY_SYMBOL for j in range(0, self.width)
+            ] for i in range(0, self.height)
+        ]
+
+        for player_id in self.player_ids():
+            symbol: str = self.SYMBOLS[player_id]
+            stones: int = self.masks[player_id]
+            while stones:
+                stone: int = stones & -stones
+                j, row = divmod(stone.bit_length() - 1, self.stride)
+                grid[self.height - 1 - row][j] = symbol
+                stones ^= stone
+
+        return grid
+
+    def get_cell(self, i: int, j: int) -> str:
+        """Get the symbol of a stone in a given cell.
+
+        Args:
+            i: vertical index of the cell, 0 is the top row.
+            j: horizontal index of the cell, 0 is the leftmost column.
+
+        Returns:
+            str: stone symbol or EMPTY_SYMBOL
+
+        Raises:
+            None
+        """
+        bit: int = 1 << (j * self.stride + self.height - 1 - i)
+        if not self.mask & bit:
+            return self.EMPTY_SYMBOL
+
+        for player_id in range(0, self.N_SYMBOLS):
+            if self.masks[player_id] & bit:
+                return self.SYMBOLS[player_id]
+
+        return self.EMPTY_SYMBOL
+
+    def player_ids(self) -> list[int]:
+        """Get IDs of the players who have stones on the board.
+
+        Args:
+            None
+
+        Returns:
+            list[int]: player IDs in ascending order
+
+        Raises:
+            None
+        """
+        return [
+            i for i in range(0, self.N_SYMBOLS) if self.masks[i]
+        ]
+
     def __str__(self) -> str:
         """Serialize the board matrix.
 
@@ -107,27 +254,25 @@ class Board:
             None
         """
 
-        text: str = "\n\n"
+        lines: list[str] = ["", ""]
 
         # DEC column indices do not fit when there are more than 10 columns
         # HEX when there amore than 16...
         # But I see no clear reason of making the field printout wider
+        header: str = ""
         if self.width <= 16:
-            text += " "
-            for i in range(0, self.width):
-                text += "{:01x}".format(i) + " "
+            header = " " + "".join(
+                "{:01x}".format(i) + " " for i in range(0, self.width))
+        lines.append(header)
+        lines.append("")
 
-        text += "\n\n"
         for row in self.board:
-            text += "|"
-            for cell in row:
-                text += cell+"|"
-
-            text += "\n"
+            lines.append("|" + "|".join(row) + "|")
 
-        text += "\n"
+        lines.append("")
+        lines.append("")
 
-        return text
+        return "\n".join(lines)
 
     def next_unused_stone(self) -> int:
         """Get the index of the next unused stone.
@@ -171,266 +316,186 @@ class Board:
 
         return self.SYMBOLS[i_symbol]
 
-    def get_width(self) -> int:
-        """Get the board width.
+    def get_zobrist(self, player_id: int) -> list[int]:
+        """Get random numbers hashing the stones of a player.
+
+        Numbers are indexed by the bit of a cell, see _check(), and
+        depend only on the board size and player ID, so keys are the same
+        in every process and for every Board of this size.
+
+        Args:
+            player_id: player ID, or index of the stone
+
+        Returns:
+            list[int]: 64-bit random number for every bit of a bitboard
+
+        Raises:
+            None
+        """
+        numbers: Optional[list[int]] = self.zobrist[player_id]
+        if numbers is None:
+            size: tuple[int, int] = (self.width, self.height)
+            cache: list[Optional[list[int]]] = \
+                Board.ZOBRIST_CACHE.setdefault(
+                    size, [None for i in range(0, self.N_SYMBOLS)])
+
+            numbers = cache[player_id]
+            if numbers is None:
+                generator: Random = Random(
+                    "zobrist {}x{} {}".format(
+                        self.width, self.height, player_id))
+                numbers = [
+                    generator.getrandbits(64)
+                    for i in range(0, self.width * self.stride)
+                ]
+                cache[player_id] = numbers
+
+            self.zobrist[player_id] = numbers
+
+        return numbers
+
+    def get_key(self) -> int:
+        """Get the Zobrist key of the position.
+
+        The key is updated with every stone placed and identifies which
+        player has a stone in which cell. The player to move is not a part
+        of the key, as it is not defined by the stones alone.
 
         Args:
             None
 
         Returns:
-            int: width of the board.
+            int: 64-bit key of the position
 
         Raises:
             None
         """
-        return self.width
+        return self.key
 
-    def _limit_top(self,
-                   i_stone: int,
-                   j_stone: int,
-                   i_cell: int,
-                   j_cell: int) -> bool:
-        """Test if i_cell is within the board and
-           within the distance of line_length UP from i_stone.
+    def get_mirror_key(self) -> int:
+        """Get the Zobrist key of the position mirrored left to right.
+
+        Computed from the stones when asked for, and not kept up to date
+        with every stone like get_key(), as few players ever ask for it
+        and a search keeps its own, see Negamax.
 
         Args:
-            i_stone: vertical position of the stone
-            j_stone: horizontal position of the stone
-            i_cell: vertical index if cell to test
-            j_cell: horizontal index if cell to test
+            None
 
         Returns:
-            bool: True when di within the allowed range.
+            int: 64-bit key of the mirrored position, the same as
+                 get_key() of a board with the mirrored stones.
 
         Raises:
             None
         """
-        return (i_cell < 0) or (i_cell < i_stone - self.line_length)
-
-    def _limit_bottom(self,
-                      i_stone: int,
-                      j_stone: int,
-                      i_cell: int,
-                      j_cell: int) -> bool:
-        """Test if i_cell is within the board and
-           within the distance of line_length DOWN from i_stone.
+        mirror_key: int = 0
+        stride: int = self.stride
+        mirror_shift: list[int] = self.mirror_shift
+        for i_symbol in range(0, self.N_SYMBOLS):
+            stones: int = self.masks[i_symbol]
+            if not stones:
+                continue
+            numbers: list[int] = self.get_zobrist(i_symbol)
+            while stones:
+                stone: int = stones & -stones
+                index: int = stone.bit_length() - 1
+                mirror_key ^= numbers[index + mirror_shift[index // stride]]
+                stones ^= stone
+        return mirror_key
+
+    def get_canonical_key(self) -> tuple[int, bool]:
+        """Get the key shared by the position and its mirror image.
+
+        The smaller of the key and the mirror key, so a position and
+        its mirror image are a single entry of a cache or a book. Moves
+        kept with the canonical key are in its orientation, map them
+        back with mirror_column() when the key is mirrored.
 
         Args:
-            i_stone: vertical position of the stone
-            j_stone: horizontal position of the stone
-            i_cell: vertical index if cell to test
-            j_cell: horizontal index if cell to test
+            None
 
         Returns:
-            bool: True when di within the allowed range.
+            tuple[int, bool]: the canonical key, and True when it is
+                              the key of the mirrored position.
 
         Raises:
             None
         """
-        return (self.height <= i_cell) or (i_stone+self.line_length < i_cell)
+        mirror_key: int = self.get_mirror_key()
+        if mirror_key < self.key:
+            return mirror_key, True
+        return self.key, False
 
-    def _limit_left(self,
-                    i_stone: int,
-                    j_stone: int,
-                    i_cell: int,
-                    j_cell: int) -> bool:
-        """Test if j_cell is within the board and
-           within the distance of line_length LEFTWARD from j_stone.
+    def mirror_column(self, column: int) -> int:
+        """Get the column on the other side of the vertical axis.
 
         Args:
-            i_stone: vertical position of the stone
-            j_stone: horizontal position of the stone
-            i_cell: vertical index if cell to test
-            j_cell: horizontal index if cell to test
+            column: int index of a column.
 
         Returns:
-            bool: True when j_cell within the allowed range.
+            int: index of the mirrored column.
 
         Raises:
             None
         """
-        return (j_cell < 0) or (j_cell < j_stone - self.line_length)
+        return self.width - 1 - column
 
-    def _limit_right(self,
-                     i_stone: int,
-                     j_stone: int,
-                     i_cell: int,
-                     j_cell: int) -> bool:
-        """Test if j_cell is within the board and
-           within the distance of line_length RIGHTWARD from j_stone.
+    def get_width(self) -> int:
+        """Get the board width.
 
         Args:
-            i_stone: vertical position of the stone
-            j_stone: horizontal position of the stone
-            i_cell: vertical index if cell to test
-            j_cell: horizontal index if cell to test
+            None
 
         Returns:
-            bool: True when j_cell within the allowed range.
+            int: width of the board.
 
         Raises:
             None
         """
-        return (self.width <= j_cell) or (j_stone + self.line_length < j_cell)
+        return self.width
 
     def _check(self, column: int) -> bool:
-        """Check if player can place a stone in a given column
-           and if it result in winning the game.
+        """Check if the last stone placed in a given column
+           resulted in winning the game, and if the game can go on.
 
-           In particular, given index of column where to place the stone
-           first see if column is not full and place the stone if not,
-           and then starting from position [i][j] of where the sone ended up
-           count similar stones verticaly, then horizontaly, on main
-           and secondary diagonals, going not further than the line_length.
+           Every player owns a bitboard - a Python int where bit
+           column*(height+1) + row is set when the player has a stone
+           at this cell, row 0 being the bottom one. The extra bit on
+           top of every column is always zero, so shifting a bitboard by
+           1, height, height+1 or height+2 moves every stone one cell
+           along a vertical, diagonal, horizontal or anti-diagonal
+           line without wrapping around to the next column.
 
-           Also not checking any stones right above the current stone,
-           as there is no possibility for any other stones to be - current
-           stone always the topmost.
+           AND-ing the bitboard with its shifted copies leaves a bit set
+           only where a continuous line starts, and doubling the shift
+           every step needs log2(line_length) operations per direction.
 
         Args:
-            column: index of a column where to put the stone.
+            column: index of a column where the last stone was placed.
 
         Returns:
-            True if stone is successfully placed.
+            True if the game could be continued after this move.
 
         Raises:
             None
         """
+        stones: int = self.masks[self.last_player]
+
+        for shifts in self.line_shifts:
+            line: int = stones
+            for shift in shifts:
+                line &= line >> shift
+                if not line:
+                    break
+            else:
+                if not self.solved:
+                    self.solved = True
+                    self.winner = self.last_player
+                    self.solved_at = len(self.player_moves)
+                return True
 
-        # print(self.empty_cells_left)
-        if self.empty_cells_left == 0:
-            return False
-
-        # I do not know if there is any efficient way to test the board,
-        # maybe it is not that bad to spawn recursion from the last move
-        # in order not to re-compute entire board all over again..
-        # but still - multiple cells would be evalated multiple times.
-
-        # Get the last move location and symbol
-        i: int = self.height - self.columns_height[column]
-        j: int = column
-        symbol: str = self.board[i][j]
-
-        '''
-        # this may help other player to pay attention, which is not ideal...
-        print("Last Move:", i, j, symbol)
-        '''
-
-        # We will test vertical, horizontal and
-        # two diagonals passing throught the
-        # cell of the last move for existense
-        # of a continuous line of at least self.line_length
-
-        # -- Check cells Up and Down from current if there is a continuous line
-        # in the range i={-L, -L+1, .., 0, .., L-1, L} where L=line_length
-
-        # Actually, situation when there are values
-        # in the column above the last move is not possible,
-        # so I leave it here for my reference
-        '''
-        score_up = -1 # not 0 because current cell will be counted
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_top(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_up += 1
-            i_cell -= 1
-        '''
-        score_up: int = 0
-
-        score_down: int = -1
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_bottom(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_down += 1
-            i_cell += 1
-
-        score_vertical: int = score_up + score_down + 1
-
-        # -- Now let's do the same horizontaly
-        score_left = -1  # not 0 because current cell will be counted
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_left(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_left += 1
-            j_cell -= 1
-
-        score_right: int = -1
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_right(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_right += 1
-            j_cell += 1
-
-        score_horizontal: int = score_left + score_right + 1
-
-        # -- Main diagonal, from top left to bottom right
-        score_top_left = -1  # not 0 because current cell will be counted
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_top(i, j, i_cell, j_cell)) and
-               (not self._limit_left(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_top_left += 1
-            i_cell -= 1
-            j_cell -= 1
-
-        score_bottom_right: int = -1
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_bottom(i, j, i_cell, j_cell)) and
-               (not self._limit_right(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_bottom_right += 1
-            i_cell += 1
-            j_cell += 1
-
-        score_diagonal_main: int = score_top_left + score_bottom_right + 1
-
-        # -- Secondary diagonal, from top right to botom left
-        score_top_right: int = -1  # not 0 because current cell will be counted
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_top(i, j, i_cell, j_cell)) and
-               (not self._limit_right(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_top_right += 1
-            i_cell -= 1
-            j_cell += 1
-
-        score_bottom_left: int = -1
-        i_cell = i
-        j_cell = j
-        while ((not self._limit_bottom(i, j, i_cell, j_cell)) and
-               (not self._limit_left(i, j, i_cell, j_cell)) and
-               (symbol in self.board[i_cell][j_cell])):
-            score_bottom_left += 1
-            i_cell += 1
-            j_cell -= 1
-
-        score_diagonal_secondary: int = score_top_right + score_bottom_left + 1
-
-        scores: dict = {
-            "Vertical": score_vertical,
-            "Horizontal": score_horizontal,
-            "Diagonal Main": score_diagonal_main,
-            "Diagonal Secondary": score_diagonal_secondary
-        }
-
-        '''
-        # this may help other player to pay attention, which is not ideal...
-        print("Last move score", scores)
-        '''
-
-        # See if board is solved
-        for score in scores.values():
-            if self.line_length <= score:
-                self.solved = True
-
-        return True
+        return 0 < self.empty_cells_left
 
     def is_solved(self) -> bool:
         """Get the state of the board.
@@ -446,6 +511,32 @@ class Board:
         """
         return self.solved
 
+    def get_outcome(self) -> str:
+        """Get the state of the game.
+
+        A game ends either when a player completes a line, when the board
+        is full, or - on boards tracking which lines could still be
+        completed, like LineBoard - as soon as nobody can complete a line
+        while there are still empty cells.
+
+        Args:
+            None
+
+        Returns:
+            str: OUTCOME_PLAYING, OUTCOME_WIN, OUTCOME_DRAW
+                 or OUTCOME_BLOCKED.
+
+        Raises:
+            None
+        """
+        if not self.solved:
+            return self.OUTCOME_PLAYING
+        if 0 <= self.winner:
+            return self.OUTCOME_WIN
+        if 0 < self.empty_cells_left:
+            return self.OUTCOME_BLOCKED
+        return self.OUTCOME_DRAW
+
     def get_player_moves(self) -> list[int]:
         """Get the list of player IDs on order of moves.
 
@@ -460,6 +551,35 @@ class Board:
         """
         return self.player_moves
 
+    def reset(self):
+        """Take all the stones off the board to play it again.
+
+        Player IDs given by next_unused_stone() stay valid, so the same
+        Board and players could be reused for many games.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.solved = False
+        self.winner = -1
+        self.solved_at = -1
+        self.last_player = -1
+        self.empty_cells_left = self.width * self.height
+        self.player_moves.clear()
+        self.column_moves.clear()
+        self.masks[:] = [0 for i in range(0, self.N_SYMBOLS)]
+        self.mask = 0
+        self.key = 0
+        self.columns_height[:] = [0 for i in range(0, self.width)]
+        self.open_columns[:] = range(0, self.width)
+        self.open_index[:] = range(0, self.width)
+
     def _put(self, column: int, i_symbol: int) -> bool:
         """Place a stone on a board.
 
@@ -474,18 +594,95 @@ class Board:
             None
         """
         if self.columns_height[column] == self.height:
-            print("Column", column, "is full, better luck next time!")
+            if not self.quiet:
+                self.output.message(
+                    "Column", column, "is full, better luck next time!")
             return False
         else:
-            i_stone = self.height - self.columns_height[column] - 1
-            self.board[i_stone][column] = self.SYMBOLS[i_symbol]
+            index: int = column * self.stride + self.columns_height[column]
+            stone: int = 1 << index
+            self.masks[i_symbol] |= stone
+            self.mask |= stone
+            numbers: Optional[list[int]] = self.zobrist[i_symbol]
+            if numbers is None:
+                numbers = self.get_zobrist(i_symbol)
+            self.key ^= numbers[index]
+            self.last_player = i_symbol
             self.columns_height[column] += 1
             self.empty_cells_left -= 1
+            if self.columns_height[column] == self.height:
+                self._close_column(column)
             return True
 
+    def _close_column(self, column: int):
+        """Take a column that became full out of the open columns.
+
+        Args:
+            column: int index of the full column.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        position: int = self.open_index[column]
+        last: int = self.open_columns.pop()
+        if last != column:
+            self.open_columns[position] = last
+            self.open_index[last] = position
+        self.open_index[column] = -1
+
+    def is_open(self, column: int) -> bool:
+        """Check if a stone could be placed into a column.
+
+        Args:
+            column: int index of the column.
+
+        Returns:
+            bool: True when the column is on the board and not full.
+
+        Raises:
+            None
+        """
+        return 0 <= column < self.width and 0 <= self.open_index[column]
+
+    def random_open_column(self, generator: Random) -> int:
+        """Pick a column that is not full, uniformly at random in O(1).
+
+        Args:
+            generator: random generator, like random.Random(seed),
+                       or the random module itself.
+
+        Returns:
+            int: index of the column.
+
+        Raises:
+            ValueError: If all the columns are full.
+        """
+        if not self.open_columns:
+            raise ValueError("All the columns are full, no legal moves")
+        return self.open_columns[generator.randrange(len(self.open_columns))]
+
+    def set_metrics(self, metrics: Optional[MetricsRegistry]):
+        """Measure apply() in the registry, or stop measuring with None.
+
+        Args:
+            metrics: registry of the game, or None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.metrics = metrics
+
     def apply(self, column: int, player_id: int, player_name: str) -> bool:
         """Apply the proposed player's move to the board.
 
+        Measured when the board has metrics, see set_metrics().
+
         Args:
             column: int index of column where to put the stone.
             player_id: int index of stone(color) symbol to use.
@@ -499,15 +696,44 @@ class Board:
             ValueError: If player ID negative or greater than the number
                         of available stones.
         """
+        if self.metrics is None:
+            return self._apply(column, player_id, player_name)
+
+        n_moves: int = len(self.player_moves)
+        start: float = perf_counter()
+        try:
+            return self._apply(column, player_id, player_name)
+        finally:
+            self.metrics.observe("board_apply_seconds",
+                                 perf_counter() - start)
+            if n_moves < len(self.player_moves):
+                self.metrics.count("moves_total", player=player_name)
+
+    def _apply(self, column: int, player_id: int, player_name: str) -> bool:
+        """Apply the proposed player's move to the board, not measured.
 
-        if column < 0 or self.width <= column:
+        Args:
+            column: int index of column where to put the stone.
+            player_id: int index of stone(color) symbol to use.
+            player_name: string to display user name if them won.
+
+        Returns:
+            True when move performed
+
+        Raises:
+            ValueError: If column is not in range from 0 to board.width-1.
+            ValueError: If player ID negative or greater than the number
+                        of available stones.
+        """
+
+        if not 0 <= column < self.width:
             raise ValueError(
                 "Column index has to be from 0 to Board.width-1" +
                 " which is", self.width-1,
                 ", and not", column
             )
 
-        if player_id < 0 or self.N_SYMBOLS <= player_id:
+        if not 0 <= player_id < self.N_SYMBOLS:
             raise ValueError(
                 "Player ID, an index, sould be positive integer" +
                 "from 0 to board.n_SYMBOLS-1 (max number of players1-1)" +
@@ -520,18 +746,269 @@ class Board:
             return False
         else:
             self.player_moves.append(player_id)
+            self.column_moves.append(column)
+            if not self.quiet:
+                self.output.place(self, column,
+                                  self.columns_height[column] - 1, player_id)
 
         is_playable = self._check(column)
 
         if self.is_solved():
-            print(player_name + " Won!")
+            if not self.quiet:
+                self.output.message(player_name + " Won!")
         else:
             if not is_playable:
                 self.solved = True
-                print("\n\nDraw :CСС\n\n")
+                self.solved_at = len(self.player_moves)
+                if not self.quiet:
+                    self.output.message("\n\nDraw :CСС\n\n")
                 return False
             else:
                 # keep playing
                 pass
 
         return True
+
+    def _unput(self, column: int, i_symbol: int):
+        """Remove the topmost stone from a column.
+
+        Args:
+            column: int index of column where to take the stone from.
+            i_sumbol: int index of stone(color) symbol of the stone.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.columns_height[column] == self.height:
+            self.open_index[column] = len(self.open_columns)
+            self.open_columns.append(column)
+        self.columns_height[column] -= 1
+        self.empty_cells_left += 1
+        index: int = column * self.stride + self.columns_height[column]
+        stone: int = 1 << index
+        self.masks[i_symbol] ^= stone
+        self.mask ^= stone
+        # The stone was placed by _put(), its numbers are there
+        self.key ^= self.zobrist[i_symbol][index]
+
+    def unapply(self, column: int):
+        """Take back the last move, which has to be made in a given column.
+
+        Restores the board exactly as it was before the move, including
+        the solved flag, the winner and the Zobrist key, so a search can
+        apply() and unapply() moves in place instead of copying the board.
+
+        Args:
+            column: int index of column of the last move.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no moves to take back.
+            ValueError: If the last move was not made in this column.
+        """
+        if not self.column_moves:
+            raise ValueError("There are no moves to take back")
+
+        if self.column_moves[-1] != column:
+            raise ValueError(
+                "The last move was made in column", self.column_moves[-1],
+                ", and not", column)
+
+        self.column_moves.pop()
+        self._unput(column, self.player_moves.pop())
+
+        if len(self.player_moves) < self.solved_at:
+            self.solved = False
+            self.winner = -1
+            self.solved_at = -1
+
+        if self.player_moves:
+            self.last_player = self.player_moves[-1]
+        else:
+            self.last_player = -1
+
+    def undo(self) -> int:
+        """Take back the last move.
+
+        Args:
+            None
+
+        Returns:
+            int: index of the column the stone was taken from.
+
+        Raises:
+            ValueError: If there are no moves to take back.
+        """
+        if not self.column_moves:
+            raise ValueError("There are no moves to take back")
+
+        column: int = self.column_moves[-1]
+        self.unapply(column)
+        return column
+
+    def has_line(self, stones: int) -> bool:
+        """Test if there is a line of line_length among the stones.
+
+        Args:
+            stones: bitboard of a single player, like Board.masks[i].
+
+        Returns:
+            bool: True when a line is found.
+
+        Raises:
+            None
+        """
+        if not stones:
+            return False
+
+        for shifts in self.line_shifts:
+            line: int = stones
+            for shift in shifts:
+                line &= line >> shift
+                if not line:
+                    break
+            else:
+                return True
+        return False
+
+    def replay(self,
+               columns: list[int],
+               seats: Optional[list[int]] = None,
+               verify: bool = True):
+        """Put the stones of a whole game on the board at once.
+
+        Whatever is on the board is taken off first. Stones, heights of
+        the columns and the key are written directly, without looking
+        for a line after every move and without printing anything, so
+        loading a recorded game costs a few integer operations per move.
+        The moves are kept in player_moves and column_moves, and could
+        be taken back by undo() as usual.
+
+        The outcome is found once for the final position by verify(),
+        or later on request when verify is False - until then the board
+        is not solved, whatever the moves are.
+
+        Args:
+            columns: column of every move.
+            seats: ID of the player of every move, by default
+                   the players move in order of their IDs.
+            verify: find the outcome right away.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are not as many seats as columns.
+            ValueError: If a column or a player ID is out of range,
+                        or a column is full, the board is left empty.
+            ValueError: If verify finds the game went on after a win.
+        """
+        if seats is None:
+            n_players: int = max(2, self.i_symbol)
+            seats = [i % n_players for i in range(0, len(columns))]
+        elif len(seats) != len(columns):
+            raise ValueError(
+                "Every move needs a column and a seat, but there are",
+                len(columns), "columns and", len(seats), "seats")
+
+        self.reset()
+
+        # Check the ranges once for all the moves
+        if columns and not (0 <= min(columns) and max(columns) < self.width):
+            raise ValueError(
+                "Column index has to be from 0 to", self.width - 1,
+                ", and not", min(columns), max(columns))
+        if seats and not (0 <= min(seats) and max(seats) < self.N_SYMBOLS):
+            raise ValueError(
+                "Player ID should be from 0 to", self.N_SYMBOLS - 1,
+                ", and not", min(seats), max(seats))
+
+        used: set[int] = set(seats)
+        numbers: list[Optional[list[int]]] = [None] * self.N_SYMBOLS
+        for seat in used:
+            numbers[seat] = self.get_zobrist(seat)
+
+        heights: list[int] = self.columns_height
+        masks: list[int] = self.masks
+        stride: int = self.stride
+        height: int = self.height
+        key: int = 0
+        for column, seat in zip(columns, seats):
+            row: int = heights[column]
+            if row == height:
+                # leave an empty board, and not half of the game
+                self.reset()
+                raise ValueError("Column is full", column)
+            heights[column] = row + 1
+            index: int = column * stride + row
+            masks[seat] |= 1 << index
+            key ^= numbers[seat][index]
+
+        for column in range(0, self.width):
+            if heights[column] == height:
+                self._close_column(column)
+
+        mask: int = 0
+        for seat in used:
+            mask |= masks[seat]
+        self.mask = mask
+        self.key = key
+        self.empty_cells_left = self.width * self.height - len(columns)
+        self.player_moves[:] = seats
+        self.column_moves[:] = columns
+        if columns:
+            self.last_player = seats[-1]
+
+        if verify:
+            self.verify()
+
+    def verify(self):
+        """Find the outcome of a game put on the board by replay().
+
+        Only the final position is looked at: a line of the player who
+        moved last, completed by the last stone, makes it the winner,
+        a full board without lines is a draw.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If another player has a line, or the line
+                        was there before the last move.
+        """
+        self.solved = False
+        self.winner = -1
+        self.solved_at = -1
+        if not self.column_moves:
+            return
+
+        for player_id in set(self.player_moves):
+            if player_id != self.last_player and self.has_line(
+                    self.masks[player_id]):
+                raise ValueError(
+                    "The game went on after a win of player", player_id)
+
+        n_moves: int = len(self.column_moves)
+        stones: int = self.masks[self.last_player]
+        if self.has_line(stones):
+            column: int = self.column_moves[-1]
+            last: int = 1 << (column * self.stride +
+                              self.columns_height[column] - 1)
+            if self.has_line(stones ^ last):
+                raise ValueError(
+                    "The game went on after a win of player",
+                    self.last_player)
+            self.solved = True
+            self.winner = self.last_player
+            self.solved_at = n_moves
+        elif self.empty_cells_left == 0:
+            self.solved = True
+            self.solved_at = n_moves
@@ -0,0 +1,331 @@
+from typing import Optional
+
+from .Board import Board
+from ..Output.Output import Output
+
+
+class LineBoard(Board):
+    """Board that counts stones of every player on every possible line.
+
+    Every line of line_length cells that fits on the board is numbered
+    once per board size, together with the lines passing through each
+    cell, and this index is shared by all the boards of the same size.
+    Placing a stone adds one to the count of its player on each line
+    through the cell, and a line is complete when a count reaches
+    line_length, so finding a win costs as many integer updates as there
+    are lines through the cell, no matter how big the board is.
+
+    A line with stones of two different players cannot be completed by
+    anybody. The board counts lines that are still open, and with
+    early_draw the game ends as soon as there are none left, reported
+    by get_outcome() as OUTCOME_BLOCKED rather than OUTCOME_DRAW.
+
+    Args:
+        width: width of the gaming board.
+        height: height of the gaming board.
+        line_length: length of a winning line.
+        quiet: when True nothing is printed out to the console.
+        early_draw: when True the game ends once no line is open.
+        output: where the messages go, OutputConsole by default.
+
+    Attributes:
+        lines: cells of every line, cells are bit indices as in Board.
+        lines_through: numbers of the lines passing through every cell.
+        counts: stones of every player on every line,
+                None for players without stones yet.
+        owners: number of different players with stones on every line.
+        open_lines: number of lines with stones of at most one player.
+
+    Methods:
+        Inherited from Board
+        get_line_index(width, height, line_length): Lines of a board size.
+    """
+
+    # Lines shared by all the boards of the same size,
+    # {(width, height, line_length): (lines, lines_through)}
+    LINE_INDEX_CACHE: dict[
+        tuple[int, int, int],
+        tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]]
+    ] = {}
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 quiet: bool = False,
+                 early_draw: bool = True,
+                 output: Optional[Output] = None):
+        """Prepare the Board and pick up the lines of its size.
+
+        Args:
+            width: width of the gaming board.
+            height: height of the gaming board.
+            line_length: length of a winning line.
+            quiet: when True nothing is printed out to the console.
+            early_draw: when True the game ends once no line is open.
+            output: where the messages go, OutputConsole by default.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Same as Board.
+        """
+        super().__init__(width, height, line_length,
+                         quiet=quiet, output=output)
+
+        self.lines, self.lines_through = self.get_line_index(
+            self.width, self.height, self.line_length)
+
+        self.counts: list[Optional[list[int]]] = [
+            None for i in range(0, self.N_SYMBOLS)
+        ]
+        self.last_completed: bool = False
+
+        self.early_draw: bool = early_draw
+        self.owners: list[int] = [0] * len(self.lines)
+        self.open_lines: int = len(self.lines)
+
+    @classmethod
+    def get_line_index(cls,
+                       width: int,
+                       height: int,
+                       line_length: int) -> tuple[
+                           tuple[tuple[int, ...], ...],
+                           tuple[tuple[int, ...], ...]]:
+        """Number all the lines of a board size, once per size.
+
+        Args:
+            width: width of the gaming board.
+            height: height of the gaming board.
+            line_length: length of a winning line.
+
+        Returns:
+            tuple: cells of every line, and numbers of the lines through
+                   every cell, cells being bit indices of a Board.
+
+        Raises:
+            None
+        """
+        size: tuple[int, int, int] = (width, height, line_length)
+        if size in cls.LINE_INDEX_CACHE:
+            return cls.LINE_INDEX_CACHE[size]
+
+        stride: int = height + 1
+        lines: list[tuple[int, ...]] = []
+        lines_through: list[list[int]] = [
+            [] for i in range(0, width * stride)
+        ]
+
+        # vertical, horizontal and two diagonal directions
+        for d_column, d_row in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for column in range(0, width):
+                for row in range(0, height):
+                    last_column: int = column + (line_length - 1) * d_column
+                    last_row: int = row + (line_length - 1) * d_row
+                    if not (last_column < width and 0 <= last_row < height):
+                        continue
+
+                    cells: tuple[int, ...] = tuple(
+                        (column + k * d_column) * stride + row + k * d_row
+                        for k in range(0, line_length)
+                    )
+                    for cell in cells:
+                        lines_through[cell].append(len(lines))
+                    lines.append(cells)
+
+        index = (
+            tuple(lines),
+            tuple(tuple(through) for through in lines_through)
+        )
+        cls.LINE_INDEX_CACHE[size] = index
+        return index
+
+    def get_counts(self, player_id: int) -> list[int]:
+        """Get the number of stones of a player on every line.
+
+        Args:
+            player_id: player ID, or index of the stone
+
+        Returns:
+            list[int]: count for every line number.
+
+        Raises:
+            None
+        """
+        counts: Optional[list[int]] = self.counts[player_id]
+        if counts is None:
+            counts = [0] * len(self.lines)
+            self.counts[player_id] = counts
+        return counts
+
+    def _put(self, column: int, i_symbol: int) -> bool:
+        """Place a stone on a board and count it on its lines.
+
+        Args:
+            column: int index of column where to put the stone.
+            i_sumbol: int index of stone(color) symbol to place.
+
+        Returns:
+            True when stone is placed, false if column if full.
+
+        Raises:
+            None
+        """
+        if not super()._put(column, i_symbol):
+            return False
+
+        counts: Optional[list[int]] = self.counts[i_symbol]
+        if counts is None:
+            counts = self.get_counts(i_symbol)
+
+        completed: bool = False
+        length: int = self.line_length
+        owners: list[int] = self.owners
+        for line in self.lines_through[
+                column * self.stride + self.columns_height[column] - 1]:
+            count: int = counts[line] + 1
+            counts[line] = count
+            if count == 1:
+                # the first stone of this player on the line
+                owners[line] += 1
+                if owners[line] == 2:
+                    self.open_lines -= 1
+            if count == length:
+                completed = True
+
+        self.last_completed = completed
+        return True
+
+    def _unput(self, column: int, i_symbol: int):
+        """Remove the topmost stone from a column and from its lines.
+
+        Args:
+            column: int index of column where to take the stone from.
+            i_sumbol: int index of stone(color) symbol of the stone.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super()._unput(column, i_symbol)
+
+        counts: list[int] = self.get_counts(i_symbol)
+        owners: list[int] = self.owners
+        for line in self.lines_through[
+                column * self.stride + self.columns_height[column]]:
+            counts[line] -= 1
+            if counts[line] == 0:
+                owners[line] -= 1
+                if owners[line] == 1:
+                    self.open_lines += 1
+
+        self.last_completed = False
+
+    def _check(self, column: int) -> bool:
+        """Check if the last stone completed a line, counted in _put().
+
+        Args:
+            column: index of a column where the last stone was placed.
+
+        Returns:
+            True if the game could be continued after this move,
+            False when the board is full or, with early_draw,
+            when no line could be completed anymore.
+
+        Raises:
+            None
+        """
+        if self.last_completed:
+            if not self.solved:
+                self.solved = True
+                self.winner = self.last_player
+                self.solved_at = len(self.player_moves)
+            return True
+
+        if self.early_draw and self.open_lines == 0:
+            return False
+
+        return 0 < self.empty_cells_left
+
+    def reset(self):
+        """Take all the stones off the board and zero the line counts.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().reset()
+        self.counts[:] = [None for i in range(0, self.N_SYMBOLS)]
+        self.last_completed = False
+        self.owners[:] = [0] * len(self.lines)
+        self.open_lines = len(self.lines)
+
+    def replay(self,
+               columns: list[int],
+               seats: Optional[list[int]] = None,
+               verify: bool = True):
+        """Put the stones of a whole game on the board, see Board.replay().
+
+        The counts of the lines are rebuilt from the final position,
+        one pass over the stones.
+
+        Args:
+            columns: column of every move.
+            seats: ID of the player of every move, by default
+                   the players move in order of their IDs.
+            verify: find the outcome right away.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Same as Board.replay().
+        """
+        super().replay(columns, seats, verify=False)
+
+        owners: list[int] = self.owners
+        lines_through: list[tuple[int, ...]] = self.lines_through
+        for player_id in self.player_ids():
+            counts: list[int] = self.get_counts(player_id)
+            stones: int = self.masks[player_id]
+            while stones:
+                stone: int = stones & -stones
+                for line in lines_through[stone.bit_length() - 1]:
+                    counts[line] += 1
+                    if counts[line] == 1:
+                        owners[line] += 1
+                stones ^= stone
+
+        self.open_lines = sum(1 for owner in owners if owner < 2)
+
+        if verify:
+            self.verify()
+
+    def verify(self):
+        """Find the outcome of a game put on the board by replay().
+
+        Same as Board.verify(), and with early_draw the game is a draw
+        as soon as no line is open in the final position.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Same as Board.verify().
+        """
+        super().verify()
+        if (not self.solved and self.column_moves and
+                self.early_draw and self.open_lines == 0):
+            self.solved = True
+            self.solved_at = len(self.column_moves)
@@ -0,0 +1,226 @@
+from typing import Optional
+
+import os
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+
+from ..Board.Board import Board
+
+
+class OpeningBook:
+    """Evaluated early positions of two players, read through mmap.
+
+    A book is a file of fixed size records sorted by the key of the
+    position, so a lookup is a binary search in the mapped memory. There
+    is nothing to load, and the pages of the file are shared by all the
+    processes reading the same book. OpeningBookBuilder writes the books.
+
+    Positions are seen by the player to move: its stones are hashed with
+    the Zobrist numbers of player 0 and the stones of the opponent with
+    those of player 1, whatever their IDs are. Keys are canonical, see
+    Board.get_canonical_key(), so a position and its mirror image are
+    one record, and the column of a mirrored record is mirrored back.
+
+    Packed file:
+        header, HEADER: MAGIC, VERSION, width, height, line_length,
+                        number of plies of the book
+        records, RECORD: key, score, column, depth of the search,
+                         sorted by the key
+
+    Args:
+        path: path to the book file.
+
+    Attributes:
+        path: path to the book file.
+        width, height, line_length: the board of the book.
+        plies: positions of up to this many stones are in the book.
+
+    Methods:
+        key(board, player_id): Canonical key of a position.
+        lookup(board, player_id): Find the move of a position.
+        find(key): Find the record of a key.
+        close(): Unmap and close the book file.
+    """
+
+    MAGIC: bytes = b"C4OB"
+    VERSION: int = 1
+    HEADER: Struct = Struct("<4sBHHHH")
+    RECORD: Struct = Struct("<QiBB")
+
+    def __init__(self, path: str):
+        """Map the book file into memory and check its header.
+
+        Args:
+            path: path to the book file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be opened.
+            ValueError: If the file is not a book or is truncated.
+        """
+        self.path: str = path
+        self.file = open(path, "rb")
+        self.memory: Optional[mmap] = None
+        try:
+            size: int = os.fstat(self.file.fileno()).st_size
+            header: bytes = self.file.read(self.HEADER.size)
+            if len(header) < self.HEADER.size:
+                raise ValueError("Book is too short for a header", path)
+
+            magic, version, width, height, line_length, plies = \
+                self.HEADER.unpack(header)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(
+                    "Not a book of version", self.VERSION,
+                    ", but", magic, version)
+            if (size - self.HEADER.size) % self.RECORD.size != 0:
+                raise ValueError("Book is truncated", path, size)
+
+            self.memory = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise
+
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.plies: int = plies
+        self.size: int = (size - self.HEADER.size) // self.RECORD.size
+
+    def __len__(self) -> int:
+        """Number of positions in the book."""
+        return self.size
+
+    def __enter__(self) -> "OpeningBook":
+        """Use the book in a with block."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the book at the end of a with block."""
+        self.close()
+
+    @staticmethod
+    def key(board: Board, player_id: int) -> tuple[int, bool]:
+        """Get the canonical key of a position seen by the player to move.
+
+        Args:
+            board: the board of the position.
+            player_id: ID of the player to move.
+
+        Returns:
+            tuple[int, bool]: the key, and True when it is
+                              the key of the mirrored position.
+
+        Raises:
+            None
+        """
+        current: int = board.masks[player_id]
+        numbers: tuple[list[int], list[int]] = (
+            board.get_zobrist(0), board.get_zobrist(1))
+        shifts: list[int] = board.mirror_shift
+        stride: int = board.stride
+
+        key: int = 0
+        mirror_key: int = 0
+        stones: int = board.mask
+        while stones:
+            stone: int = stones & -stones
+            index: int = stone.bit_length() - 1
+            side: list[int] = numbers[0 if current & stone else 1]
+            key ^= side[index]
+            mirror_key ^= side[index + shifts[index // stride]]
+            stones ^= stone
+
+        if mirror_key < key:
+            return mirror_key, True
+        return key, False
+
+    def find(self, key: int) -> Optional[tuple[int, int, int]]:
+        """Find the record of a key by a binary search.
+
+        Args:
+            key: canonical key of a position.
+
+        Returns:
+            Optional[tuple[int, int, int]]: score, column in the canonical
+                                            orientation and depth of the
+                                            search, None when not found.
+
+        Raises:
+            None
+        """
+        if self.memory is None:
+            return None
+
+        record: Struct = self.RECORD
+        start: int = self.HEADER.size
+        low: int = 0
+        high: int = self.size
+        while low < high:
+            middle: int = (low + high) // 2
+            found: int = record.unpack_from(
+                self.memory, start + middle * record.size)[0]
+            if found < key:
+                low = middle + 1
+            elif key < found:
+                high = middle
+            else:
+                return record.unpack_from(
+                    self.memory, start + middle * record.size)[1:]
+        return None
+
+    def lookup(self,
+               board: Board,
+               player_id: int) -> Optional[tuple[int, int, int]]:
+        """Find the move of the player to move in the book.
+
+        Positions of more than two players, of other board sizes or
+        with more stones than the plies of the book are never found.
+
+        Args:
+            board: the board of the position.
+            player_id: ID of the player to move.
+
+        Returns:
+            Optional[tuple[int, int, int]]: column, its score and depth
+                                            of the search, see Negamax,
+                                            None when not in the book.
+
+        Raises:
+            None
+        """
+        if (board.width, board.height, board.line_length) != \
+                (self.width, self.height, self.line_length):
+            return None
+        n_stones: int = board.width * board.height - board.empty_cells_left
+        if 2 < board.i_symbol or self.plies < n_stones:
+            return None
+
+        key, mirrored = self.key(board, player_id)
+        found: Optional[tuple[int, int, int]] = self.find(key)
+        if found is None:
+            return None
+
+        score, column, depth = found
+        if mirrored:
+            column = board.mirror_column(column)
+        return column, score, depth
+
+    def close(self):
+        """Unmap and close the book file.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.memory is not None:
+            self.memory.close()
+            self.memory = None
+        self.file.close()
@@ -0,0 +1,181 @@
+from typing import Callable, Optional
+
+import os
+
+from ..Board.Board import Board
+from ..Search.Negamax import Negamax
+from ..Search.TranspositionTable import TranspositionTable
+from .OpeningBook import OpeningBook
+
+
+class OpeningBookBuilder:
+    """Search all the early positions of two players and write a book.
+
+    Every position of up to plies stones reachable from the empty board,
+    where nobody has won yet, is searched by Negamax with the time budget
+    and the depth limit given, positions found as a mirror image of
+    another one are searched once. Scores are exact for the positions
+    solved within the limits, and heuristic for the rest, see Negamax.
+
+    The number of positions grows about width times with every ply,
+    a few plies are enough for the moves that are searched the longest.
+
+    Args:
+        width: width of the board.
+        height: height of the board.
+        line_length: length of a winning line.
+        plies: positions of up to this many stones go into the book.
+        time_budget: wall-clock time per position in milliseconds.
+        max_depth: optional limit of plies to search per position.
+        table_memory: memory for the table shared by the searches.
+
+    Attributes:
+        width, height, line_length, plies, time_budget, max_depth: as given.
+        table: table of evaluated positions shared by the searches.
+
+    Methods:
+        positions(): Canonical positions of the book.
+        build(path, report): Search the positions and write the book.
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 plies: int,
+                 time_budget: int = 1000,
+                 max_depth: Optional[int] = None,
+                 table_memory: int = 64 << 20):
+        """Check the settings of the book.
+
+        Args:
+            width: width of the board.
+            height: height of the board.
+            line_length: length of a winning line.
+            plies: positions of up to this many stones go into the book.
+            time_budget: wall-clock time per position in milliseconds.
+            max_depth: optional limit of plies to search per position.
+            table_memory: memory for the table shared by the searches.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the board is wrong, see Board.
+            ValueError: If plies is negative or time_budget not positive.
+        """
+        # fail early on a wrong board
+        Board(width, height, line_length, quiet=True)
+
+        if plies < 0:
+            raise ValueError(
+                "Number of plies should not be negative, and not", plies)
+        if time_budget <= 0:
+            raise ValueError(
+                "Time budget should be a positive number of milliseconds" +
+                ", and not", time_budget)
+
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.plies: int = plies
+        self.time_budget: int = time_budget
+        self.max_depth: Optional[int] = max_depth
+        self.table: TranspositionTable = TranspositionTable(table_memory)
+
+    def positions(self) -> list[list[int]]:
+        """Find the positions of the book, one of every mirror pair.
+
+        Args:
+            None
+
+        Returns:
+            list[list[int]]: columns of the moves reaching the positions,
+                             player 0 moves first.
+
+        Raises:
+            None
+        """
+        board: Board = Board(
+            self.width, self.height, self.line_length, quiet=True)
+        seen: set[int] = set()
+        found: list[list[int]] = []
+        moves: list[int] = []
+
+        def visit(ply: int):
+            """Keep the position and go one move deeper."""
+            player: int = ply % 2
+            key: int = OpeningBook.key(board, player)[0]
+            if key in seen:
+                return
+            seen.add(key)
+
+            if not board.open_columns:
+                return
+            found.append(list(moves))
+            if ply == self.plies:
+                return
+
+            for column in range(0, self.width):
+                if board.is_open(column):
+                    board._put(column, player)
+                    if not board.has_line(board.masks[player]):
+                        moves.append(column)
+                        visit(ply + 1)
+                        moves.pop()
+                    board._unput(column, player)
+
+        visit(0)
+        return found
+
+    def build(self,
+              path: str,
+              report: Optional[Callable[[int, int], None]] = None) -> int:
+        """Search the positions and write the book.
+
+        The book is written to a temporary file first and moved in place
+        once it is complete, so readers never see half a book.
+
+        Args:
+            path: path to the book file.
+            report: optional function called with the number of positions
+                    searched so far and the number of all of them.
+
+        Returns:
+            int: number of positions in the book.
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        board: Board = Board(
+            self.width, self.height, self.line_length, quiet=True)
+        positions: list[list[int]] = self.positions()
+
+        records: list[tuple[int, int, int, int]] = []
+        for i, columns in enumerate(positions):
+            board.replay(columns, verify=False)
+            player: int = len(columns) % 2
+            key, mirrored = OpeningBook.key(board, player)
+
+            search: Negamax = Negamax(board, player, 1 - player, self.table)
+            column, score, depth = search.search(
+                board.masks[player], board.mask,
+                self.time_budget, self.max_depth)
+            if mirrored:
+                column = board.mirror_column(column)
+            records.append((key, score, column, depth))
+
+            if report is not None:
+                report(i + 1, len(positions))
+
+        records.sort()
+        temporary: str = path + ".tmp"
+        with open(temporary, "wb") as book:
+            book.write(OpeningBook.HEADER.pack(
+                OpeningBook.MAGIC, OpeningBook.VERSION,
+                self.width, self.height, self.line_length, self.plies))
+            for record in records:
+                book.write(OpeningBook.RECORD.pack(*record))
+        os.replace(temporary, path)
+
+        return len(records)
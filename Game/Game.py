@@ -1,14 +1,26 @@
 from typing import Optional
 
-from time import sleep
-from threading import Thread, Lock
-from random import randint
+from asyncio import Event, Task, create_task, wait
+from asyncio import Lock as AsyncLock, sleep as async_sleep
+import random
+from threading import Thread
+from random import Random
+from time import perf_counter
 
 from warnings import warn
 
 from .Board.Board import Board
+from .Book.OpeningBook import OpeningBook
+from .Tablebase.Tablebase import Tablebase
+from .Metrics.MetricsRegistry import MetricsRegistry
 from .Player.Player import Player
 from .Player.PlayerHuman import PlayerHuman
+from .Output.Output import Output
+from .Output.OutputConsole import OutputConsole
+from .Output.OutputSilent import OutputSilent
+from .Scheduler.Scheduler import Scheduler
+from .Scheduler.SchedulerLuck import SchedulerLuck
+from .Seed.SeedSequence import SeedSequence
 
 HELP_TEXT = """Please initialize Game with the dictinary, here is an example:
 
@@ -30,13 +42,36 @@ settings = {
     "board": {
         "width": board_width,
         "height": board_height,
-        "line_length": board_line_length
+        "line_length": board_line_length,
+        # optional, Board or its subclass like LineBoard
+        "engine": Board
     },
     # when True players move one after the other in order of
     # the settings["players"] list
-    # when False each player run in a separate Thread and is trying
-    # to acquire Lock() after a random delay of a few seconds
-    "boring": True
+    # when False each player run in a separate Thread and waits
+    # for the turn given by the scheduler
+    "boring": True,
+    # optional, who moves next when "boring" is False, for example
+    # SchedulerFair, SchedulerWeighted, or SchedulerLuck(max_delay=0)
+    "scheduler": SchedulerLuck(max_delay=1000),
+    # optional, when True the game prints nothing to the console
+    "quiet": False,
+    # optional, where everything goes, for example OutputBuffered()
+    # writing once per turn, OutputANSI() redrawing only the new stones,
+    # or OutputSilent()
+    "output": OutputConsole(),
+    # optional, measures the moves, inputs, board and waits for turns,
+    # see MetricsRegistry.snapshot() and export_prometheus()
+    "metrics": MetricsRegistry(),
+    # optional, master seed of the players, the scheduler and the game,
+    # an int or a SeedSequence, to play exactly the same game again
+    "seed": 2024,
+    # optional, opening book the 'computer' players consult before
+    # searching, see Book.OpeningBookBuilder
+    "book": OpeningBook("book_7x6x4.c4b"),
+    # optional, tablebase of late positions the 'computer' players play
+    # perfectly, see Tablebase.TablebaseBuilder
+    "tablebase": Tablebase("tablebase_4x4x3.c4t")
 }
 """
 
@@ -61,6 +96,11 @@ class Game:
     https://en.wikipedia.org/wiki/M,n,k-game
     """
 
+    # Longest a player thinks before a move of a game that is not
+    # boring and not quiet, in milliseconds, humans get more time
+    MAX_DELAY: int = 1000
+    MAX_DELAY_HUMAN: int = 5000
+
     def __init__(self, settings: Optional[dict] = None):
         """Constructor
         prepares the list of symbols(colors) that could be used for
@@ -95,6 +135,13 @@ class Game:
             TypeError: If settings is None.
             TypeError: If settings["players"] value is not a list [].
             TypeError: If settings["players"] items are not subclass of Player.
+            TypeError: If settings["board"]["engine"] is not a Board class.
+            TypeError: If settings["scheduler"] is not a Scheduler.
+            TypeError: If settings["output"] is not an Output.
+            TypeError: If settings["metrics"] is not a MetricsRegistry.
+            TypeError: If settings["seed"] is not an int or a SeedSequence.
+            TypeError: If settings["book"] is not an OpeningBook.
+            TypeError: If settings["tablebase"] is not a Tablebase.
         """
 
         if settings is None:
@@ -132,13 +179,85 @@ class Game:
                  'specified in the settings dict:'),
                 settings)
 
+        # Set a flag if game should print anything at all
+        self.quiet: bool = False
+        if "quiet" in settings:
+            self.quiet = settings["quiet"]
+
+        # Everything the game shows goes to the output,
+        # nothing is shown at all by a quiet game by default
+        self.output: Output
+        if "output" in settings:
+            self.output = settings["output"]
+            if not isinstance(self.output, Output):
+                raise TypeError(
+                    "Output has to be of type Output, " +
+                    "but you gave me", type(self.output))
+        elif self.quiet:
+            self.output = OutputSilent()
+        else:
+            self.output = OutputConsole()
+
+        # Nothing is measured unless a registry is given
+        self.metrics: Optional[MetricsRegistry] = None
+        if "metrics" in settings:
+            self.metrics = settings["metrics"]
+            if not isinstance(self.metrics, MetricsRegistry):
+                raise TypeError(
+                    "Metrics have to be of type MetricsRegistry, " +
+                    "but you gave me", type(self.metrics))
+
+        # With a master seed every player, the scheduler and the game
+        # get random streams of their own, derived from it
+        self.seeds: Optional[SeedSequence] = None
+        self.generator: Random = random
+        if "seed" in settings:
+            self.seeds = settings["seed"]
+            if isinstance(self.seeds, int):
+                self.seeds = SeedSequence(self.seeds)
+            if not isinstance(self.seeds, SeedSequence):
+                raise TypeError(
+                    "Seed has to be an int or a SeedSequence, " +
+                    "but you gave me", type(self.seeds))
+            self.generator = self.seeds.child("game").generator()
+
+        # Players consult the book of the game, if there is one
+        self.book: Optional[OpeningBook] = None
+        if "book" in settings:
+            self.book = settings["book"]
+            if not isinstance(self.book, OpeningBook):
+                raise TypeError(
+                    "Book has to be of type OpeningBook, " +
+                    "but you gave me", type(self.book))
+
+        # and the tablebase of the game
+        self.tablebase: Optional[Tablebase] = None
+        if "tablebase" in settings:
+            self.tablebase = settings["tablebase"]
+            if not isinstance(self.tablebase, Tablebase):
+                raise TypeError(
+                    "Tablebase has to be of type Tablebase, " +
+                    "but you gave me", type(self.tablebase))
+
+        # Board itself or any subclass of it could run the game
+        engine: type = Board
+        if "engine" in settings["board"]:
+            engine = settings["board"]["engine"]
+            if not (isinstance(engine, type) and issubclass(engine, Board)):
+                raise TypeError(
+                    "Board engine has to be Board or its subclass, " +
+                    "but you gave me", engine)
+
         # at this point things seem to be somewhat correct to try
         # instantiation of the Board class
-        self.board: Board = Board(
+        self.board: Board = engine(
             settings["board"]["width"],
             settings["board"]["height"],
-            settings["board"]["line_length"]
+            settings["board"]["line_length"],
+            quiet=self.quiet,
+            output=self.output
         )
+        self.board.set_metrics(self.metrics)
 
         # Check if Player list is provided and instances
         # are correctly initialized, if yes - add them to
@@ -173,6 +292,15 @@ class Game:
 
             # Pick a symbol(color) for each player
             player.set_ID(self.board.next_unused_stone())
+            player.set_output(self.output)
+            player.set_metrics(self.metrics)
+            if self.book is not None:
+                player.set_book(self.book)
+            if self.tablebase is not None:
+                player.set_tablebase(self.tablebase)
+            if self.seeds is not None:
+                player.set_generator(
+                    self.seeds.child("player", len(self.players)).generator())
 
             self.players.append(player)
 
@@ -181,6 +309,31 @@ class Game:
         if "boring" in settings:
             self.boring = settings["boring"]
 
+        # Turns of the multi-threaded game, by default the luckiest
+        # player moves after up to a second, or five for the humans,
+        # right away in a quiet game
+        self.scheduler: Scheduler
+        if "scheduler" in settings:
+            self.scheduler = settings["scheduler"]
+            if not isinstance(self.scheduler, Scheduler):
+                raise TypeError(
+                    "Scheduler has to be of type Scheduler, " +
+                    "but you gave me", type(self.scheduler))
+        else:
+            self.scheduler = SchedulerLuck(
+                max_delay=0 if self.quiet else self.MAX_DELAY,
+                seed=None if self.seeds is None
+                else self.seeds.child("scheduler").state(),
+                max_delays=None if self.quiet else {
+                    player.get_ID(): self._max_delay(player)
+                    for player in self.players
+                })
+
+        self.threads: list[Thread] = []
+
+        # Index of the player to move in Game.players, for step()
+        self.turn: int = 0
+
     def play(self):
         """Implements dynamics if the Connect Four game.
 
@@ -195,12 +348,15 @@ class Game:
 
         When Game.boring is False
             Each player run their own thread with while loop until the board
-            is solved or no moves left. In this case players compete for the
-            board resource and are trying to acquire() the Lock object so no
-            two players read or write the contents of the board simultaneously.
-            Before each attempt player has to wait for a random amount of time,
-            from zero up to several seconds. This gives a chance that a player
-            would be given(or not given) several consecutive moves in a row.
+            is solved or no moves left. In this case players wait for the
+            Game.scheduler to give them a turn, so no two players read or
+            write the contents of the board simultaneously. By default the
+            turn goes to a random player after a random delay of up to
+            a second, or five seconds for the humans. This gives a chance
+            that a player would be given (or not given) several consecutive
+            moves in a row.
+            The threads are kept in Game.threads and exit as soon as
+            the board is solved.
 
         Args:
             None
@@ -215,9 +371,10 @@ class Game:
             msg = ("\n\nMeh.. Ok, let's play a boring, "
                    "orthodox and synchronous way :)\n\n")
 
-            warn(msg)
-
-            print(self.board)
+            if not self.quiet:
+                warn(msg)
+                self.output.render(self.board)
+                self.output.flush()
 
             can_play = True
             while can_play:
@@ -228,110 +385,71 @@ class Game:
                         break
 
                     # game is not finished yet and this Player can play
-                    print(player, self.board.get_symbol(player.get_ID()))
-                    player.move(self.board)
-                    print(self.board)
+                    if not self.quiet:
+                        self.output.message(
+                            player, self.board.get_symbol(player.get_ID()))
+                    self._move(player, self.board)
+                    if not self.quiet:
+                        self.output.render(self.board)
+                        self.output.flush()
 
         else:
             msg = ("\n\nYa-pa-yeee! Async - this is " +
                    "where the real fun begins! XDDD\n\n")
 
-            warn(msg)
-
-            print(self.board)
-            # We would need more advanced player.move() function
-            # that would be independent of outer while loop that
-            # is checking on board.is_solved(),
-            # and to have this while routine inside the new move() function
-            # so players are fundamentally independent of anything and
-            # given only the board to play on
-            #
+            if not self.quiet:
+                warn(msg)
+                self.output.render(self.board)
+                self.output.flush()
             # Players are going to compete for taking an action on the Board,
             # and to ensure only one player at a time has acces to the board
-            # we would need to clock others from taking control, this can be
-            # done using what is called 'synchronization' mechanism
-            #
-            # This Game here is designed in such a way that a bare minimum
-            # synchronization with only a single Lock object is sufficient
+            # a Scheduler hands the turns out: every player thread blocks
+            # until it is given a turn, moves and passes the turn on.
+            # Nobody polls and nobody sleeps in vain - the Scheduler wakes
+            # exactly the player to move next, and all of them at once
+            # when the board is solved so the threads exit right away.
+            scheduler: Scheduler = self.scheduler
 
             # Decorator for the player.move()
-            def move_async(board: Board, player: Player, lock: Lock):
+            def move_async(board: Board, player: Player, scheduler: Scheduler):
                 """Put player.move() inside the while loop
-                polling on lock.acquire()."""
-                # Intoruce Luck and make board available to Players
-                # by chance...
-                max_delay_ms = 1000
-                if isinstance(player, PlayerHuman):
-                    max_delay_ms = 5000
-
-                can_play = True
-                while can_play:
-                    # Generate random delay time in seconds
-                    delay = randint(0, max_delay_ms)/1000
-
-                    # wait before trying to acquire lock
-                    sleep(delay)
-
-                    if lock.acquire():
-                        # Got lucky and acquired the Lock!
-                        # So now Player can make a move :)
-
-                        # check if game already won by somebody else
-                        if board.is_solved():
-                            can_play = False
-                            lock.release()  # don't forget to release the lock!
-
-                            # just continue to exit the while loop. We could
-                            # directly return and jump away from function but
-                            # that does not seem right as there could be other
-                            # statements after the while loop
-                            continue
-
-                        # game is not finished yet and this Player can play
-                        print(player, board.get_symbol(player.get_ID()))
-                        player.move(board)
-                        print(board)
-
-                        lock.release()  # don't forget to release the lock!
-                    else:
-                        # keep polling on lock.acquire()
-                        pass
-
-                print("Player", player.get_name(), " exit")
-                # here could be some more code to execute after
-                # exiting the while loop, some other logic
-                # or the cleanup procedures
-
-            # Lock is the synchronization object to ensure no players
-            # modify the Board simultaneously, as well as no players
-            # can move after board is solved or no moves left
-            #
-            # We can keep this object in the local scope of this if-else,
-            # as our decorator function has access to everything
-            # in the current scope - we don't need to pass it
-            # inside the function.
-            #
-            # but I feel this somewhat obscures usage of objects when
-            # relying on user's understanding of scopes, so I will pass
-            # lock explicitly as a parameter to make it clear what is being
-            # used and where.
-            #
-            # And I have no problems with this lock object is mutable
-            # and would be passed by reference, so all threads would use
-            # the same object no matter what.
-            lock = Lock()
+                waiting on scheduler.acquire()."""
+                while self._acquire(scheduler, player):
+                    # game is not finished yet and this Player can play
+                    if not self.quiet:
+                        self.output.message(
+                            player, board.get_symbol(player.get_ID()))
+                    try:
+                        self._move(player, board)
+                    except BaseException:
+                        # nobody else should wait for this player forever
+                        scheduler.shutdown()
+                        raise
+                    if not self.quiet:
+                        self.output.render(board)
+                        self.output.flush()
+
+                    # an empty board without moves left is solved as well
+                    scheduler.release(player.get_ID(), board.is_solved())
+
+                if not self.quiet:
+                    self.output.message("Player", player.get_name(), " exit")
+                    self.output.flush()
+
+            scheduler.start([player.get_ID() for player in self.players])
 
             # Get the show on the road!
+            self.threads = []
             for player in self.players:
                 # create a dedicated Thread for a Player with entry
                 # at move_async() function we created earlier
-                # and pass there board, player, and lock objects
+                # and pass there board, player, and scheduler objects
                 t = Thread(
                     target=move_async,
                     kwargs={
                         'board': self.board,
                         'player': player,
-                        'lock': lock
+                        'scheduler': scheduler
                     }
                 )
 
@@ -339,7 +457,371 @@ class Game:
                 t.start()
 
                 # we do not want to join() as it will cause blocking
-                # on the main thread until this one finishes
-                # and we do not need to setDaemon() because we do not
-                # want, do not need, and do not care for any thread
-                # to continue after game is done!
+                # on the main thread until this one finishes,
+                # the threads are kept in Game.threads for those who do
+                self.threads.append(t)
+
+    def _max_delay(self, player: Player) -> int:
+        """Get the longest a player thinks before a move by default.
+
+        Args:
+            player: a player of the game.
+
+        Returns:
+            int: delay in milliseconds, MAX_DELAY_HUMAN for the humans
+                 and MAX_DELAY for the others.
+
+        Raises:
+            None
+        """
+        if isinstance(player, PlayerHuman):
+            return self.MAX_DELAY_HUMAN
+        return self.MAX_DELAY
+
+    def _move(self, player: Player, board: Board):
+        """Call player.move(), measured when the game has metrics.
+
+        Args:
+            player: the player to move.
+            board: the board of the game.
+
+        Returns:
+            None
+
+        Raises:
+            Whatever player.move() raises.
+        """
+        if self.metrics is None:
+            player.move(board)
+            return
+
+        with self.metrics.timer("player_move_seconds",
+                                player=player.get_name()):
+            player.move(board)
+
+    async def _amove(self, player: Player, board: Board):
+        """Await player.amove(), measured when the game has metrics.
+
+        Args:
+            player: the player to move.
+            board: the board of the game.
+
+        Returns:
+            None
+
+        Raises:
+            Whatever player.amove() raises.
+        """
+        if self.metrics is None:
+            await player.amove(board)
+            return
+
+        with self.metrics.timer("player_move_seconds",
+                                player=player.get_name()):
+            await player.amove(board)
+
+    def _acquire(self, scheduler: Scheduler, player: Player) -> bool:
+        """Call scheduler.acquire(), measured when the game has metrics.
+
+        Args:
+            scheduler: the scheduler of the game.
+            player: the player waiting for its turn.
+
+        Returns:
+            bool: True when the player should move now,
+                  False when the game is over.
+
+        Raises:
+            None
+        """
+        if self.metrics is None:
+            return scheduler.acquire(player.get_ID())
+
+        with self.metrics.timer("scheduler_wait_seconds",
+                                player=player.get_name()):
+            return scheduler.acquire(player.get_ID())
+
+    def _state(self, player_id: int, column: int) -> dict:
+        """Describe the board after a stone of the player in the column.
+
+        Args:
+            player_id: ID of the player that moved.
+            column: index of the column of the stone.
+
+        Returns:
+            dict: see step().
+
+        Raises:
+            None
+        """
+        next_player: int = -1
+        if not self.board.is_solved():
+            next_player = self.players[self.turn].get_ID()
+
+        return {
+            "player": player_id,
+            "column": column,
+            "row": self.board.columns_height[column] - 1,
+            "winner": self.board.winner,
+            "draw": self.board.is_solved() and self.board.winner < 0,
+            "outcome": self.board.get_outcome(),
+            "next_player": next_player
+        }
+
+    def step(self, column: int) -> dict:
+        """Place a stone of the player to move and return right away.
+
+        Players take turns in order of the Game.players list, as in the
+        boring play(), but the columns come from the caller instead of
+        Player.move(), so the game could be driven from the outside one
+        move at a time and kept as a plain state between the moves.
+
+        Args:
+            column: index of the column to place the stone into.
+
+        Returns:
+            dict: state of the game after the move
+                {
+                    "player": ID of the player that moved,
+                    "column": index of the column,
+                    "row": row of the stone, 0 is the bottom row,
+                    "winner": ID of the winner, -1 if nobody won,
+                    "draw": True when the game is over and nobody won,
+                    "outcome": Board.get_outcome() after the move,
+                    "next_player": ID of the player to move,
+                                   -1 when the game is over
+                }
+
+        Raises:
+            ValueError: If the game is over.
+            ValueError: If the column is out of range or full,
+                        the turn stays with the same player.
+        """
+        if self.board.is_solved():
+            raise ValueError(
+                "The game is over, no more moves after",
+                self.board.get_outcome())
+
+        if (0 <= column < self.board.width and
+                self.board.height <= self.board.columns_height[column]):
+            raise ValueError("Column is full", column)
+
+        player: Player = self.players[self.turn]
+        self.board.apply(column, player.get_ID(), player.get_name())
+        self.turn = (self.turn + 1) % len(self.players)
+
+        return self._state(player.get_ID(), column)
+
+    def iter_play(self):
+        """Play the game one move at a time, yielding after every move.
+
+        Players move by Player.move() in order of the Game.players list,
+        starting from the player to move of step(), and the caller decides
+        when the next move is made, or if it is made at all.
+
+        Args:
+            None
+
+        Yields:
+            dict: state of the game after the move, see step().
+                  Turns lost without placing a stone are not yielded.
+
+        Raises:
+            None
+        """
+        while not self.board.is_solved():
+            player: Player = self.players[self.turn]
+            n_moves: int = len(self.board.column_moves)
+            self._move(player, self.board)
+            self.turn = (self.turn + 1) % len(self.players)
+
+            if n_moves < len(self.board.column_moves):
+                yield self._state(
+                    player.get_ID(), self.board.column_moves[-1])
+
+    async def aplay(self):
+        """Play the game as a coroutine of an asyncio event loop.
+
+        The same dynamics as play(), with players awaiting their
+        Player.amove() instead of running in threads, so many games could
+        share a single thread, see Host.AsyncHost.
+
+        When Game.boring is True
+            players move in the exact order of the Game.players list.
+
+        When Game.boring is False
+            every player is a task awaiting a random delay and then the
+            asyncio Lock of the board, so the luckiest one moves.
+            Quiet games skip the delays. Tasks of the players are
+            cancelled as soon as the game is over, or as soon as one
+            of the players fails, and its error is raised again here,
+            the way play() shuts the scheduler down.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            Exception: Whatever Player.amove() of a player raised.
+        """
+        if not self.quiet:
+            self.output.render(self.board)
+            self.output.flush()
+
+        if self.boring is True:
+            while not self.board.is_solved():
+                for player in self.players:
+                    if self.board.is_solved():
+                        break
+
+                    if not self.quiet:
+                        self.output.message(
+                            player, self.board.get_symbol(player.get_ID()))
+                    await self._amove(player, self.board)
+                    if not self.quiet:
+                        self.output.render(self.board)
+                        self.output.flush()
+            return
+
+        lock: AsyncLock = AsyncLock()
+        over: Event = Event()
+
+        async def amove_async(player: Player):
+            """Await a delay and the lock, then move until the game ends."""
+            max_delay_ms: int = self._max_delay(player)
+
+            try:
+                while not self.board.is_solved():
+                    if not self.quiet:
+                        await async_sleep(
+                            self.generator.randint(0, max_delay_ms) / 1000)
+                    else:
+                        await async_sleep(0)
+
+                    start: float = perf_counter()
+                    async with lock:
+                        if self.metrics is not None:
+                            self.metrics.observe(
+                                "scheduler_wait_seconds",
+                                perf_counter() - start,
+                                player=player.get_name())
+                        if self.board.is_solved():
+                            break
+
+                        if not self.quiet:
+                            self.output.message(
+                                player,
+                                self.board.get_symbol(player.get_ID()))
+                        await self._amove(player, self.board)
+                        if not self.quiet:
+                            self.output.render(self.board)
+                            self.output.flush()
+            finally:
+                # nobody else should wait for this player forever
+                over.set()
+
+        tasks: list[Task] = [
+            create_task(amove_async(player)) for player in self.players
+        ]
+        try:
+            await over.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await wait(tasks)
+
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+    def simulate(self, n_games: int) -> dict:
+        """Play many games in a row without any output or delays.
+
+        Players move in the order of the Game.players list, the same way
+        as in the boring play(). The Board is reset and reused between
+        games, players are made quiet for the time of the simulation.
+
+        Args:
+            n_games: number of games to play.
+
+        Returns:
+            dict: outcome statistics
+                {
+                    "games": number of games played,
+                    "wins": list of wins of every seat (index in players),
+                    "draws": number of games nobody won,
+                    "blocked": draws ended early because nobody
+                               could complete a line anymore,
+                    "moves": total number of stones placed,
+                    "min_length": the shortest game in stones,
+                    "max_length": the longest game in stones,
+                    "mean_length": average game length in stones,
+                    "lengths": {game length: number of games}
+                }
+
+        Raises:
+            ValueError: If n_games is negative.
+        """
+        if n_games < 0:
+            raise ValueError(
+                "Number of games should not be negative, and not", n_games)
+
+        board: Board = self.board
+        players: list[Player] = self.players
+
+        # Map player IDs to their seats to count the wins
+        seats: dict[int, int] = {
+            player.get_ID(): seat for seat, player in enumerate(players)
+        }
+
+        wins: list[int] = [0 for player in players]
+        draws: int = 0
+        blocked: int = 0
+        lengths: dict[int, int] = {}
+
+        quiet_board: bool = board.quiet
+        quiet_players: list[bool] = [player.quiet for player in players]
+        board.quiet = True
+        for player in players:
+            player.set_quiet(True)
+
+        try:
+            for i_game in range(0, n_games):
+                board.reset()
+                while not board.solved:
+                    for player in players:
+                        if board.solved:
+                            break
+                        self._move(player, board)
+
+                if board.winner < 0:
+                    draws += 1
+                    if board.get_outcome() == Board.OUTCOME_BLOCKED:
+                        blocked += 1
+                else:
+                    wins[seats[board.winner]] += 1
+
+                length: int = len(board.player_moves)
+                lengths[length] = lengths.get(length, 0) + 1
+
+        finally:
+            board.quiet = quiet_board
+            for player, quiet in zip(players, quiet_players):
+                player.set_quiet(quiet)
+
+        moves: int = sum(
+            length * count for length, count in lengths.items())
+
+        return {
+            "games": n_games,
+            "wins": wins,
+            "draws": draws,
+            "blocked": blocked,
+            "moves": moves,
+            "min_length": min(lengths) if lengths else 0,
+            "max_length": max(lengths) if lengths else 0,
+            "mean_length": moves / n_games if n_games else 0.0,
+            "lengths": lengths,
+        }
@@ -0,0 +1,119 @@
+from typing import Iterable, Optional
+
+from asyncio import Semaphore, gather, run
+
+from ..Game import Game
+
+
+class AsyncHost:
+    """Run many games as coroutines of a single asyncio event loop.
+
+    Every Game is played by Game.aplay(), players await their
+    Player.amove(), so a game costs a few coroutines instead of a thread
+    per player and thousands of games share one thread. Games waiting
+    for their players take no CPU at all.
+
+    Args:
+        max_games: optional limit of games played at the same time.
+
+    Attributes:
+        max_games: optional limit of games played at the same time.
+        active: number of games being played now.
+        finished: number of games played to the end.
+
+    Methods:
+        play(game): Coroutine playing a single game.
+        run(games): Coroutine playing all the games.
+        serve(games): Play all the games in a new event loop.
+    """
+
+    def __init__(self, max_games: Optional[int] = None):
+        """Prepare the host, no event loop is needed yet.
+
+        Args:
+            max_games: optional limit of games played at the same time.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If max_games is not positive.
+        """
+        if max_games is not None and max_games <= 0:
+            raise ValueError(
+                "Limit of games should be a positive number, and not",
+                max_games)
+
+        self.max_games: Optional[int] = max_games
+        self.active: int = 0
+        self.finished: int = 0
+
+        # Created inside the loop, it has to belong to the running one
+        self.semaphore: Optional[Semaphore] = None
+
+    async def play(self, game: Game) -> dict:
+        """Play a single game to the end.
+
+        Args:
+            game: game to play, its board is played as is.
+
+        Returns:
+            dict: outcome of the game
+                {
+                    "winner": ID of the winner, -1 for a draw,
+                    "outcome": Board.get_outcome() of the final board,
+                    "moves": number of stones placed
+                }
+
+        Raises:
+            Exception: Whatever Game.aplay() raised.
+        """
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+
+        self.active += 1
+        try:
+            await game.aplay()
+        finally:
+            self.active -= 1
+            if self.semaphore is not None:
+                self.semaphore.release()
+        self.finished += 1
+
+        return {
+            "winner": game.board.winner,
+            "outcome": game.board.get_outcome(),
+            "moves": len(game.board.player_moves)
+        }
+
+    async def run(self, games: Iterable[Game]) -> list[dict]:
+        """Play all the games concurrently.
+
+        Args:
+            games: games to play.
+
+        Returns:
+            list[dict]: outcomes of the games in the given order,
+                        see play().
+
+        Raises:
+            None
+        """
+        if self.max_games is not None:
+            self.semaphore = Semaphore(self.max_games)
+        return list(await gather(*[self.play(game) for game in games]))
+
+    def serve(self, games: Iterable[Game]) -> list[dict]:
+        """Play all the games in a new event loop and wait for them.
+
+        Args:
+            games: games to play.
+
+        Returns:
+            list[dict]: outcomes of the games in the given order,
+                        see play().
+
+        Raises:
+            Exception: The first error of a game, see play().
+        """
+        return run(self.run(games))
@@ -1,8 +1,14 @@
+from random import Random
+
 from .InputInterface import InputInterface
 
 
 class Input(InputInterface):
-    """Base class for inputs."""
+    """Base class for inputs.
+
+    Inputs that do not pick at random ignore the generator,
+    so set_generator() does nothing by default.
+    """
 
     def get_int(self) -> int:
         """Ger intereger value from input.
@@ -20,3 +26,17 @@ class Input(InputInterface):
                                  and calling the base class method
         """
         raise NotImplementedError
+
+    def set_generator(self, generator: Random):
+        """Set the random generator of the input, nothing by default.
+
+        Args:
+            generator: random generator, like random.Random(seed).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        pass
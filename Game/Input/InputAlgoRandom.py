@@ -1,4 +1,7 @@
-from random import randint
+from typing import Optional
+
+import random
+from random import Random
 
 from .Input import Input
 
@@ -6,12 +9,14 @@ from .Input import Input
 class InputAlgoRandom(Input):
     """Implement generating random an integer."""
 
-    def __init__(self, n: int):
+    def __init__(self, n: int, generator: Optional[Random] = None):
         """Instantiate random integer input generator.
 
         Args:
             n: number of integers to choose from,
                later integer will be chosen from {0 .. n-1}.
+            generator: optional random generator,
+                       the random module by default.
 
         Returns:
             None
@@ -22,6 +27,21 @@ class InputAlgoRandom(Input):
         # -1 is necessary because board width,
         # but trated as index in 0-indexed list
         self.n = n-1
+        self.generator: Random = random if generator is None else generator
+
+    def set_generator(self, generator: Random):
+        """Set the random generator of the integers.
+
+        Args:
+            generator: random generator, like random.Random(seed).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.generator = generator
 
     def get_int(self) -> int:
         """Get integer from 0 to n-1.
@@ -34,4 +54,4 @@ class InputAlgoRandom(Input):
         Raises:
             None
         """
-        return randint(0, self.n)
+        return self.generator.randint(0, self.n)
@@ -0,0 +1,72 @@
+from typing import Optional
+
+import random
+from random import Random
+
+from .Input import Input
+from ..Board.Board import Board
+
+
+class InputAlgoRandomLegal(Input):
+    """Implement picking a random column that is not full.
+
+    Unlike InputAlgoRandom it never misses, the column comes from the
+    open columns of the board in O(1), however full the board is.
+
+    Args:
+        board: the board to pick the columns of, could be set later.
+        generator: optional random generator, the random module by default.
+
+    Attributes:
+        board: the board to pick the columns of.
+        generator: random generator of the columns.
+    """
+
+    def __init__(self,
+                 board: Optional[Board] = None,
+                 generator: Optional[Random] = None):
+        """Instantiate the input of legal random columns.
+
+        Args:
+            board: the board to pick the columns of, could be set later.
+            generator: optional random generator,
+                       the random module by default.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.board: Optional[Board] = board
+        self.generator: Random = random if generator is None else generator
+
+    def set_generator(self, generator: Random):
+        """Set the random generator of the columns.
+
+        Args:
+            generator: random generator, like random.Random(seed).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.generator = generator
+
+    def get_int(self) -> int:
+        """Get the index of a random column that is not full.
+
+        Args:
+            None
+
+        Returns:
+            int: index of the column.
+
+        Raises:
+            ValueError: If there is no board or all the columns are full.
+        """
+        if self.board is None:
+            raise ValueError("No board to pick a column of")
+        return self.board.random_open_column(self.generator)
@@ -0,0 +1,89 @@
+from bisect import bisect_left
+
+
+class Histogram:
+    """Counts of observed values in buckets of upper bounds.
+
+    The buckets are cumulative in the exports, the way Prometheus reads
+    them, but kept apart here so an observation updates a single bucket.
+    Values above the last bound go to the +Inf bucket.
+
+    Args:
+        bounds: increasing upper bounds of the buckets.
+
+    Attributes:
+        bounds: increasing upper bounds of the buckets.
+        counts: number of values in every bucket, the last is +Inf.
+        count: number of values observed.
+        sum: sum of values observed.
+
+    Methods:
+        observe(value): Count a value.
+        cumulative(): Counts of values up to every bound.
+    """
+
+    # 1, 2.5 and 5 of every power of ten from a microsecond to 10 seconds
+    SECONDS: tuple[float, ...] = tuple(
+        base * 10 ** power
+        for power in range(-6, 1)
+        for base in (1.0, 2.5, 5.0)
+    ) + (10.0,)
+
+    def __init__(self, bounds: tuple[float, ...] = SECONDS):
+        """Create an empty histogram.
+
+        Args:
+            bounds: increasing upper bounds of the buckets.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If bounds are empty or not increasing.
+        """
+        if not bounds or any(
+                bounds[i] >= bounds[i + 1] for i in range(0, len(bounds) - 1)):
+            raise ValueError(
+                "Bounds of buckets should be increasing, and not", bounds)
+
+        self.bounds: tuple[float, ...] = tuple(bounds)
+        self.counts: list[int] = [0 for i in range(0, len(bounds) + 1)]
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float):
+        """Count a value.
+
+        Args:
+            value: the observed value, like seconds of a call.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Count the values up to every bound.
+
+        Args:
+            None
+
+        Returns:
+            list[tuple[float, int]]: pairs of a bound and the number of
+                                     values up to it, the last bound is
+                                     float("inf").
+
+        Raises:
+            None
+        """
+        pairs: list[tuple[float, int]] = []
+        total: int = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
@@ -0,0 +1,307 @@
+from typing import Iterator, Optional
+
+import json
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+from .Histogram import Histogram
+
+
+class MetricsRegistry:
+    """Counters and latency histograms of a running game, in process.
+
+    Nothing is measured unless a registry is given to the game,
+    Game(settings) with settings["metrics"] hands it to the board and
+    the players, which then record:
+
+        player_move_seconds{player}: Player.move() and Player.amove().
+        input_seconds{player}: Input.get_int() in Player.move().
+        player_retries_total{player}: columns of the input that could
+                                      not be played and were asked again.
+        board_apply_seconds: Board.apply().
+        moves_total{player}: stones placed by Board.apply().
+        scheduler_wait_seconds{player}: time a player waited for its turn
+                                        in the threads or tasks of an
+                                        asynchronous game, the delays of
+                                        the scheduler included.
+
+    Series of a metric are told apart by their labels, like the name of
+    the player. Updates are guarded by a lock, player threads share the
+    registry. Snapshots are plain dicts, export_json() writes them as
+    JSON and export_prometheus() in the Prometheus text format.
+
+    Args:
+        prefix: prefix of the metric names in the Prometheus export.
+        bounds: upper bounds of the buckets of the histograms in seconds.
+
+    Attributes:
+        prefix: prefix of the metric names in the Prometheus export.
+        bounds: upper bounds of the buckets of the histograms in seconds.
+        started: perf_counter() at the creation or the last reset().
+
+    Methods:
+        count(name, value, **labels): Add to a counter.
+        observe(name, value, **labels): Add a value to a histogram.
+        timer(name, **labels): Context manager observing its duration.
+        reset(): Forget everything measured so far.
+        snapshot(): Copy the metrics into a dict.
+        to_prometheus(): Format the metrics as Prometheus text.
+        export_json(path), export_prometheus(path): Write to a file.
+    """
+
+    def __init__(self,
+                 prefix: str = "connectfour",
+                 bounds: tuple[float, ...] = Histogram.SECONDS):
+        """Create an empty registry.
+
+        Args:
+            prefix: prefix of the metric names in the Prometheus export.
+            bounds: upper bounds of the buckets of the histograms
+                    in seconds.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If bounds are empty or not increasing.
+        """
+        # fail early on wrong bounds, not at the first observation
+        Histogram(bounds)
+
+        self.prefix: str = prefix
+        self.bounds: tuple[float, ...] = tuple(bounds)
+        self.lock: Lock = Lock()
+        self.counters: dict[str, dict[tuple, float]] = {}
+        self.histograms: dict[str, dict[tuple, Histogram]] = {}
+        self.started: float = perf_counter()
+
+    def count(self, name: str, value: float = 1, **labels: str):
+        """Add to a counter.
+
+        Args:
+            name: name of the metric.
+            value: number to add.
+            labels: labels of the series, like player="Ale".
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        key: tuple = tuple(sorted(labels.items()))
+        with self.lock:
+            series: dict[tuple, float] = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        """Add a value to a histogram.
+
+        Args:
+            name: name of the metric.
+            value: the observed value, seconds for the standard metrics.
+            labels: labels of the series, like player="Ale".
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        key: tuple = tuple(sorted(labels.items()))
+        with self.lock:
+            series: dict[tuple, Histogram] = self.histograms.setdefault(
+                name, {})
+            if key not in series:
+                series[key] = Histogram(self.bounds)
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Observe the seconds spent inside the with block.
+
+        The duration is observed when the block raises as well.
+
+        Args:
+            name: name of the histogram.
+            labels: labels of the series, like player="Ale".
+
+        Yields:
+            None
+
+        Raises:
+            None
+        """
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start, **labels)
+
+    def reset(self):
+        """Forget everything measured so far and restart the clock.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+            self.started = perf_counter()
+
+    def snapshot(self) -> dict:
+        """Copy the metrics into a dict, safe to keep or to serialize.
+
+        Args:
+            None
+
+        Returns:
+            dict: metrics
+                {
+                    "elapsed": seconds since the creation or reset(),
+                    "moves_per_second": moves_total of all players
+                                        per elapsed second,
+                    "counters": {name: [{"labels": {...}, "value": v}]},
+                    "histograms": {name: [{
+                        "labels": {...}, "count": n, "sum": s,
+                        "buckets": [[upper bound, values up to it]],
+                    }]}
+                }
+                The last bound is None for +Inf, which JSON lacks.
+
+        Raises:
+            None
+        """
+        with self.lock:
+            elapsed: float = perf_counter() - self.started
+            counters: dict[str, list[dict]] = {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in series.items()
+                ]
+                for name, series in self.counters.items()
+            }
+            histograms: dict[str, list[dict]] = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": [
+                            [bound if bound != float("inf") else None, count]
+                            for bound, count in histogram.cumulative()
+                        ]
+                    }
+                    for key, histogram in series.items()
+                ]
+                for name, series in self.histograms.items()
+            }
+
+        moves: float = sum(
+            item["value"] for item in counters.get("moves_total", []))
+        return {
+            "elapsed": elapsed,
+            "moves_per_second": moves / elapsed if 0 < elapsed else 0.0,
+            "counters": counters,
+            "histograms": histograms
+        }
+
+    @staticmethod
+    def _labels(labels: dict, extra: Optional[tuple[str, str]] = None) -> str:
+        """Format labels as {name="value",...} of the Prometheus text."""
+        pairs: list[tuple[str, str]] = sorted(labels.items())
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value).replace("\\", "\\\\").replace('"', '\\"')
+                .replace("\n", "\\n"))
+            for name, value in pairs
+        ) + "}"
+
+    def to_prometheus(self) -> str:
+        """Format the metrics in the Prometheus text exposition format.
+
+        Args:
+            None
+
+        Returns:
+            str: metrics, one sample per line.
+
+        Raises:
+            None
+        """
+        snapshot: dict = self.snapshot()
+        lines: list[str] = []
+
+        for name, series in sorted(snapshot["counters"].items()):
+            full_name: str = self.prefix + "_" + name
+            lines.append("# TYPE " + full_name + " counter")
+            for item in series:
+                lines.append("{}{} {}".format(
+                    full_name, self._labels(item["labels"]), item["value"]))
+
+        for name, series in sorted(snapshot["histograms"].items()):
+            full_name = self.prefix + "_" + name
+            lines.append("# TYPE " + full_name + " histogram")
+            for item in series:
+                for bound, count in item["buckets"]:
+                    le: str = "+Inf" if bound is None else repr(bound)
+                    lines.append("{}_bucket{} {}".format(
+                        full_name,
+                        self._labels(item["labels"], ("le", le)),
+                        count))
+                labels: str = self._labels(item["labels"])
+                lines.append("{}_sum{} {!r}".format(
+                    full_name, labels, item["sum"]))
+                lines.append("{}_count{} {}".format(
+                    full_name, labels, item["count"]))
+
+        full_name = self.prefix + "_moves_per_second"
+        lines.append("# TYPE " + full_name + " gauge")
+        lines.append("{} {!r}".format(
+            full_name, snapshot["moves_per_second"]))
+
+        return "\n".join(lines) + "\n"
+
+    def export_json(self, path: str):
+        """Write a snapshot of the metrics to a JSON file.
+
+        Args:
+            path: path to the file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        with open(path, "w") as output:
+            json.dump(self.snapshot(), output, indent=4)
+            output.write("\n")
+
+    def export_prometheus(self, path: str):
+        """Write the metrics to a file in the Prometheus text format,
+        for example for the textfile collector of the node exporter.
+
+        Args:
+            path: path to the file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        with open(path, "w") as output:
+            output.write(self.to_prometheus())
@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING
+
+from .OutputInterface import OutputInterface
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class Output(OutputInterface):
+    """Base class for outputs.
+
+    Outputs showing the whole board on render() do not need the
+    single stones and have nothing to keep until the end of a turn,
+    so place() and flush() do nothing by default.
+    """
+
+    def place(self, board: "Board", column: int, row: int, player_id: int):
+        """Show a stone placed on the board, nothing by default.
+
+        Args:
+            board: board the stone is placed on.
+            column: index of the column of the stone.
+            row: row of the stone, 0 is the bottom row.
+            player_id: ID of the player of the stone.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        pass
+
+    def flush(self):
+        """Show everything kept so far, nothing by default.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        pass
@@ -0,0 +1,158 @@
+from typing import TYPE_CHECKING, Optional, TextIO
+
+import sys
+from collections import deque
+
+from .Output import Output
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class OutputANSI(Output):
+    """Implement a terminal output redrawing only the cells that changed.
+
+    The board is drawn in full once, then every placed stone moves
+    the cursor to its cell with ANSI escape codes and writes a single
+    symbol. The last messages are shown in a few lines under the board.
+    Everything is written to the stream at once on flush().
+
+    The board is drawn again in full when render() is given another
+    board or stones were taken back, like after Board.undo().
+
+    Args:
+        stream: where to write, the console by default.
+        n_lines: number of the last messages to show.
+
+    Attributes:
+        stream: where to write.
+        messages: the last messages.
+        parts: escape codes and text kept since the last flush().
+    """
+
+    # Clear the screen and move the cursor to the top left corner
+    CLEAR: str = "\x1b[2J\x1b[H"
+    # Move the cursor to a line and a column, counted from 1
+    MOVE: str = "\x1b[{};{}H"
+    # Clear the line of the cursor
+    CLEAR_LINE: str = "\x1b[2K"
+
+    # Lines before the first row of the board, see Board.__str__
+    TOP_LINES: int = 4
+
+    def __init__(self, stream: Optional[TextIO] = None, n_lines: int = 3):
+        """Create the output, nothing is drawn until render().
+
+        Args:
+            stream: where to write, the console by default.
+            n_lines: number of the last messages to show.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.stream: TextIO = sys.stdout if stream is None else stream
+        self.messages: deque[str] = deque(maxlen=n_lines)
+        self.parts: list[str] = []
+
+        # The board on the screen and the number of its stones drawn
+        self.board: Optional["Board"] = None
+        self.n_moves: int = 0
+        self.status_line: int = 0
+        self.status_changed: bool = False
+
+    def message(self, *args):
+        """Add the message to the lines under the board.
+
+        Args:
+            args: parts of the message.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        for line in " ".join(str(arg) for arg in args).split("\n"):
+            if line:
+                self.messages.append(line)
+        self.status_changed = True
+
+    def render(self, board: "Board"):
+        """Draw the whole board, unless it is on the screen already.
+
+        Args:
+            board: board to show.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if board is self.board and self.n_moves == len(board.column_moves):
+            return
+
+        self.parts.clear()
+        self.parts.append(self.CLEAR)
+        self.parts.append(str(board))
+        self.board = board
+        self.n_moves = len(board.column_moves)
+        self.status_line = self.TOP_LINES + board.height + 2
+        self.status_changed = True
+
+    def place(self, board: "Board", column: int, row: int, player_id: int):
+        """Write the symbol of the stone into its cell.
+
+        Args:
+            board: board the stone is placed on.
+            column: index of the column of the stone.
+            row: row of the stone, 0 is the bottom row.
+            player_id: ID of the player of the stone.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if board is not self.board or self.n_moves + 1 != len(
+                board.column_moves):
+            # not the board on the screen, render() draws it in full
+            self.board = None
+            return
+
+        self.n_moves += 1
+        self.parts.append(self.MOVE.format(
+            self.TOP_LINES + board.height - row, 2 + 2 * column))
+        self.parts.append(board.get_symbol(player_id))
+
+    def flush(self):
+        """Write the changes of the turn with a single call.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.status_changed and self.board is not None:
+            for i, line in enumerate(self.messages):
+                self.parts.append(
+                    self.MOVE.format(self.status_line + i, 1) +
+                    self.CLEAR_LINE + line)
+            self.status_changed = False
+
+        if self.parts:
+            if self.board is not None:
+                # leave the cursor under the messages
+                self.parts.append(self.MOVE.format(
+                    self.status_line + len(self.messages), 1))
+            self.stream.write("".join(self.parts))
+            self.stream.flush()
+            self.parts.clear()
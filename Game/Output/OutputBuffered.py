@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Optional, TextIO
+
+import sys
+
+from .Output import Output
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class OutputBuffered(Output):
+    """Implement keeping the output of a turn and writing it at once.
+
+    Messages and boards are joined into a single string and written
+    to the stream with a single call on flush(), once per turn.
+
+    Args:
+        stream: where to write, the console by default.
+
+    Attributes:
+        stream: where to write.
+        parts: strings kept since the last flush().
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Create an empty buffer.
+
+        Args:
+            stream: where to write, the console by default.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.stream: TextIO = sys.stdout if stream is None else stream
+        self.parts: list[str] = []
+
+    def message(self, *args):
+        """Keep the message the way print() would write it.
+
+        Args:
+            args: parts of the message.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.parts.append(" ".join(str(arg) for arg in args))
+        self.parts.append("\n")
+
+    def render(self, board: "Board"):
+        """Keep the whole board.
+
+        Args:
+            board: board to show.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.parts.append(str(board))
+        self.parts.append("\n")
+
+    def flush(self):
+        """Write everything kept with a single call.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.stream.flush()
+            self.parts.clear()
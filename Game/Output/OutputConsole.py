@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+from .Output import Output
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class OutputConsole(Output):
+    """Implement printing out everything to the console right away."""
+
+    def message(self, *args):
+        """Print the message out.
+
+        Args:
+            args: parts of the message.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        print(*args)
+
+    def render(self, board: "Board"):
+        """Print the whole board out.
+
+        Args:
+            board: board to show.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        print(board)
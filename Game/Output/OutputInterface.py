@@ -0,0 +1,79 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class OutputInterface:
+    """Abstract interface class for the outputs of the game."""
+
+    def message(self, *args):
+        """Show a message, the arguments are joined the way print() does.
+
+        Abstract method to be implemented in subclasses.
+
+        Args:
+            args: parts of the message.
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: In case users did not proved implementation
+                                 and calling the base class method
+        """
+        raise NotImplementedError
+
+    def render(self, board: "Board"):
+        """Show the board.
+
+        Abstract method to be implemented in subclasses.
+
+        Args:
+            board: board to show.
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: In case users did not proved implementation
+                                 and calling the base class method
+        """
+        raise NotImplementedError
+
+    def place(self, board: "Board", column: int, row: int, player_id: int):
+        """Show a stone placed on the board.
+
+        Abstract method to be implemented in subclasses.
+
+        Args:
+            board: board the stone is placed on.
+            column: index of the column of the stone.
+            row: row of the stone, 0 is the bottom row.
+            player_id: ID of the player of the stone.
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: In case users did not proved implementation
+                                 and calling the base class method
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Show everything kept so far, called at the end of every turn.
+
+        Abstract method to be implemented in subclasses.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: In case users did not proved implementation
+                                 and calling the base class method
+        """
+        raise NotImplementedError
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+from .Output import Output
+
+if TYPE_CHECKING:
+    from ..Board.Board import Board
+
+
+class OutputSilent(Output):
+    """Implement an output showing nothing, for automated games."""
+
+    def message(self, *args):
+        """Drop the message.
+
+        Args:
+            args: parts of the message.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        pass
+
+    def render(self, board: "Board"):
+        """Drop the board.
+
+        Args:
+            board: board to show.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        pass
@@ -1,10 +1,17 @@
 from typing import Optional
 
-from random import choice, randint
+import random
+from asyncio import sleep as async_sleep
+from random import Random
 from string import ascii_lowercase
 
 from ..Board.Board import Board
+from ..Book.OpeningBook import OpeningBook
 from ..Input.Input import Input
+from ..Metrics.MetricsRegistry import MetricsRegistry
+from ..Output.Output import Output
+from ..Output.OutputConsole import OutputConsole
+from ..Tablebase.Tablebase import Tablebase
 
 
 class Player:
@@ -14,6 +21,8 @@ class Player:
         name: String containing player's name.
         phrases: List[str] of what could be printed when player moves.
         _input: Interface to obtain user's input.
+        generator: optional random generator of the player and its input,
+                   the random module by default.
 
     Attributes:
         input: Interface to obtain user's input.
@@ -22,7 +31,18 @@ class Player:
         ID: Unique int value from 0 to 41 that determines 'color'
             of the 'stone'.
         name: String containing player's name.
+        named: False when the name was drawn at random, then every
+               set_generator() draws it again from the new generator.
         n_moves_performed: integer number of steps taken during the game.
+        quiet: when True player prints nothing and does not wait.
+        output: where the messages of the player go.
+        metrics: optional registry measuring the input and the retries.
+        generator: random generator of the name, the phrases and
+                   the decisions of the player.
+        book: optional opening book the 'computer' players consult
+              before searching.
+        tablebase: optional tablebase of late positions the 'computer'
+                   players play perfectly without searching.
 
     Methods:
         __str__(): To serialize the class for printing outputs to the console.
@@ -33,20 +53,32 @@ class Player:
         set_name(name: str): Set player name.
         get_name(): Get player name.
         get_n_moves_performed(): Get the number of move player performed.
+        set_quiet(quiet: bool): Turn printing and waiting off or on.
+        set_output(output: Output): Set where the messages go.
+        set_metrics(metrics): Measure the input in the registry.
+        set_generator(generator): Set the random generator of the player.
+        set_book(book): Set the opening book of the player.
+        lookup_book(board): Find the move of the player in the book.
+        set_tablebase(tablebase): Set the tablebase of the player.
+        lookup_tablebase(board): Find the perfect move in the tablebase.
 
         move(board): To set a stone on a board.
+        amove(board): Coroutine to set a stone on a board.
     """
 
     def __init__(self,
                  name: Optional[str] = None,
                  phrases: Optional[list[str]] = None,
-                 _input: Optional[Input] = None):
+                 _input: Optional[Input] = None,
+                 generator: Optional[Random] = None):
         """Initialize an instance of a Player base class.
 
         Args:
             name: String containing player's name.
             phrases: List[str] of what could be printed when player moves.
             _input: Interface to obtain user's input.
+            generator: optional random generator of the player and its
+                       input, the random module by default.
 
         Returns:
             None
@@ -58,11 +90,22 @@ class Player:
         self.symbol: Optional[str] = None
         self.phrases: Optional[list[str]] = phrases
         self.ID: int = -1
+        self.quiet: bool = False
+        self.output: Output = OutputConsole()
+        self.metrics: Optional[MetricsRegistry] = None
 
-        if name is None:
+        self.book: Optional[OpeningBook] = None
+        self.tablebase: Optional[Tablebase] = None
+
+        self.named: bool = name is not None
+        self.name: str = "" if name is None else name
+
+        # The random module has all the methods of a Random
+        self.generator: Random = random
+        if generator is not None:
+            self.set_generator(generator)
+        elif name is None:
             self.name = self._generate_random_name()
-        else:
-            self.name = name
 
     def __str__(self) -> str:
         """Constructor
@@ -85,7 +128,7 @@ class Player:
             about += " #" + str(self.ID) + " "
 
         if self.phrases is not None:
-            about += " '" + choice(self.phrases) + "'"
+            about += " '" + self.generator.choice(self.phrases) + "'"
         return about
 
     def _generate_random_name(self) -> str:
@@ -100,9 +143,10 @@ class Player:
         Raises:
             None
         """
-        name_length: int = randint(1, 10)
+        name_length: int = self.generator.randint(1, 10)
         letters: str = ascii_lowercase
-        name: str = ''.join(choice(letters) for i in range(name_length))
+        name: str = ''.join(
+            self.generator.choice(letters) for i in range(name_length))
         return name
 
     def set_ID(self, _id: int):
@@ -160,10 +204,150 @@ class Player:
             None
         """
         self.name = name
+        self.named = True
+
+    def set_quiet(self, quiet: bool):
+        """Turn printing and waiting off or on.
+
+        Quiet players are used to simulate many games in a row
+        as fast as possible.
+
+        Args:
+            quiet: when True player prints nothing and does not wait.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.quiet = quiet
+
+    def set_output(self, output: Output):
+        """Set where the messages of the player go.
+
+        Args:
+            output: output of the game, like OutputConsole.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.output = output
+
+    def set_metrics(self, metrics: Optional[MetricsRegistry]):
+        """Measure the input and count the retries in the registry,
+        or stop measuring with None.
+
+        Args:
+            metrics: registry of the game, or None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.metrics = metrics
+
+    def set_generator(self, generator: Random):
+        """Set the random generator of the player and of its input.
+
+        Give every player a generator of its own, see Seed.SeedSequence,
+        to play the same games again and to keep the threads of the
+        players off a shared generator. A player without a given name
+        draws a new one from the generator, so the names are the same
+        every time too.
+
+        Args:
+            generator: random generator, like random.Random(seed).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.generator = generator
+        if not self.named:
+            self.name = self._generate_random_name()
+        if self.input is not None:
+            self.input.set_generator(generator)
+
+    def set_book(self, book: Optional[OpeningBook]):
+        """Set the opening book, or stop consulting it with None.
+
+        Args:
+            book: opening book of the board of the game, or None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.book = book
+
+    def lookup_book(self, board: Board) -> Optional[tuple[int, int, int]]:
+        """Find the move of the player in the opening book.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            Optional[tuple[int, int, int]]: column, its score and depth
+                                            of the search, None without
+                                            a book or when not found.
+
+        Raises:
+            None
+        """
+        if self.book is None:
+            return None
+        return self.book.lookup(board, self.ID)
+
+    def set_tablebase(self, tablebase: Optional[Tablebase]):
+        """Set the tablebase, or stop consulting it with None.
+
+        Args:
+            tablebase: tablebase of the board of the game, or None.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.tablebase = tablebase
+
+    def lookup_tablebase(self,
+                         board: Board) -> Optional[tuple[int, int, int]]:
+        """Find the perfect move of the player in the tablebase.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            Optional[tuple[int, int, int]]: column, WIN, DRAW or LOSS and
+                                            the distance in moves, None
+                                            without a tablebase or when
+                                            the position is not in it.
+
+        Raises:
+            None
+        """
+        if self.tablebase is None:
+            return None
+        return self.tablebase.best_move(board, self.ID)
 
     def move(self, board: Board):
         """Place a stone on the board.
 
+        The input is asked again until it gives a column that is on the
+        board and not full, so no turn is lost on a full column.
+
         Args:
             board: A board class implementing the game functions.
 
@@ -171,7 +355,9 @@ class Player:
             None
 
         Raises:
-            None
+            ValueError: If there is no input.
+            ValueError: If all the columns are full.
+            ValueError: Same as Board.apply().
         """
         # Attempt to get player input
         if self.input is None:
@@ -184,19 +370,51 @@ class Player:
         #         type(self.input)
         #     )
 
-        column: int = self.input.get_int()
+        # A loop and not a recursion, a random input could miss
+        # many times in a row on a tall board with few open columns
+        while True:
+            column: int
+            if self.metrics is None:
+                column = self.input.get_int()
+            else:
+                with self.metrics.timer("input_seconds", player=self.name):
+                    column = self.input.get_int()
+
+            # Only a column off the board or full is asked again,
+            # anything else going wrong in apply() is not for the input
+            if board.is_open(column):
+                board.apply(column, self.ID, self.name)
+                return
+
+            if not self.quiet:
+                self.output.message(
+                    "Cannot play column",
+                    column,
+                    "it should be integer between 0 and",
+                    board.get_width()-1,
+                    "and not full"
+                )
+            if self.metrics is not None:
+                self.metrics.count("player_retries_total", player=self.name)
+            if not board.open_columns:
+                raise ValueError("All the columns are full, no legal moves")
+
+    async def amove(self, board: Board):
+        """Place a stone on the board inside an asyncio event loop.
+
+        Gives the other coroutines of the loop a turn first and then calls
+        move(), which is fine for players deciding in no time. Players
+        waiting for something, like a delay or an input, override it to
+        await instead of blocking the loop.
 
-        # Attempt to place a stone
-        try:
-            board.apply(column, self.ID, self.name)
+        Args:
+            board: A board class implementing the game functions.
 
-        except Exception as e:
-            print(
-                "Cannot play column",
-                column,
-                "it should be integer between 0 and",
-                board.get_width()-1
-            )
+        Returns:
+            None
 
-            print(e)
-            self.move(board)
+        Raises:
+            None
+        """
+        await async_sleep(0)
+        self.move(board)
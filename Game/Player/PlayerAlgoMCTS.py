@@ -0,0 +1,160 @@
+from typing import Optional
+
+from random import Random
+
+from .Player import Player
+from ..Board.Board import Board
+from ..Search.MCTS import MCTS
+
+
+class PlayerAlgoMCTS(Player):
+    """Implement a 'computer' player running a Monte Carlo tree search.
+
+    Plays random games from the positions of a growing tree and picks the
+    column visited the most, so it needs no evaluation of the positions
+    and works for any board size and any number of players. Random games
+    are played in a pool of worker processes, the strength grows with
+    the number of workers and the budgets of a move.
+
+    The tree is kept between moves and reused after the moves of the
+    other players. Positions of the opening book, see set_book(), and of
+    the tablebase, see set_tablebase(), are played without searching.
+    Call close() to stop the worker processes.
+
+    Args:
+        name: string name of a player.
+        time_budget: wall-clock time per move in milliseconds.
+        max_iterations: optional limit of tree nodes added per move.
+        workers: number of processes, None for one per core,
+                 0 to play in the process of the game.
+        batch: random games played from every new node.
+        seed: optional seed of the random games, replaced by the one
+              of the generator given to set_generator().
+
+    Attributes:
+        time_budget: wall-clock time per move in milliseconds.
+        max_iterations: optional limit of tree nodes added per move.
+        search: the tree search kept between moves.
+
+    Methods:
+        Inherited from Player
+        choose(board): Find the column to play.
+        set_generator(generator): Seed the random games from a generator.
+        close(): Stop the worker processes.
+    """
+
+    def __init__(self,
+                 name: Optional[str] = None,
+                 time_budget: int = 1000,
+                 max_iterations: Optional[int] = None,
+                 workers: Optional[int] = None,
+                 batch: int = 8,
+                 seed: Optional[int] = None):
+        """Initialize the tree searching 'computer' player.
+
+        Args:
+            name: string name of a player.
+            time_budget: wall-clock time per move in milliseconds.
+            max_iterations: optional limit of tree nodes added per move.
+            workers: number of processes, None for one per core,
+                     0 to play in the process of the game.
+            batch: random games played from every new node.
+            seed: optional seed of the random games.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If time_budget or max_iterations is not positive.
+        """
+        super().__init__(
+            name=name,
+            phrases=None,
+            _input=None
+        )
+
+        if time_budget <= 0:
+            raise ValueError(
+                "Time budget should be a positive number of milliseconds" +
+                ", and not", time_budget)
+        if max_iterations is not None and max_iterations <= 0:
+            raise ValueError(
+                "Iterations should be a positive number, and not",
+                max_iterations)
+
+        self.time_budget: int = time_budget
+        self.max_iterations: Optional[int] = max_iterations
+        self.search: MCTS = MCTS(workers=workers, batch=batch, seed=seed)
+
+    def set_generator(self, generator: Random):
+        """Set the random generator and seed the random games from it.
+
+        With max_iterations and a seeded generator, like the ones of the
+        seed of a Game, the search is the same every time, otherwise the
+        time budget decides how many games are played.
+
+        Args:
+            generator: random generator, like random.Random(seed).
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().set_generator(generator)
+        self.search.generator = Random(generator.getrandbits(64))
+
+    def choose(self, board: Board) -> int:
+        """Find the column to play.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            int: index of the column.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        found: Optional[tuple[int, int, int]] = \
+            self.lookup_tablebase(board)
+        if found is None:
+            found = self.lookup_book(board)
+        if found is not None:
+            return found[0]
+
+        return self.search.search(
+            board,
+            self.ID,
+            self.time_budget,
+            self.max_iterations
+        )
+
+    def move(self, board: Board):
+        """Place a stone into the most promising column.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        board.apply(self.choose(board), self.ID, self.name)
+
+    def close(self):
+        """Stop the worker processes of the search.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.search.close()
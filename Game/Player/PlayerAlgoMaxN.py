@@ -0,0 +1,125 @@
+from typing import Optional
+
+from time import perf_counter
+
+from .Player import Player
+from ..Board.Board import Board
+from ..Search.MaxN import MaxN
+
+
+class PlayerAlgoMaxN(Player):
+    """Implement a 'computer' player searching games of many players.
+
+    Runs MaxN, with every player after its own values, or paranoid,
+    with all the other players against this one, see MaxN, and deepens
+    the search one ply at a time until the time budget of the move is
+    over. Positions are valued by the lines every player could still
+    complete, so the player blocks the lines of whoever is closest to
+    a win and answers within time_budget however many seats are taken.
+
+    Players are expected to take turns in order of their IDs, as in
+    the boring game. With two players the paranoid search is plain
+    alpha-beta, and positions of the opening book and of the tablebase
+    are played without searching.
+
+    Args:
+        name: string name of a player.
+        algorithm: MaxN.MAXN or MaxN.PARANOID.
+        time_budget: wall-clock time per move in milliseconds.
+        max_depth: optional limit of plies to search.
+
+    Attributes:
+        algorithm: MaxN.MAXN or MaxN.PARANOID.
+        time_budget: wall-clock time per move in milliseconds.
+        max_depth: optional limit of plies to search.
+        last_depth: depth of the last finished iteration of the last move.
+        last_score: value of the last move for the player, see MaxN.
+
+    Methods:
+        Inherited from Player
+        choose(board): Find the column to play.
+    """
+
+    def __init__(self,
+                 name: Optional[str] = None,
+                 algorithm: str = MaxN.MAXN,
+                 time_budget: int = 1000,
+                 max_depth: Optional[int] = None):
+        """Initialize the searching 'computer' player.
+
+        Args:
+            name: string name of a player.
+            algorithm: MaxN.MAXN or MaxN.PARANOID.
+            time_budget: wall-clock time per move in milliseconds.
+            max_depth: optional limit of plies to search.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the algorithm is not MAXN or PARANOID.
+            ValueError: If time_budget is not positive.
+        """
+        super().__init__(
+            name=name,
+            phrases=None,
+            _input=None
+        )
+
+        if algorithm not in MaxN.ALGORITHMS:
+            raise ValueError(
+                "Algorithm should be one of", MaxN.ALGORITHMS,
+                ", and not", algorithm)
+        if time_budget <= 0:
+            raise ValueError(
+                "Time budget should be a positive number of milliseconds" +
+                ", and not", time_budget)
+
+        self.algorithm: str = algorithm
+        self.time_budget: int = time_budget
+        self.max_depth: Optional[int] = max_depth
+        self.last_depth: int = 0
+        self.last_score: int = 0
+
+    def choose(self, board: Board) -> int:
+        """Find the column to play.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            int: index of the column.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        found: Optional[tuple[int, int, int]] = \
+            self.lookup_tablebase(board)
+        if found is None:
+            found = self.lookup_book(board)
+        if found is not None:
+            return found[0]
+
+        # Counting the stones of a large board on its lines takes a
+        # while, it comes out of the time of the move too
+        start: float = perf_counter()
+        search: MaxN = MaxN(board, self.ID, self.algorithm)
+        column, self.last_score, self.last_depth = search.search(
+            self.time_budget - (perf_counter() - start) * 1000,
+            self.max_depth
+        )
+        return column
+
+    def move(self, board: Board):
+        """Place a stone into the best column found in time.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        board.apply(self.choose(board), self.ID, self.name)
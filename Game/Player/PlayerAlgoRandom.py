@@ -1,7 +1,8 @@
 from typing import Optional
 
+from asyncio import sleep as async_sleep
 from time import sleep
-from random import randint
+from random import Random
 
 from .Player import Player
 from ..Input.InputAlgoRandom import InputAlgoRandom
@@ -15,6 +16,8 @@ class PlayerAlgoRandom(Player):
         n_moves: number of possible moves from range {0 .. n_moves}.
         name: string name of a player
         max_sleep: maximum sleep delay in milliseconds
+        generator: optional random generator of the moves and the delays,
+                   the random module by default.
 
     Attributes:
         Inherited from Player
@@ -26,12 +29,16 @@ class PlayerAlgoRandom(Player):
     def __init__(self,
                  n_moves: int,
                  name: Optional[str] = None,
-                 max_sleep: int = 1000):
+                 max_sleep: int = 1000,
+                 generator: Optional[Random] = None):
         """Initialize the random 'compiuter' player.
 
         Args:
             n_moves: number of possible moves from range {0 .. n_moves}.
             name: string name of a player
+            max_sleep: maximum sleep delay in milliseconds
+            generator: optional random generator of the moves and
+                       the delays, the random module by default.
 
         Returns:
             None
@@ -42,7 +49,8 @@ class PlayerAlgoRandom(Player):
         super().__init__(
             name=name,
             phrases=None,
-            _input=InputAlgoRandom(n_moves)
+            _input=InputAlgoRandom(n_moves),
+            generator=generator
         )
 
         self.max_sleep = max_sleep
@@ -60,5 +68,24 @@ class PlayerAlgoRandom(Player):
             ConnectionError: If no available port is found.
         """
         # some delay of 0 to 1000ms to make algo feel like 'making a decision'
-        sleep(randint(0, self.max_sleep) / 1000)
+        if not self.quiet and 0 < self.max_sleep:
+            sleep(self.generator.randint(0, self.max_sleep) / 1000)
         super().move(board)
+
+    async def amove(self, board: Board):
+        """Place the stone after awaiting the delay instead of sleeping.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        delay: float = 0
+        if not self.quiet and 0 < self.max_sleep:
+            delay = self.generator.randint(0, self.max_sleep) / 1000
+        await async_sleep(delay)
+        Player.move(self, board)
@@ -0,0 +1,95 @@
+from typing import Optional
+
+from asyncio import sleep as async_sleep
+from random import Random
+from time import sleep
+
+from .Player import Player
+from ..Input.InputAlgoRandomLegal import InputAlgoRandomLegal
+from ..Board.Board import Board
+
+
+class PlayerAlgoRandomLegal(Player):
+    """Implement a 'computer' player making random legal moves.
+
+    The same as PlayerAlgoRandom, but the columns are picked among the
+    columns that are not full, so every move takes constant time and
+    the input is never asked twice.
+
+    Args:
+        name: string name of a player.
+        max_sleep: maximum sleep delay in milliseconds.
+        generator: optional random generator of the moves and the delays,
+                   the random module by default.
+
+    Attributes:
+        Inherited from Player
+        max_sleep: maximum sleep delay in milliseconds.
+
+    Methods:
+        Inherited from Player
+    """
+
+    def __init__(self,
+                 name: Optional[str] = None,
+                 max_sleep: int = 1000,
+                 generator: Optional[Random] = None):
+        """Initialize the random legal 'computer' player.
+
+        Args:
+            name: string name of a player.
+            max_sleep: maximum sleep delay in milliseconds.
+            generator: optional random generator of the moves and
+                       the delays, the random module by default.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().__init__(
+            name=name,
+            phrases=None,
+            _input=InputAlgoRandomLegal(),
+            generator=generator
+        )
+
+        self.max_sleep: int = max_sleep
+
+    def move(self, board: Board):
+        """Place the stone into a random column that is not full.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If all the columns are full.
+        """
+        # some delay to make algo feel like 'making a decision'
+        if not self.quiet and 0 < self.max_sleep:
+            sleep(self.generator.randint(0, self.max_sleep) / 1000)
+        self.input.board = board
+        super().move(board)
+
+    async def amove(self, board: Board):
+        """Place the stone after awaiting the delay instead of sleeping.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If all the columns are full.
+        """
+        delay: float = 0
+        if not self.quiet and 0 < self.max_sleep:
+            delay = self.generator.randint(0, self.max_sleep) / 1000
+        await async_sleep(delay)
+        self.input.board = board
+        Player.move(self, board)
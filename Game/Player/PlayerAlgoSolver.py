@@ -0,0 +1,135 @@
+from typing import Optional
+
+from .Player import Player
+from ..Board.Board import Board
+from ..Search.Negamax import Negamax
+from ..Search.TranspositionTable import TranspositionTable
+
+
+class PlayerAlgoSolver(Player):
+    """Implement a 'computer' player searching for the best move.
+
+    Runs negamax with alpha-beta pruning, trying central columns first,
+    and deepens the search one ply at a time until the time budget of
+    the move is over. The move of the last fully searched depth is played,
+    so the latency of a move is bounded by time_budget and the strength
+    grows with the CPU time given.
+
+    Every other player is treated as a single opponent, which is exact
+    for two players.
+
+    Evaluated positions are kept in a TranspositionTable between moves,
+    the table never takes more than table_memory bytes. Positions of the
+    opening book, see set_book(), and of the tablebase, see
+    set_tablebase(), are played without searching.
+
+    Args:
+        name: string name of a player.
+        time_budget: wall-clock time per move in milliseconds.
+        max_depth: optional limit of plies to search.
+        table_memory: memory for the table of positions in bytes,
+                      0 to search without the table.
+
+    Attributes:
+        time_budget: wall-clock time per move in milliseconds.
+        max_depth: optional limit of plies to search.
+        table: table of evaluated positions or None.
+        last_depth: depth of the last finished iteration of the last move.
+        last_score: score of the last move, see Negamax.
+
+    Methods:
+        Inherited from Player
+        choose(board): Find the column to play.
+    """
+
+    def __init__(self,
+                 name: Optional[str] = None,
+                 time_budget: int = 1000,
+                 max_depth: Optional[int] = None,
+                 table_memory: int = 16 << 20):
+        """Initialize the searching 'computer' player.
+
+        Args:
+            name: string name of a player.
+            time_budget: wall-clock time per move in milliseconds.
+            max_depth: optional limit of plies to search.
+            table_memory: memory for the table of positions in bytes,
+                          0 to search without the table.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If time_budget is not positive.
+        """
+        super().__init__(
+            name=name,
+            phrases=None,
+            _input=None
+        )
+
+        if time_budget <= 0:
+            raise ValueError(
+                "Time budget should be a positive number of milliseconds" +
+                ", and not", time_budget)
+
+        self.time_budget: int = time_budget
+        self.max_depth: Optional[int] = max_depth
+        self.last_depth: int = 0
+        self.last_score: int = 0
+
+        self.table: Optional[TranspositionTable] = None
+        if 0 < table_memory:
+            self.table = TranspositionTable(table_memory)
+
+    def choose(self, board: Board) -> int:
+        """Find the column to play.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            int: index of the column.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        found: Optional[tuple[int, int, int]] = \
+            self.lookup_tablebase(board)
+        if found is not None:
+            # the score the search would find with the depth to the end
+            column, result, self.last_depth = found
+            self.last_score = \
+                result * (Negamax.WIN_SCORE - self.last_depth)
+            return column
+
+        found = self.lookup_book(board)
+        if found is not None:
+            column, self.last_score, self.last_depth = found
+            return column
+
+        # With two players the keys of the search match the Board keys,
+        # otherwise the rest of the players share one set of numbers
+        opponent_id: int = (self.ID + 1) % max(2, board.i_symbol)
+        search: Negamax = Negamax(board, self.ID, opponent_id, self.table)
+        column, self.last_score, self.last_depth = search.search(
+            board.masks[self.ID],
+            board.mask,
+            self.time_budget,
+            self.max_depth
+        )
+        return column
+
+    def move(self, board: Board):
+        """Place a stone into the best column found in time.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        board.apply(self.choose(board), self.ID, self.name)
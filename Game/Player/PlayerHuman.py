@@ -1,5 +1,7 @@
 from typing import Optional
 
+from asyncio import to_thread
+
 from .Player import Player
 from ..Input.InputConsole import InputConsole
 from ..Board.Board import Board
@@ -55,3 +57,17 @@ class PlayerHuman(Player):
             None
         """
         super().move(board)
+
+    async def amove(self, board: Board):
+        """Wait for the console input in a thread, not blocking the loop.
+
+        Args:
+            board: A board class implementing the game functions.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        await to_thread(self.move, board)
@@ -0,0 +1,284 @@
+from typing import BinaryIO, Optional
+
+from ..Board.Board import Board
+
+
+class GameRecord:
+    """Moves of a single game, columns and seats, and its winner.
+
+    A record is packed into a few bits per move: the column takes
+    enough bits for the width of the board and the seat - the ID of the
+    player - enough bits for the number of players. When the players
+    moved in order of their seats, as in the boring play(), the seats
+    are not stored at all.
+
+    Packed record:
+        varint: number of moves << 1 | 1 if the seats are in order
+        varint: ID of the winner + 1, 0 if nobody won
+        bytes:  moves, little-endian bits, the column of a move first
+                and its seat next, padded to a whole byte
+
+    Args:
+        columns: column of every move.
+        seats: ID of the player of every move.
+        winner: ID of the winner, -1 if nobody won.
+
+    Attributes:
+        columns: column of every move.
+        seats: ID of the player of every move.
+        winner: ID of the winner, -1 if nobody won.
+
+    Methods:
+        from_board(board): Record of the moves made on a board.
+        pack(width, n_players): Pack the record into bytes.
+        unpack_from(buffer, offset, width, n_players): Unpack from bytes.
+        read(stream, width, n_players): Read the next record of a stream.
+    """
+
+    def __init__(self,
+                 columns: list[int],
+                 seats: list[int],
+                 winner: int = -1):
+        """Create a record of the moves.
+
+        Args:
+            columns: column of every move.
+            seats: ID of the player of every move.
+            winner: ID of the winner, -1 if nobody won.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are not as many seats as columns.
+        """
+        if len(columns) != len(seats):
+            raise ValueError(
+                "Every move needs a column and a seat, but there are",
+                len(columns), "columns and", len(seats), "seats")
+
+        self.columns: list[int] = columns
+        self.seats: list[int] = seats
+        self.winner: int = winner
+
+    def __eq__(self, other: object) -> bool:
+        """Records are equal when the moves and the winners are."""
+        if not isinstance(other, GameRecord):
+            return NotImplemented
+        return (self.columns == other.columns and
+                self.seats == other.seats and
+                self.winner == other.winner)
+
+    @classmethod
+    def from_board(cls, board: Board) -> "GameRecord":
+        """Record the moves made on a board so far.
+
+        Args:
+            board: board to record.
+
+        Returns:
+            GameRecord: record of the moves and the winner of the board.
+
+        Raises:
+            None
+        """
+        return cls(
+            list(board.column_moves),
+            list(board.player_moves),
+            board.winner
+        )
+
+    @staticmethod
+    def bits(n_values: int) -> int:
+        """Number of bits to store one of n_values values."""
+        return (n_values - 1).bit_length()
+
+    def pack(self, width: int, n_players: int) -> bytes:
+        """Pack the record into bytes.
+
+        Args:
+            width: width of the board.
+            n_players: number of players.
+
+        Returns:
+            bytes: the packed record.
+
+        Raises:
+            ValueError: If a column or a seat does not fit in the bits.
+        """
+        in_order: bool = all(
+            seat == i % n_players for i, seat in enumerate(self.seats)
+        )
+        column_bits: int = self.bits(width)
+        seat_bits: int = 0 if in_order else self.bits(n_players)
+        move_bits: int = column_bits + seat_bits
+
+        # Bits of the moves go through a small accumulator,
+        # whole bytes leave it as soon as they are filled
+        data: bytearray = bytearray()
+        bits: int = 0
+        n_bits: int = 0
+        for column, seat in zip(self.columns, self.seats):
+            if not 0 <= column < width:
+                raise ValueError(
+                    "Column should be from 0 to", width - 1,
+                    ", and not", column)
+            if not 0 <= seat < n_players:
+                raise ValueError(
+                    "Seat should be from 0 to", n_players - 1,
+                    ", and not", seat)
+            if in_order:
+                seat = 0
+            bits |= (seat << column_bits | column) << n_bits
+            n_bits += move_bits
+            while 8 <= n_bits:
+                data.append(bits & 0xff)
+                bits >>= 8
+                n_bits -= 8
+        if 0 < n_bits:
+            data.append(bits)
+
+        return (
+            self._varint(len(self.columns) << 1 | in_order) +
+            self._varint(self.winner + 1) +
+            bytes(data)
+        )
+
+    @staticmethod
+    def _varint(value: int) -> bytes:
+        """Pack a non-negative integer into 7 bits per byte."""
+        data: bytearray = bytearray()
+        while 0x7f < value:
+            data.append(value & 0x7f | 0x80)
+            value >>= 7
+        data.append(value)
+        return bytes(data)
+
+    @classmethod
+    def _unpack_moves(cls,
+                      n_moves: int,
+                      in_order: bool,
+                      winner: int,
+                      data: bytes,
+                      width: int,
+                      n_players: int) -> "GameRecord":
+        """Unpack the moves from the bytes after the varints."""
+        column_bits: int = cls.bits(width)
+        seat_bits: int = 0 if in_order else cls.bits(n_players)
+        move_bits: int = column_bits + seat_bits
+        column_mask: int = (1 << column_bits) - 1
+        seat_mask: int = (1 << seat_bits) - 1
+
+        columns: list[int] = []
+        seats: list[int] = []
+        bits: int = 0
+        n_bits: int = 0
+        i_byte: int = 0
+        for i in range(0, n_moves):
+            while n_bits < move_bits:
+                bits |= data[i_byte] << n_bits
+                i_byte += 1
+                n_bits += 8
+            columns.append(bits & column_mask)
+            seats.append(bits >> column_bits & seat_mask)
+            bits >>= move_bits
+            n_bits -= move_bits
+
+        if in_order:
+            seats = [i % n_players for i in range(0, n_moves)]
+
+        return cls(columns, seats, winner)
+
+    @classmethod
+    def unpack_from(cls,
+                    buffer: bytes,
+                    offset: int,
+                    width: int,
+                    n_players: int) -> tuple["GameRecord", int]:
+        """Unpack a record from a buffer, like an mmap of an archive.
+
+        Args:
+            buffer: bytes holding the record.
+            offset: position of the record in the buffer.
+            width: width of the board.
+            n_players: number of players.
+
+        Returns:
+            tuple: (the record, position right after it)
+
+        Raises:
+            ValueError: If the buffer ends in the middle of the record.
+        """
+        values: list[int] = []
+        for i in range(0, 2):
+            value: int = 0
+            shift: int = 0
+            while True:
+                if len(buffer) <= offset:
+                    raise ValueError("Record is cut at", offset)
+                byte: int = buffer[offset]
+                offset += 1
+                value |= (byte & 0x7f) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            values.append(value)
+
+        n_moves: int = values[0] >> 1
+        in_order: bool = bool(values[0] & 1)
+        move_bits: int = cls.bits(width) + (
+            0 if in_order else cls.bits(n_players))
+        end: int = offset + (n_moves * move_bits + 7) // 8
+        if len(buffer) < end:
+            raise ValueError("Record is cut at", len(buffer))
+
+        record: GameRecord = cls._unpack_moves(
+            n_moves, in_order, values[1] - 1,
+            bytes(buffer[offset:end]), width, n_players)
+        return record, end
+
+    @classmethod
+    def read(cls,
+             stream: BinaryIO,
+             width: int,
+             n_players: int) -> Optional["GameRecord"]:
+        """Read the next record from a stream.
+
+        Args:
+            stream: binary stream positioned at a record.
+            width: width of the board.
+            n_players: number of players.
+
+        Returns:
+            GameRecord: the record, None at the end of the stream.
+
+        Raises:
+            ValueError: If the stream ends in the middle of the record.
+        """
+        values: list[int] = []
+        for i in range(0, 2):
+            value: int = 0
+            shift: int = 0
+            while True:
+                byte: bytes = stream.read(1)
+                if not byte:
+                    if i == 0 and shift == 0:
+                        return None
+                    raise ValueError("Record is cut at the end of the stream")
+                value |= (byte[0] & 0x7f) << shift
+                shift += 7
+                if byte[0] < 0x80:
+                    break
+            values.append(value)
+
+        n_moves: int = values[0] >> 1
+        in_order: bool = bool(values[0] & 1)
+        move_bits: int = cls.bits(width) + (
+            0 if in_order else cls.bits(n_players))
+        n_bytes: int = (n_moves * move_bits + 7) // 8
+        data: bytes = stream.read(n_bytes)
+        if len(data) < n_bytes:
+            raise ValueError("Record is cut at the end of the stream")
+
+        return cls._unpack_moves(
+            n_moves, in_order, values[1] - 1, data, width, n_players)
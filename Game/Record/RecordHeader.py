@@ -0,0 +1,127 @@
+from typing import BinaryIO
+
+from struct import Struct
+
+
+class RecordHeader:
+    """Header of an archive of game records: the board and the players.
+
+    Packed header:
+        4 bytes: MAGIC
+        1 byte:  VERSION
+        3 x 2 bytes: width, height, line_length, little-endian
+        1 byte:  number of players
+        per player: 1 byte of length and the name in UTF-8
+
+    Args:
+        width: width of the board.
+        height: height of the board.
+        line_length: length of a winning line.
+        names: names of the players, in order of their IDs.
+
+    Attributes:
+        width, height, line_length, names: as given.
+        n_players: number of players.
+
+    Methods:
+        pack(): Pack the header into bytes.
+        read(stream): Read the header from the start of a stream.
+    """
+
+    MAGIC: bytes = b"C4GR"
+    VERSION: int = 1
+    FORMAT: Struct = Struct("<4sBHHHB")
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 names: list[str]):
+        """Describe the games of an archive.
+
+        Args:
+            width: width of the board.
+            height: height of the board.
+            line_length: length of a winning line.
+            names: names of the players, in order of their IDs.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no players or more than 255 of them.
+        """
+        if not 0 < len(names) < 256:
+            raise ValueError(
+                "Number of players should be from 1 to 255, and not",
+                len(names))
+
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.names: list[str] = list(names)
+        self.n_players: int = len(names)
+
+    def __eq__(self, other: object) -> bool:
+        """Headers are equal when they describe the same games."""
+        if not isinstance(other, RecordHeader):
+            return NotImplemented
+        return self.pack() == other.pack()
+
+    def pack(self) -> bytes:
+        """Pack the header into bytes.
+
+        Args:
+            None
+
+        Returns:
+            bytes: the packed header.
+
+        Raises:
+            None
+        """
+        data: bytearray = bytearray(self.FORMAT.pack(
+            self.MAGIC, self.VERSION,
+            self.width, self.height, self.line_length, self.n_players
+        ))
+        for name in self.names:
+            # cut on a whole character, the name is decoded on reading
+            encoded: bytes = name.encode("utf-8")[:255].decode(
+                "utf-8", "ignore").encode("utf-8")
+            data.append(len(encoded))
+            data += encoded
+        return bytes(data)
+
+    @classmethod
+    def read(cls, stream: BinaryIO) -> "RecordHeader":
+        """Read the header from the start of a stream.
+
+        Args:
+            stream: binary stream at the start of an archive.
+
+        Returns:
+            RecordHeader: the header, the stream is left after it.
+
+        Raises:
+            ValueError: If the stream is not an archive of game records.
+        """
+        data: bytes = stream.read(cls.FORMAT.size)
+        if len(data) < cls.FORMAT.size:
+            raise ValueError("Archive is too short for a header", len(data))
+
+        magic, version, width, height, line_length, n_players = (
+            cls.FORMAT.unpack(data))
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(
+                "Not an archive of game records of version", cls.VERSION,
+                ", but", magic, version)
+
+        names: list[str] = []
+        for i in range(0, n_players):
+            length: bytes = stream.read(1)
+            name: bytes = stream.read(length[0]) if length else b""
+            if not length or len(name) < length[0]:
+                raise ValueError("Header is cut at the name of player", i)
+            names.append(name.decode("utf-8"))
+
+        return cls(width, height, line_length, names)
@@ -0,0 +1,121 @@
+from typing import Optional
+
+import os
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+
+
+class RecordIndex:
+    """Offsets of the games of an archive, read through mmap.
+
+    The index is a file of 8 byte little-endian offsets, one per game
+    in order of the games, so the offset of any game is a single read
+    of the mapped memory. RecordWriter appends to the index as it
+    writes the games, build() recreates it from an archive.
+
+    Args:
+        path: path to the index file.
+
+    Attributes:
+        path: path to the index file.
+
+    Methods:
+        offset(i_game): Offset of a game in the archive.
+        build(path, index_path): Write the index of an archive.
+        close(): Unmap and close the index file.
+    """
+
+    OFFSET: Struct = Struct("<Q")
+    SUFFIX: str = ".idx"
+
+    def __init__(self, path: str):
+        """Map the index file into memory.
+
+        Args:
+            path: path to the index file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be opened.
+        """
+        self.path: str = path
+        self.file = open(path, "rb")
+
+        # An empty file could not be mapped, and has no offsets anyway
+        self.memory: Optional[mmap] = None
+        self.size: int = os.fstat(self.file.fileno()).st_size
+        if 0 < self.size:
+            self.memory = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+
+    def __len__(self) -> int:
+        """Number of games in the index."""
+        return self.size // self.OFFSET.size
+
+    def offset(self, i_game: int) -> int:
+        """Get the offset of a game in the archive.
+
+        Args:
+            i_game: number of the game, from 0.
+
+        Returns:
+            int: position of the game record in the archive.
+
+        Raises:
+            IndexError: If there is no such game.
+        """
+        if not 0 <= i_game < len(self):
+            raise IndexError(
+                "Game number should be from 0 to", len(self) - 1,
+                ", and not", i_game)
+        return self.OFFSET.unpack_from(
+            self.memory, i_game * self.OFFSET.size)[0]
+
+    def close(self):
+        """Unmap and close the index file.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.memory is not None:
+            self.memory.close()
+            self.memory = None
+        self.file.close()
+
+    @classmethod
+    def build(cls, path: str, index_path: Optional[str] = None) -> int:
+        """Scan an archive and write the offsets of its games.
+
+        Args:
+            path: path to the archive.
+            index_path: path to the index, path + SUFFIX by default.
+
+        Returns:
+            int: number of the games found.
+
+        Raises:
+            ValueError: If the archive is broken.
+        """
+        # Late import, the reader uses the index itself
+        from .RecordReader import RecordReader
+
+        if index_path is None:
+            index_path = path + cls.SUFFIX
+
+        n_games: int = 0
+        with open(index_path, "wb") as index:
+            reader: RecordReader = RecordReader(path, use_index=False)
+            try:
+                for offset in reader.offsets():
+                    index.write(cls.OFFSET.pack(offset))
+                    n_games += 1
+            finally:
+                reader.close()
+        return n_games
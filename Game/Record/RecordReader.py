@@ -0,0 +1,167 @@
+from typing import BinaryIO, Iterator, Optional
+
+import os
+from mmap import mmap, ACCESS_READ
+
+from .GameRecord import GameRecord
+from .RecordHeader import RecordHeader
+from .RecordIndex import RecordIndex
+
+
+class RecordReader:
+    """Read the games of an archive one after another or by number.
+
+    Iterating over the reader streams the records from the file, one
+    at a time, in constant memory. read(i_game) maps the archive into
+    memory and finds the game by the index, path + RecordIndex.SUFFIX,
+    built on the fly when there is none.
+
+    Args:
+        path: path to the archive.
+        use_index: False to not use or build the index.
+
+    Attributes:
+        path: path to the archive.
+        header: board and players of the games.
+
+    Methods:
+        read(i_game): Read a game by its number.
+        offsets(): Offsets of the games, scanning the archive.
+        close(): Close the files.
+    """
+
+    def __init__(self, path: str, use_index: bool = True):
+        """Open the archive and read its header.
+
+        Args:
+            path: path to the archive.
+            use_index: False to not use or build the index.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the file is not an archive of game records.
+        """
+        self.path: str = path
+        self.index_path: Optional[str] = None
+        if use_index:
+            self.index_path = path + RecordIndex.SUFFIX
+        self.file: BinaryIO = open(path, "rb")
+        try:
+            self.header: RecordHeader = RecordHeader.read(self.file)
+        except ValueError:
+            self.file.close()
+            raise
+        self.start: int = self.file.tell()
+
+        # Opened on the first read by number
+        self.memory: Optional[mmap] = None
+        self.index: Optional[RecordIndex] = None
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        """Stream all the records from the start of the archive.
+
+        Args:
+            None
+
+        Yields:
+            GameRecord: the games in order.
+
+        Raises:
+            ValueError: If the archive ends in the middle of a record.
+        """
+        with open(self.path, "rb") as stream:
+            stream.seek(self.start)
+            while True:
+                record: Optional[GameRecord] = GameRecord.read(
+                    stream, self.header.width, self.header.n_players)
+                if record is None:
+                    return
+                yield record
+
+    def __len__(self) -> int:
+        """Number of games in the index."""
+        return len(self._index())
+
+    def offsets(self) -> Iterator[int]:
+        """Scan the archive for the offsets of the games.
+
+        Args:
+            None
+
+        Yields:
+            int: position of every game record in the archive.
+
+        Raises:
+            ValueError: If the archive ends in the middle of a record.
+        """
+        memory: mmap = self._memory()
+        offset: int = self.start
+        while offset < len(memory):
+            yield offset
+            offset = GameRecord.unpack_from(
+                memory, offset,
+                self.header.width, self.header.n_players)[1]
+
+    def read(self, i_game: int) -> GameRecord:
+        """Read a game by its number.
+
+        Args:
+            i_game: number of the game, from 0.
+
+        Returns:
+            GameRecord: the game.
+
+        Raises:
+            IndexError: If there is no such game.
+            ValueError: If the reader has no index.
+        """
+        return GameRecord.unpack_from(
+            self._memory(), self._index().offset(i_game),
+            self.header.width, self.header.n_players)[0]
+
+    def __getitem__(self, i_game: int) -> GameRecord:
+        return self.read(i_game)
+
+    def _memory(self) -> mmap:
+        """Map the archive into memory, once."""
+        if self.memory is None:
+            self.memory = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        return self.memory
+
+    def _index(self) -> RecordIndex:
+        """Open the index, building it if there is none."""
+        if self.index is None:
+            if self.index_path is None:
+                raise ValueError("Reader has no index", self.path)
+            if not os.path.exists(self.index_path):
+                RecordIndex.build(self.path, self.index_path)
+            self.index = RecordIndex(self.index_path)
+        return self.index
+
+    def close(self):
+        """Close the archive and the index.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory = None
+        self.file.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
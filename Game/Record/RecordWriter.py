@@ -0,0 +1,131 @@
+from typing import BinaryIO
+
+import os
+
+from ..Board.Board import Board
+from .GameRecord import GameRecord
+from .RecordHeader import RecordHeader
+from .RecordIndex import RecordIndex
+
+
+class RecordWriter:
+    """Append game records to an archive and their offsets to its index.
+
+    A new archive starts with the header, an existing one is appended
+    to if its header describes the same games. The index file is
+    path + RecordIndex.SUFFIX.
+
+    Args:
+        path: path to the archive.
+        header: board and players of the games.
+
+    Attributes:
+        path: path to the archive.
+        header: board and players of the games.
+        n_written: number of games written by this writer.
+
+    Methods:
+        write(record): Append a game record.
+        write_board(board): Append the game played on a board.
+        flush(): Write the buffered records to the files.
+        close(): Flush and close the files.
+    """
+
+    def __init__(self, path: str, header: RecordHeader):
+        """Open the archive and its index for appending.
+
+        Args:
+            path: path to the archive.
+            header: board and players of the games.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the archive holds games of another header.
+        """
+        self.path: str = path
+        self.header: RecordHeader = header
+        self.n_written: int = 0
+
+        if os.path.exists(path) and 0 < os.path.getsize(path):
+            with open(path, "rb") as archive:
+                existing: RecordHeader = RecordHeader.read(archive)
+            if existing != header:
+                raise ValueError(
+                    "Archive holds games of another board or players",
+                    path)
+            if not os.path.exists(path + RecordIndex.SUFFIX):
+                RecordIndex.build(path)
+
+        self.archive: BinaryIO = open(path, "ab")
+        self.index: BinaryIO = open(path + RecordIndex.SUFFIX, "ab")
+        if self.archive.tell() == 0:
+            self.archive.write(header.pack())
+
+    def write(self, record: GameRecord):
+        """Append a game record.
+
+        Args:
+            record: the game.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the moves do not fit the header.
+        """
+        data: bytes = record.pack(self.header.width, self.header.n_players)
+        self.index.write(RecordIndex.OFFSET.pack(self.archive.tell()))
+        self.archive.write(data)
+        self.n_written += 1
+
+    def write_board(self, board: Board):
+        """Append the game played on a board.
+
+        Args:
+            board: board with the moves of the game.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the moves do not fit the header.
+        """
+        self.write(GameRecord.from_board(board))
+
+    def flush(self):
+        """Write the buffered records and offsets to the files.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.archive.flush()
+        self.index.flush()
+
+    def close(self):
+        """Flush and close the archive and the index.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.archive.close()
+        self.index.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
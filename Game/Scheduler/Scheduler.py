@@ -0,0 +1,227 @@
+from typing import Optional
+
+from random import Random
+from threading import Condition, Lock
+
+
+class Scheduler:
+    """Hand the turns to the threads of the players one at a time.
+
+    Every player thread calls acquire() with its ID and blocks until it
+    is its turn, makes the move and calls release(). The player to move
+    next is picked by next_player() of a subclass, and only the thread
+    of that player is woken up. Once the board is solved, or shutdown()
+    is called, all the waiting threads return from acquire() at once.
+
+    Before the move the chosen player waits a random delay of up to
+    max_delay milliseconds, the way the players of the asynchronous game
+    are 'thinking', max_delay of 0 turns the delays off for batch runs.
+    Players could have delays of their own in max_delays, like humans
+    given more time to think. The delay is cut short by a shutdown
+    as well.
+
+    Args:
+        max_delay: maximum delay before a move in milliseconds.
+        seed: optional seed of the random choices and delays.
+        max_delays: optional maximum delays of some of the players by
+                    ID, max_delay for the others.
+
+    Attributes:
+        max_delay: maximum delay before a move in milliseconds.
+        max_delays: maximum delays of some of the players by ID.
+        players: IDs of the players, in order of start().
+        turn: ID of the player to move, -1 when nobody can move.
+        closed: True after the game is over or shutdown() is called.
+        n_turns: number of turns handed out since start().
+
+    Methods:
+        start(players): Open the scheduler for the players.
+        acquire(player_id): Wait for the turn of the player.
+        release(player_id, solved): End the turn of the player.
+        shutdown(): Wake up and let go all the waiting players.
+        next_player(last): Pick who moves next, to be implemented.
+        get_max_delay(player_id): Maximum delay of a player.
+        delay(player_id): Delay before a move of a player in seconds.
+    """
+
+    def __init__(self,
+                 max_delay: int = 0,
+                 seed: Optional[int] = None,
+                 max_delays: Optional[dict[int, int]] = None):
+        """Create a closed scheduler, start() opens it.
+
+        Args:
+            max_delay: maximum delay before a move in milliseconds.
+            seed: optional seed of the random choices and delays.
+            max_delays: optional maximum delays of some of the players
+                        by ID, max_delay for the others.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If max_delay or any of max_delays is negative.
+        """
+        if max_delays is None:
+            max_delays = {}
+
+        if max_delay < 0:
+            raise ValueError(
+                "Delay should not be negative, and not", max_delay)
+        for player_id, player_delay in max_delays.items():
+            if player_delay < 0:
+                raise ValueError(
+                    "Delay should not be negative, and not", player_delay,
+                    "of the player", player_id)
+
+        self.max_delay: int = max_delay
+        self.max_delays: dict[int, int] = dict(max_delays)
+        self.generator: Random = Random(seed)
+
+        # Conditions of all the players share a single lock,
+        # so every player could be woken up on its own
+        self.lock: Lock = Lock()
+        self.conditions: dict[int, Condition] = {}
+
+        self.players: list[int] = []
+        self.turn: int = -1
+        self.closed: bool = True
+        self.n_turns: int = 0
+
+    def start(self, players: list[int]):
+        """Open the scheduler for the players and pick the first to move.
+
+        Args:
+            players: IDs of the players.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no players.
+        """
+        if not players:
+            raise ValueError("Nobody to schedule, players are", players)
+
+        with self.lock:
+            self.players = list(players)
+            self.conditions = {
+                player_id: Condition(self.lock) for player_id in players
+            }
+            self.closed = False
+            self.n_turns = 0
+            self.turn = self.next_player(-1)
+
+    def acquire(self, player_id: int) -> bool:
+        """Block until it is the turn of the player or the game is over.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            bool: True when the player should move now,
+                  False when the game is over.
+
+        Raises:
+            None
+        """
+        condition: Condition = self.conditions[player_id]
+        with condition:
+            condition.wait_for(
+                lambda: self.closed or self.turn == player_id)
+            if self.closed:
+                return False
+
+            delay: float = self.delay(player_id)
+            if 0 < delay:
+                condition.wait_for(lambda: self.closed, timeout=delay)
+            return not self.closed
+
+    def release(self, player_id: int, solved: bool = False):
+        """End the turn of the player and wake up the next one.
+
+        Args:
+            player_id: ID of the player that just moved.
+            solved: True when the game is over after the move.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if solved:
+            self.shutdown()
+            return
+
+        with self.lock:
+            self.n_turns += 1
+            self.turn = self.next_player(player_id)
+            self.conditions[self.turn].notify()
+
+    def shutdown(self):
+        """Wake up all the waiting players and let them go.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self.lock:
+            self.closed = True
+            self.turn = -1
+            for condition in self.conditions.values():
+                condition.notify_all()
+
+    def next_player(self, last: int) -> int:
+        """Pick the player to move next.
+
+        Abstract method to be implemented in subclasses,
+        it is called with the lock held.
+
+        Args:
+            last: ID of the player that moved last, -1 at the start.
+
+        Returns:
+            int: ID of the player to move next.
+
+        Raises:
+            NotImplementedError: In case users did not proved implementation
+                                 and calling the base class method
+        """
+        raise NotImplementedError
+
+    def get_max_delay(self, player_id: int) -> int:
+        """Get the maximum delay before a move of a player.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            int: delay in milliseconds.
+
+        Raises:
+            None
+        """
+        return self.max_delays.get(player_id, self.max_delay)
+
+    def delay(self, player_id: int) -> float:
+        """Pick the delay before the next move of a player.
+
+        Args:
+            player_id: ID of the player to move.
+
+        Returns:
+            float: delay in seconds.
+
+        Raises:
+            None
+        """
+        max_delay: int = self.get_max_delay(player_id)
+        if max_delay == 0:
+            return 0.0
+        return self.generator.randint(0, max_delay) / 1000
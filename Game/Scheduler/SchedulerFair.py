@@ -0,0 +1,38 @@
+from .Scheduler import Scheduler
+
+
+class SchedulerFair(Scheduler):
+    """Give the turns to the players in a queue, one after the other.
+
+    Players move in the order they were given to start(), the same way
+    as in the boring play() of the Game, but in their own threads.
+
+    Args:
+        max_delay: maximum delay before a move in milliseconds.
+        seed: optional seed of the delays.
+        max_delays: optional maximum delays of some of the players by
+                    ID, max_delay for the others.
+
+    Attributes:
+        Inherited from Scheduler
+
+    Methods:
+        Inherited from Scheduler
+    """
+
+    def next_player(self, last: int) -> int:
+        """Pick the player after the last one in the queue.
+
+        Args:
+            last: ID of the player that moved last, -1 at the start.
+
+        Returns:
+            int: ID of the player to move next.
+
+        Raises:
+            None
+        """
+        if last < 0:
+            return self.players[0]
+        i: int = self.players.index(last)
+        return self.players[(i + 1) % len(self.players)]
@@ -0,0 +1,59 @@
+from .Scheduler import Scheduler
+
+
+class SchedulerLuck(Scheduler):
+    """Give every turn to a random player, as the lucky threads did.
+
+    Every player is equally likely to move next, the last one included,
+    so a player could get several moves in a row. The delay is the one
+    of the fastest of the players, as if each of them was waiting for
+    a random time of up to its own maximum delay and the first to wake
+    up got the board.
+
+    Args:
+        max_delay: maximum delay before a move in milliseconds.
+        seed: optional seed of the random choices and delays.
+        max_delays: optional maximum delays of some of the players by
+                    ID, max_delay for the others.
+
+    Attributes:
+        Inherited from Scheduler
+
+    Methods:
+        Inherited from Scheduler
+    """
+
+    def next_player(self, last: int) -> int:
+        """Pick any of the players at random.
+
+        Args:
+            last: ID of the player that moved last, -1 at the start.
+
+        Returns:
+            int: ID of the player to move next.
+
+        Raises:
+            None
+        """
+        return self.generator.choice(self.players)
+
+    def delay(self, player_id: int) -> float:
+        """Pick the shortest of the delays of all the players.
+
+        Args:
+            player_id: ID of the player to move.
+
+        Returns:
+            float: delay in seconds.
+
+        Raises:
+            None
+        """
+        max_delays: list[int] = [
+            self.get_max_delay(player) for player in self.players
+        ]
+        if 0 in max_delays:
+            return 0.0
+        return min(
+            self.generator.randint(0, max_delay) for max_delay in max_delays
+        ) / 1000
@@ -0,0 +1,95 @@
+from typing import Optional
+
+from .Scheduler import Scheduler
+
+
+class SchedulerWeighted(Scheduler):
+    """Give every turn to a random player, chosen in proportion to weights.
+
+    Args:
+        weights: weight of every player by ID, 1 for the missing IDs.
+        max_delay: maximum delay before a move in milliseconds.
+        seed: optional seed of the random choices and delays.
+        max_delays: optional maximum delays of some of the players by
+                    ID, max_delay for the others.
+
+    Attributes:
+        Inherited from Scheduler
+        weights: weight of every player by ID.
+
+    Methods:
+        Inherited from Scheduler
+        start(players): Open the scheduler, if anyone could move.
+    """
+
+    def __init__(self,
+                 weights: dict[int, float],
+                 max_delay: int = 0,
+                 seed: Optional[int] = None,
+                 max_delays: Optional[dict[int, int]] = None):
+        """Create a closed scheduler with weights of the players.
+
+        Args:
+            weights: weight of every player by ID, 1 for the missing IDs.
+            max_delay: maximum delay before a move in milliseconds.
+            seed: optional seed of the random choices and delays.
+            max_delays: optional maximum delays of some of the players
+                        by ID, max_delay for the others.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If max_delay or any of max_delays is negative.
+            ValueError: If any of the weights is negative.
+        """
+        super().__init__(max_delay=max_delay, seed=seed,
+                         max_delays=max_delays)
+
+        for player_id, weight in weights.items():
+            if weight < 0:
+                raise ValueError(
+                    "Weight should not be negative, and not", weight,
+                    "of the player", player_id)
+
+        self.weights: dict[int, float] = dict(weights)
+
+    def start(self, players: list[int]):
+        """Open the scheduler once some of the players could move.
+
+        Args:
+            players: IDs of the players.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are no players.
+            ValueError: If the weights of all the players are zero.
+        """
+        # checked here, the players are not known before, and a failed
+        # choice in next_player() would leave the others waiting forever
+        if players and not any(
+                0 < self.weights.get(player_id, 1) for player_id in players):
+            raise ValueError(
+                "Some weight should be positive, and not", self.weights,
+                "of the players", players)
+
+        super().start(players)
+
+    def next_player(self, last: int) -> int:
+        """Pick a player at random with the weights.
+
+        Args:
+            last: ID of the player that moved last, -1 at the start.
+
+        Returns:
+            int: ID of the player to move next.
+
+        Raises:
+            None
+        """
+        return self.generator.choices(
+            self.players,
+            [self.weights.get(player_id, 1) for player_id in self.players]
+        )[0]
@@ -0,0 +1,498 @@
+from typing import Optional
+
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+)
+from math import log, sqrt
+from os import cpu_count
+from random import Random
+from time import perf_counter
+
+from ..Board.Board import Board
+
+
+class Node:
+    """A position in the tree of the Monte Carlo search.
+
+    Args:
+        column: column played to reach the position, -1 for the root.
+        player_id: ID of the player who played the column.
+        to_move: ID of the player to move in the position.
+        untried: legal columns without a child node yet.
+
+    Attributes:
+        children: child nodes by column.
+        visits: number of playouts through the node, including
+                the ones still running.
+        score: sum of the results of the playouts for player_id,
+               1 for a win and 1 / n_players for a draw.
+        terminal: True when the game is over in the position.
+        winner: ID of the winner of a terminal position, -1 for a draw.
+    """
+
+    __slots__ = ("column", "player_id", "to_move", "untried", "children",
+                 "visits", "score", "terminal", "winner")
+
+    def __init__(self,
+                 column: int,
+                 player_id: int,
+                 to_move: int,
+                 untried: list[int]):
+        """Create a node without visits.
+
+        Args:
+            column: column played to reach the position, -1 for the root.
+            player_id: ID of the player who played the column.
+            to_move: ID of the player to move in the position.
+            untried: legal columns without a child node yet.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.column: int = column
+        self.player_id: int = player_id
+        self.to_move: int = to_move
+        self.untried: list[int] = untried
+        self.children: dict[int, Node] = {}
+        self.visits: int = 0
+        self.score: float = 0.0
+        self.terminal: bool = False
+        self.winner: int = -1
+
+
+class MCTS:
+    """Monte Carlo tree search with UCT selection for any number of players.
+
+    Every iteration walks down the tree picking the child with the best
+    upper confidence bound for the player to move, adds one new node and
+    plays random games from it to the end. Players move in the order of
+    their IDs, as in the boring play() of the Game, and every node keeps
+    the results of the player who moved into it, so the search works for
+    any board size and any number of players.
+
+    Playouts run in a pool of processes, several leaves at a time, with
+    the visits counted in advance so parallel walks spread over the tree.
+    The tree is kept between moves and the node of the new position is
+    found by the columns played since.
+
+    Args:
+        workers: number of processes, None for one per core,
+                 0 to play out in the calling process.
+        batch: random games played from every new node.
+        exploration: exploration constant of UCT.
+        seed: optional seed of the random games.
+
+    Attributes:
+        root: node of the last searched position or None.
+        history: columns played to reach the root.
+        iterations: number of nodes added by the last search.
+        playouts: number of random games finished by the last search.
+
+    Methods:
+        search(board, player_id, time_budget, max_iterations): Best column.
+        playout(...): Play random games, run in the worker processes.
+        close(): Stop the worker processes.
+    """
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 batch: int = 8,
+                 exploration: float = sqrt(2),
+                 seed: Optional[int] = None):
+        """Prepare the search, processes are started on the first search.
+
+        Args:
+            workers: number of processes, None for one per core,
+                     0 to play out in the calling process.
+            batch: random games played from every new node.
+            exploration: exploration constant of UCT.
+            seed: optional seed of the random games.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If batch is not positive or workers is negative.
+        """
+        if batch <= 0:
+            raise ValueError(
+                "Batch should be a positive number of games, and not", batch)
+        if workers is not None and workers < 0:
+            raise ValueError(
+                "Number of workers should not be negative, and not", workers)
+
+        self.workers: Optional[int] = workers
+        self.batch: int = batch
+        self.exploration: float = exploration
+        self.generator: Random = Random(seed)
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+        # Geometry of the board and the position of the root
+        self.width: int = 0
+        self.height: int = 0
+        self.stride: int = 0
+        self.line_shifts: list[list[int]] = []
+        self.stones: list[int] = []
+        self.heights: list[int] = []
+
+        self.root: Optional[Node] = None
+        self.history: list[int] = []
+        self.n_players: int = 0
+        self.iterations: int = 0
+        self.playouts: int = 0
+
+    def close(self):
+        """Stop the worker processes, a new search starts them again.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    @staticmethod
+    def playout(geometry: tuple[int, int, int, list[list[int]]],
+                stones: list[int],
+                heights: list[int],
+                to_move: int,
+                n_games: int,
+                seed: int) -> list[int]:
+        """Play random games to the end from a position.
+
+        A static method so it could be sent to the worker processes.
+
+        Args:
+            geometry: (width, height, stride, line_shifts) of the board.
+            stones: bitboards of every player, indexed by player ID.
+            heights: number of stones in every column.
+            to_move: ID of the player to move.
+            n_games: number of games to play.
+            seed: seed of the random moves.
+
+        Returns:
+            list[int]: wins of every player followed by the draws.
+
+        Raises:
+            None
+        """
+        width, height, stride, line_shifts = geometry
+        n_players: int = len(stones)
+        generator: Random = Random(seed)
+        results: list[int] = [0 for i in range(0, n_players + 1)]
+
+        for i_game in range(0, n_games):
+            board: list[int] = list(stones)
+            columns_height: list[int] = list(heights)
+            free: list[int] = [
+                j for j in range(0, width) if columns_height[j] < height
+            ]
+            player: int = to_move
+            winner: int = n_players  # the index of the draws
+
+            while free:
+                k: int = generator.randrange(len(free))
+                column: int = free[k]
+                row: int = columns_height[column]
+                columns_height[column] = row + 1
+                if row + 1 == height:
+                    free[k] = free[-1]
+                    free.pop()
+
+                current: int = board[player] | 1 << (column * stride + row)
+                board[player] = current
+
+                for shifts in line_shifts:
+                    line: int = current
+                    for shift in shifts:
+                        line &= line >> shift
+                        if not line:
+                            break
+                    else:
+                        winner = player
+                        break
+                if winner < n_players:
+                    break
+
+                player = (player + 1) % n_players
+
+            results[winner] += 1
+
+        return results
+
+    def _expand(self,
+                node: Node,
+                column: int,
+                stones: list[int],
+                heights: list[int]) -> Node:
+        """Add a child of the node playing the column, update the position.
+
+        Args:
+            node: node to expand.
+            column: one of the untried columns of the node.
+            stones: bitboards of the position of the node, updated.
+            heights: column heights of the position, updated.
+
+        Returns:
+            Node: the new child.
+
+        Raises:
+            None
+        """
+        self._play(node.to_move, column, stones, heights)
+
+        child: Node = Node(
+            column,
+            node.to_move,
+            (node.to_move + 1) % self.n_players,
+            [j for j in range(0, self.width) if heights[j] < self.height]
+        )
+        if self._has_line(stones[node.to_move]):
+            child.terminal = True
+            child.winner = node.to_move
+        elif not child.untried:
+            child.terminal = True
+        else:
+            self.generator.shuffle(child.untried)
+
+        node.children[column] = child
+        return child
+
+    def _play(self,
+              player_id: int,
+              column: int,
+              stones: list[int],
+              heights: list[int]):
+        """Put a stone of the player into the column of the position."""
+        stones[player_id] |= 1 << (column * self.stride + heights[column])
+        heights[column] += 1
+
+    def _has_line(self, current: int) -> bool:
+        """Test if there is a line of line_length among the stones."""
+        for shifts in self.line_shifts:
+            line: int = current
+            for shift in shifts:
+                line &= line >> shift
+                if not line:
+                    break
+            else:
+                return True
+        return False
+
+    def _select(self) -> tuple[list[Node], list[int], list[int]]:
+        """Walk down the tree with UCT and add a new node at the end.
+
+        Args:
+            None
+
+        Returns:
+            tuple: (nodes from the root to the new node,
+                    bitboards of the position of the last node,
+                    column heights of the position of the last node)
+
+        Raises:
+            None
+        """
+        node: Node = self.root
+        stones: list[int] = list(self.stones)
+        heights: list[int] = list(self.heights)
+        path: list[Node] = [node]
+
+        while not node.terminal and not node.untried:
+            log_visits: float = log(max(1, node.visits))
+            best: Optional[Node] = None
+            best_value: float = -1.0
+            for child in node.children.values():
+                if child.visits == 0:
+                    # all the playouts through it came too late
+                    best = child
+                    break
+                value: float = (
+                    child.score / child.visits +
+                    self.exploration * sqrt(log_visits / child.visits)
+                )
+                if best_value < value:
+                    best, best_value = child, value
+            self._play(node.to_move, best.column, stones, heights)
+            node = best
+            path.append(node)
+
+        if not node.terminal:
+            node = self._expand(node, node.untried.pop(), stones, heights)
+            path.append(node)
+
+        return path, stones, heights
+
+    def _backup(self, path: list[Node], results: list[int]):
+        """Add the results of the playouts to the nodes of the path.
+
+        Args:
+            path: nodes from the root to the node played out.
+            results: wins of every player followed by the draws.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        draw: float = results[-1] / self.n_players
+        for node in path:
+            if 0 <= node.player_id:
+                node.score += results[node.player_id] + draw
+
+    def _revert(self, path: list[Node]):
+        """Forget the visits of the playouts that will never be counted."""
+        for node in path:
+            node.visits -= self.batch
+
+    def _reuse(self, board: Board, player_id: int):
+        """Find the node of the position of the board in the old tree.
+
+        Args:
+            board: board to search the move for.
+            player_id: ID of the player to move.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        moves: list[int] = board.column_moves
+        node: Optional[Node] = self.root
+        if (node is None or
+                self.n_players != max(2, board.i_symbol) or
+                moves[:len(self.history)] != self.history):
+            node = None
+        else:
+            for i in range(len(self.history), len(moves)):
+                node = node.children.get(moves[i])
+                if node is None or node.player_id != board.player_moves[i]:
+                    node = None
+                    break
+            if node is not None and node.to_move != player_id:
+                node = None
+
+        if node is None:
+            self.n_players = max(2, board.i_symbol)
+            node = Node(
+                -1,
+                board.last_player,
+                player_id,
+                [j for j in range(0, self.width)
+                 if board.columns_height[j] < self.height]
+            )
+            self.generator.shuffle(node.untried)
+
+        self.root = node
+        self.history = list(moves)
+
+    def search(self,
+               board: Board,
+               player_id: int,
+               time_budget: int,
+               max_iterations: Optional[int] = None) -> int:
+        """Search for the best column until one of the budgets is over.
+
+        Args:
+            board: board to search the move for.
+            player_id: ID of the player to move.
+            time_budget: wall-clock time in milliseconds.
+            max_iterations: optional limit of nodes to add to the tree.
+
+        Returns:
+            int: the most visited column.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        deadline: float = perf_counter() + time_budget / 1000
+
+        if board.solved or board.empty_cells_left == 0:
+            raise ValueError("No legal moves on the board", board.column_moves)
+
+        self.width = board.width
+        self.height = board.height
+        self.stride = board.stride
+        self.line_shifts = board.line_shifts
+
+        self._reuse(board, player_id)
+        self.stones = board.masks[:self.n_players]
+        self.heights = list(board.columns_height)
+        geometry: tuple = (
+            self.width, self.height, self.stride, self.line_shifts
+        )
+
+        if self.executor is None and self.workers != 0:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        queue: int = 0
+        if self.executor is not None:
+            queue = 2 * (self.workers or cpu_count() or 1)
+        pending: dict[Future, list[Node]] = {}
+
+        # At least one iteration, so there is a move to return
+        self.iterations = 0
+        self.playouts = 0
+        while self.iterations == 0 or (
+                (max_iterations is None or self.iterations < max_iterations)
+                and perf_counter() < deadline):
+            path, stones, heights = self._select()
+            self.iterations += 1
+            for node in path:
+                node.visits += self.batch
+
+            leaf: Node = path[-1]
+            if leaf.terminal:
+                # the winner -1 counts the draws, the last of the results
+                results: list[int] = [0 for i in range(0, self.n_players + 1)]
+                results[leaf.winner] = self.batch
+                self._backup(path, results)
+            elif self.executor is None:
+                self._backup(path, MCTS.playout(
+                    geometry, stones, heights, leaf.to_move,
+                    self.batch, self.generator.getrandbits(64)
+                ))
+                self.playouts += self.batch
+            else:
+                pending[self.executor.submit(
+                    MCTS.playout, geometry, stones, heights, leaf.to_move,
+                    self.batch, self.generator.getrandbits(64)
+                )] = path
+
+            # Keep every worker busy, and a task waiting for it
+            while queue <= len(pending):
+                done, running = wait(
+                    pending,
+                    timeout=max(0.0, deadline - perf_counter()),
+                    return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for future in done:
+                    self._backup(pending.pop(future), future.result())
+                    self.playouts += self.batch
+
+        # Count what is ready, the rest is late for this move
+        for future, path in pending.items():
+            if future.done() and not future.cancelled():
+                self._backup(path, future.result())
+                self.playouts += self.batch
+            else:
+                future.cancel()
+                self._revert(path)
+
+        best: Node = max(
+            self.root.children.values(),
+            key=lambda child: (child.visits, child.score)
+        )
+        return best.column
@@ -0,0 +1,445 @@
+from typing import Optional
+
+from time import perf_counter
+
+from ..Board.Board import Board
+from ..Board.LineBoard import LineBoard
+from .SearchClock import SearchClock, SearchTimeout
+
+
+class MaxN:
+    """Search of the games of more than two players.
+
+    Two algorithms are available, both taking turns in order of the
+    player IDs:
+
+    MAXN - every player picks the move best for itself, positions are
+    scored with a vector of a value per player. The values are never
+    negative and add up to at most MAX_SUM, which allows shallow pruning:
+    once a player has a move worth more than what the player before it
+    leaves over, the rest of its moves cannot change the choice before.
+
+    PARANOID - all the other players are a coalition playing against the
+    player of the search, so the search is negamax-like over the value of
+    that player alone, with alpha-beta pruning. It looks deeper than
+    MAXN in the same time, at the price of a pessimistic play.
+
+    The value of a player grows with its lines: every line of the board
+    with stones of this player only adds 4 ** stones, and the values of
+    all the players share HEURISTIC_SUM in proportion, so a line blocked
+    by an opponent is worth nothing. Stones and the counts of the lines
+    are updated in place as the moves are tried and taken back, using
+    the line index of LineBoard, so scoring a position costs a value per
+    player. A win is worth MAX_SUM less the number of plies to it, more
+    than any heuristic value, and the winner takes it all.
+
+    Args:
+        board: the board of the position to search.
+        player_id: ID of the player to search for.
+        algorithm: MAXN or PARANOID.
+
+    Attributes:
+        player_id: ID of the player to search for.
+        algorithm: MAXN or PARANOID.
+        n_players: number of players, taking turns in order of their IDs.
+        order: column indices, central columns first.
+        nodes: number of nodes visited by the last search.
+        clock: deadline of the last search, see SearchClock.
+
+    Methods:
+        evaluate(): Value of every player in the current position.
+        search(time_budget, max_depth): Iterative deepening.
+    """
+
+    MAXN: str = "maxn"
+    PARANOID: str = "paranoid"
+    ALGORITHMS: tuple[str, str] = (MAXN, PARANOID)
+
+    # Sum of the values of all the players, a win takes it all
+    MAX_SUM: int = 1 << 20
+
+    # Sum of the heuristic values, far from a win
+    HEURISTIC_SUM: int = MAX_SUM // 2
+
+    # Owners of lines without a single owner
+    EMPTY: int = -1
+    BLOCKED: int = -2
+
+    def __init__(self,
+                 board: Board,
+                 player_id: int,
+                 algorithm: str = MAXN):
+        """Copy the position and count the stones on the lines.
+
+        Args:
+            board: the board of the position to search.
+            player_id: ID of the player to search for.
+            algorithm: MAXN or PARANOID.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the algorithm is not MAXN or PARANOID.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(
+                "Algorithm should be one of", self.ALGORITHMS,
+                ", and not", algorithm)
+
+        self.player_id: int = player_id
+        self.algorithm: str = algorithm
+        self.n_players: int = max(2, board.i_symbol, player_id + 1)
+
+        self.width: int = board.width
+        self.height: int = board.height
+        self.line_length: int = board.line_length
+        self.stride: int = board.stride
+        lines: tuple[tuple[int, ...], ...] = LineBoard.get_line_index(
+            board.width, board.height, board.line_length)[0]
+        self.lines_through: tuple[tuple[int, ...], ...] = \
+            LineBoard.get_line_index(
+                board.width, board.height, board.line_length)[1]
+        self.weights: list[int] = [
+            4 ** count if count else 0
+            for count in range(0, self.line_length + 1)
+        ]
+
+        # Central columns take part in more lines, try them first
+        self.order: list[int] = sorted(
+            range(0, self.width),
+            key=lambda j: (abs(2 * j - self.width + 1), j)
+        )
+
+        # Stones of the position, counted on the lines
+        self.heights: list[int] = list(board.columns_height)
+        self.owners: list[int] = [self.EMPTY] * len(lines)
+        self.counts: list[int] = [0] * len(lines)
+        self.scores: list[int] = [0] * self.n_players
+        for player in range(0, self.n_players):
+            stones: int = board.masks[player]
+            while stones:
+                stone: int = stones & -stones
+                self._count(stone.bit_length() - 1, player)
+                stones ^= stone
+
+        self.nodes: int = 0
+        self.clock: SearchClock = SearchClock(0)
+
+    def _count(self,
+               cell: int,
+               player: int) -> list[tuple[int, int, int]]:
+        """Count a new stone of a player on its lines.
+
+        Args:
+            cell: bit index of the stone.
+            player: ID of the player.
+
+        Returns:
+            list[tuple[int, int, int]]: line, its owner and count before
+                                        the stone, for every changed line.
+
+        Raises:
+            None
+        """
+        owners: list[int] = self.owners
+        counts: list[int] = self.counts
+        scores: list[int] = self.scores
+        weights: list[int] = self.weights
+        changes: list[tuple[int, int, int]] = []
+        for line in self.lines_through[cell]:
+            owner: int = owners[line]
+            if owner == self.BLOCKED:
+                continue
+            count: int = counts[line]
+            changes.append((line, owner, count))
+            if owner == player:
+                counts[line] = count + 1
+                scores[player] += weights[count + 1] - weights[count]
+            elif owner == self.EMPTY:
+                owners[line] = player
+                counts[line] = 1
+                scores[player] += weights[1]
+            else:
+                owners[line] = self.BLOCKED
+                scores[owner] -= weights[count]
+        return changes
+
+    def _uncount(self, player: int, changes: list[tuple[int, int, int]]):
+        """Take a stone of a player back from its lines.
+
+        Args:
+            player: ID of the player.
+            changes: lines changed by the stone, see _count().
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        weights: list[int] = self.weights
+        for line, owner, count in changes:
+            if owner == player:
+                self.scores[player] -= weights[count + 1] - weights[count]
+            elif owner == self.EMPTY:
+                self.scores[player] -= weights[1]
+            else:
+                self.scores[owner] += weights[count]
+            self.owners[line] = owner
+            self.counts[line] = count
+
+    def _wins(self, column: int, player: int) -> bool:
+        """Test if a stone of a player into a column completes a line."""
+        last: int = self.line_length - 1
+        for line in self.lines_through[
+                column * self.stride + self.heights[column]]:
+            if self.owners[line] == player and self.counts[line] == last:
+                return True
+        return False
+
+    def _tick(self):
+        """Count a node and check the deadline."""
+        self.nodes += 1
+        if self.clock.next_read <= self.nodes:
+            self.clock.read(self.nodes)
+
+    def evaluate(self) -> list[int]:
+        """Get the value of every player in the current position.
+
+        Args:
+            None
+
+        Returns:
+            list[int]: value for every player ID, adding up
+                       to at most HEURISTIC_SUM.
+
+        Raises:
+            None
+        """
+        total: int = sum(self.scores) + 1
+        return [
+            self.HEURISTIC_SUM * score // total for score in self.scores
+        ]
+
+    def _moves(self) -> list[int]:
+        """Get the columns that are not full, central columns first."""
+        return [
+            column for column in self.order
+            if self.heights[column] < self.height
+        ]
+
+    def _maxn(self,
+              depth: int,
+              player: int,
+              ply: int,
+              bound: int) -> list[int]:
+        """Value a position for every player, the player to move picks.
+
+        Args:
+            depth: number of plies left to search.
+            player: ID of the player to move.
+            ply: number of plies from the root of the search.
+            bound: value of the player to move that makes the player
+                   before it pick another move.
+
+        Returns:
+            list[int]: value for every player ID.
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        self._tick()
+
+        moves: list[int] = self._moves()
+        if not moves:
+            return [self.HEURISTIC_SUM // self.n_players] * self.n_players
+
+        for column in moves:
+            if self._wins(column, player):
+                values: list[int] = [0] * self.n_players
+                values[player] = self.MAX_SUM - ply - 1
+                return values
+
+        if depth == 0:
+            return self.evaluate()
+
+        following: int = (player + 1) % self.n_players
+        best: Optional[list[int]] = None
+        for column in moves:
+            changes: list[tuple[int, int, int]] = self._count(
+                column * self.stride + self.heights[column], player)
+            self.heights[column] += 1
+            try:
+                values = self._maxn(
+                    depth - 1, following, ply + 1,
+                    self.MAX_SUM - (0 if best is None else best[player]))
+            finally:
+                self.heights[column] -= 1
+                self._uncount(player, changes)
+
+            if best is None or best[player] < values[player]:
+                best = values
+                if bound <= best[player]:
+                    break
+        return best
+
+    def _paranoid(self,
+                  depth: int,
+                  player: int,
+                  ply: int,
+                  alpha: int,
+                  beta: int) -> int:
+        """Value a position for the player of the search, the rest of
+        the players playing against it.
+
+        Args:
+            depth: number of plies left to search.
+            player: ID of the player to move.
+            ply: number of plies from the root of the search.
+            alpha: lower bound of the value window.
+            beta: upper bound of the value window.
+
+        Returns:
+            int: value of the player of the search.
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        self._tick()
+
+        moves: list[int] = self._moves()
+        if not moves:
+            return self.HEURISTIC_SUM // self.n_players
+
+        mine: bool = player == self.player_id
+        for column in moves:
+            if self._wins(column, player):
+                return self.MAX_SUM - ply - 1 if mine else 0
+
+        if depth == 0:
+            return self.HEURISTIC_SUM * self.scores[self.player_id] \
+                // (sum(self.scores) + 1)
+
+        following: int = (player + 1) % self.n_players
+        for column in moves:
+            changes: list[tuple[int, int, int]] = self._count(
+                column * self.stride + self.heights[column], player)
+            self.heights[column] += 1
+            try:
+                value: int = self._paranoid(
+                    depth - 1, following, ply + 1, alpha, beta)
+            finally:
+                self.heights[column] -= 1
+                self._uncount(player, changes)
+
+            if mine:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if beta <= alpha:
+                break
+        return alpha if mine else beta
+
+    def _search_root(self, depth: int, columns: list[int]) -> tuple[int, int]:
+        """Search all the moves of the root position to a given depth.
+
+        Args:
+            depth: number of plies to search.
+            columns: legal columns in the order to try them.
+
+        Returns:
+            tuple[int, int]: best column and the value of the player.
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        player: int = self.player_id
+        following: int = (player + 1) % self.n_players
+        best_column: int = columns[0]
+        best_value: int = -1
+        for column in columns:
+            if self._wins(column, player):
+                return column, self.MAX_SUM - 1
+
+            changes: list[tuple[int, int, int]] = self._count(
+                column * self.stride + self.heights[column], player)
+            self.heights[column] += 1
+            try:
+                value: int
+                if self.algorithm == self.MAXN:
+                    value = self._maxn(
+                        depth - 1, following, 1,
+                        self.MAX_SUM - max(0, best_value))[player]
+                else:
+                    value = self._paranoid(
+                        depth - 1, following, 1, best_value, self.MAX_SUM)
+            finally:
+                self.heights[column] -= 1
+                self._uncount(player, changes)
+
+            if best_value < value:
+                best_column, best_value = column, value
+        return best_column, best_value
+
+    def search(self,
+               time_budget: float,
+               max_depth: Optional[int] = None) -> tuple[int, int, int]:
+        """Find the best column by iterative deepening.
+
+        Searches one ply deeper every iteration and stops when the time
+        budget is over, a win is found or the depth limit is reached.
+        Only fully searched iterations are trusted, and a new iteration
+        is not started if the previous one would not fit into the time
+        that is left.
+
+        Args:
+            time_budget: wall-clock time for the search in milliseconds.
+            max_depth: optional limit of plies to search.
+
+        Returns:
+            tuple[int, int, int]: best column, the value of the player
+                                  and the depth of the last finished
+                                  iteration.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        self.clock = SearchClock(time_budget)
+        self.nodes = 0
+
+        columns: list[int] = self._moves()
+        if not columns:
+            raise ValueError("There are no legal moves in this position")
+
+        best_column: int = columns[0]
+        best_value: int = 0
+        finished_depth: int = 0
+
+        empty_cells: int = self.width * self.height - sum(self.heights)
+        if max_depth is None or empty_cells < max_depth:
+            max_depth = empty_cells
+
+        depth: int = 1
+        while depth <= max_depth:
+            iteration_start: float = perf_counter()
+            try:
+                column, value = self._search_root(depth, columns)
+            except SearchTimeout:
+                break
+
+            best_column, best_value, finished_depth = column, value, depth
+
+            # The best move so far goes first in the next iteration
+            columns.remove(column)
+            columns.insert(0, column)
+
+            if self.MAX_SUM - empty_cells - 1 <= value:
+                break
+
+            if self.clock.left() < perf_counter() - iteration_start:
+                break
+
+            depth += 1
+
+        return best_column, best_value, finished_depth
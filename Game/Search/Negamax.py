@@ -0,0 +1,447 @@
+from typing import Optional
+
+from time import perf_counter
+
+from ..Board.Board import Board
+from .SearchClock import SearchClock, SearchTimeout
+from .TranspositionTable import TranspositionTable
+
+
+class Negamax:
+    """Negamax search with alpha-beta pruning over the Board bitboards.
+
+    The position is described by two bitboards - stones of the side to
+    move and all the stones on the board - so each node of the search
+    costs a few integer operations and no Board copies. Everyone but the
+    side to move is treated as one opponent, which is exact for two
+    players.
+
+    Positions are hashed with the Zobrist numbers of the Board, so with
+    two players the keys match Board.get_key(), and the results are kept
+    in an optional TranspositionTable that can outlive the search. The
+    table is keyed by Board.get_canonical_key(), so a position and its
+    mirror image share an entry, and the best move of a mirrored entry
+    is mirrored back.
+
+    Args:
+        board: A board to take the dimensions from.
+        player_id: ID of the player to search for.
+        opponent_id: ID whose Zobrist numbers hash the opponent stones.
+        table: optional table of evaluated positions.
+
+    Attributes:
+        width, height, line_length, stride, bottom_mask, board_mask,
+        line_shifts: geometry of the board, see Board.
+        order: column indices, central columns first.
+        numbers: Zobrist numbers of the player and of the opponent.
+        table: table of evaluated positions or None.
+        nodes: number of nodes visited by the last search.
+        clock: deadline of the last search, see SearchClock.
+
+    Methods:
+        search(current, mask, time_budget, max_depth): Iterative deepening.
+        evaluate(current, mask): Score a position statically.
+    """
+
+    # Score of a win on the very next move, every ply makes it one less
+    WIN_SCORE: int = 1 << 20
+
+    def __init__(self,
+                 board: Board,
+                 player_id: int = 0,
+                 opponent_id: int = 1,
+                 table: Optional[TranspositionTable] = None):
+        """Copy the geometry of the board and prepare the move ordering.
+
+        Args:
+            board: A board to take the dimensions from.
+            player_id: ID of the player to search for.
+            opponent_id: ID whose Zobrist numbers hash the opponent stones.
+            table: optional table of evaluated positions.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.width: int = board.width
+        self.height: int = board.height
+        self.line_length: int = board.line_length
+        self.stride: int = board.stride
+        self.bottom_mask: int = board.bottom_mask
+        self.board_mask: int = board.board_mask
+        self.line_shifts: list[list[int]] = board.line_shifts
+        self.directions: list[int] = [
+            1, self.stride, self.stride - 1, self.stride + 1
+        ]
+
+        # Central columns take part in more lines, try them first
+        self.order: list[int] = sorted(
+            range(0, self.width),
+            key=lambda j: (abs(2 * j - self.width + 1), j)
+        )
+        self.column_bottom: list[int] = [
+            1 << (j * self.stride) for j in range(0, self.width)
+        ]
+        self.column_top: list[int] = [
+            1 << (j * self.stride + self.height - 1)
+            for j in range(0, self.width)
+        ]
+        self.mirror_shift: list[int] = board.mirror_shift
+
+        self.numbers: tuple[list[int], list[int]] = (
+            board.get_zobrist(player_id),
+            board.get_zobrist(opponent_id)
+        )
+        self.table: Optional[TranspositionTable] = table
+
+        self.nodes: int = 0
+        self.clock: SearchClock = SearchClock(0)
+
+    def hash(self,
+             stones: int,
+             numbers: list[int],
+             mirror: bool = False) -> int:
+        """Compute the Zobrist key of a set of stones from scratch.
+
+        Args:
+            stones: bitboard of a single player.
+            numbers: Zobrist numbers of the player.
+            mirror: hash the stones mirrored left to right.
+
+        Returns:
+            int: XOR of the numbers of the cells with a stone.
+
+        Raises:
+            None
+        """
+        key: int = 0
+        while stones:
+            stone: int = stones & -stones
+            index: int = stone.bit_length() - 1
+            if mirror:
+                index += self.mirror_shift[index // self.stride]
+            key ^= numbers[index]
+            stones ^= stone
+        return key
+
+    def _to_table(self, score: int, ply: int) -> int:
+        """Make a win or loss score relative to the position itself."""
+        if self.WIN_SCORE // 2 < score:
+            return score + ply
+        if score < -self.WIN_SCORE // 2:
+            return score - ply
+        return score
+
+    def _from_table(self, score: int, ply: int) -> int:
+        """Make a win or loss score from the table relative to the root."""
+        if self.WIN_SCORE // 2 < score:
+            return score - ply
+        if score < -self.WIN_SCORE // 2:
+            return score + ply
+        return score
+
+    def has_line(self, stones: int) -> bool:
+        """Test if there is a line of line_length among the stones.
+
+        Args:
+            stones: bitboard of a single player.
+
+        Returns:
+            bool: True when a line is found.
+
+        Raises:
+            None
+        """
+        for shifts in self.line_shifts:
+            line: int = stones
+            for shift in shifts:
+                line &= line >> shift
+                if not line:
+                    break
+            else:
+                return True
+        return False
+
+    def winning_cells(self, stones: int, mask: int) -> int:
+        """Find empty cells that would complete a line for the stones.
+
+        Args:
+            stones: bitboard of a single player.
+            mask: bitboard of all the stones on the board.
+
+        Returns:
+            int: bitboard of the winning cells, not necessarily playable.
+
+        Raises:
+            None
+        """
+        free: int = self.board_mask & ~mask
+        cells: int = 0
+        for direction in self.directions:
+            for hole in range(0, self.line_length):
+                starts: int = free >> (hole * direction)
+                for k in range(0, self.line_length):
+                    if k != hole:
+                        starts &= stones >> (k * direction)
+                        if not starts:
+                            break
+                cells |= starts << (hole * direction)
+        return cells & free
+
+    def evaluate(self, current: int, mask: int) -> int:
+        """Score a position for the side to move without searching.
+
+        Difference in the number of cells that would complete a line.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+
+        Returns:
+            int: positive when the side to move looks better.
+
+        Raises:
+            None
+        """
+        mine: int = self.winning_cells(current, mask)
+        theirs: int = self.winning_cells(current ^ mask, mask)
+        return bin(mine).count("1") - bin(theirs).count("1")
+
+    def _negamax(self,
+                 current: int,
+                 mask: int,
+                 depth: int,
+                 ply: int,
+                 alpha: int,
+                 beta: int,
+                 key: int,
+                 mirror_key: int) -> int:
+        """Score a position for the side to move.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+            depth: number of plies left to search.
+            ply: number of plies from the root of the search.
+            alpha: lower bound of the score window.
+            beta: upper bound of the score window.
+            key: Zobrist key of the position.
+            mirror_key: Zobrist key of the mirrored position.
+
+        Returns:
+            int: WIN_SCORE-ply like scores for forced wins,
+                 heuristic scores otherwise.
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        self.nodes += 1
+        if self.clock.next_read <= self.nodes:
+            self.clock.read(self.nodes)
+
+        moves: list[tuple[int, int]] = []
+        for column in self.order:
+            if not mask & self.column_top[column]:
+                move: int = (mask + self.column_bottom[column]) \
+                    & self.board_mask & ~mask
+                if self.has_line(current | move):
+                    return self.WIN_SCORE - ply - 1
+                moves.append((column, move))
+
+        if not moves:
+            return 0
+
+        if depth == 0:
+            # Scoring a leaf of a large board takes longer than reading
+            # the clock, do not start it after the deadline
+            self.clock.check()
+            return self.evaluate(current, mask)
+
+        # Nobody can win faster than on the next move
+        best_possible: int = self.WIN_SCORE - ply - 2
+        if best_possible < beta:
+            beta = best_possible
+            if beta <= alpha:
+                return beta
+
+        table: Optional[TranspositionTable] = self.table
+        mirrored: bool = mirror_key < key
+        canonical_key: int = mirror_key if mirrored else key
+        if table is not None:
+            entry: Optional[tuple[int, int, int, int]] = table.lookup(
+                canonical_key)
+            if entry is not None:
+                entry_depth, entry_score, entry_flag, entry_move = entry
+                if mirrored and 0 <= entry_move:
+                    entry_move = self.width - 1 - entry_move
+                if depth <= entry_depth:
+                    entry_score = self._from_table(entry_score, ply)
+                    if entry_flag == TranspositionTable.EXACT:
+                        return entry_score
+                    elif entry_flag == TranspositionTable.LOWER:
+                        alpha = max(alpha, entry_score)
+                    else:
+                        beta = min(beta, entry_score)
+                    if beta <= alpha:
+                        return entry_score
+
+                # The best move found before goes first
+                for i in range(1, len(moves)):
+                    if moves[i][0] == entry_move:
+                        moves.insert(0, moves.pop(i))
+                        break
+
+        alpha_start: int = alpha
+        best_score: int = -self.WIN_SCORE
+        best_column: int = -1
+        numbers: list[int] = self.numbers[ply & 1]
+        opponent: int = current ^ mask
+        for column, move in moves:
+            index: int = move.bit_length() - 1
+            score: int = -self._negamax(
+                opponent, mask | move, depth - 1, ply + 1, -beta, -alpha,
+                key ^ numbers[index],
+                mirror_key ^ numbers[index + self.mirror_shift[column]])
+            if best_score < score:
+                best_score = score
+                best_column = column
+                if alpha < score:
+                    alpha = score
+                    if beta <= alpha:
+                        break
+
+        if table is not None:
+            if beta <= best_score:
+                flag: int = TranspositionTable.LOWER
+            elif best_score <= alpha_start:
+                flag = TranspositionTable.UPPER
+            else:
+                flag = TranspositionTable.EXACT
+            if mirrored and 0 <= best_column:
+                best_column = self.width - 1 - best_column
+            table.store(canonical_key, depth,
+                        self._to_table(best_score, ply), flag, best_column)
+
+        return best_score
+
+    def search(self,
+               current: int,
+               mask: int,
+               time_budget: float,
+               max_depth: Optional[int] = None) -> tuple[int, int, int]:
+        """Find the best column by iterative deepening.
+
+        Searches one ply deeper every iteration and stops when the time
+        budget is over, a forced result is found or the depth limit is
+        reached. Only fully searched iterations are trusted, and a new
+        iteration is not started if the previous one would not fit into
+        the time that is left.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+            time_budget: wall-clock time for the search in milliseconds.
+            max_depth: optional limit of plies to search.
+
+        Returns:
+            tuple[int, int, int]: best column, its score and
+                                  the depth of the last finished iteration.
+
+        Raises:
+            ValueError: If there are no legal moves.
+        """
+        self.clock = SearchClock(time_budget)
+        self.nodes = 0
+
+        columns: list[int] = [
+            column for column in self.order
+            if not mask & self.column_top[column]
+        ]
+        if not columns:
+            raise ValueError("There are no legal moves in this position")
+
+        best_column: int = columns[0]
+        best_score: int = 0
+        finished_depth: int = 0
+
+        key: int = self.hash(current, self.numbers[0]) \
+            ^ self.hash(current ^ mask, self.numbers[1])
+        mirror_key: int = self.hash(current, self.numbers[0], True) \
+            ^ self.hash(current ^ mask, self.numbers[1], True)
+
+        empty_cells: int = bin(self.board_mask & ~mask).count("1")
+        if max_depth is None or empty_cells < max_depth:
+            max_depth = empty_cells
+
+        depth: int = 1
+        while depth <= max_depth:
+            iteration_start: float = perf_counter()
+            try:
+                column, score = self._search_root(current, mask, columns,
+                                                  depth, key, mirror_key)
+            except SearchTimeout:
+                break
+
+            best_column, best_score, finished_depth = column, score, depth
+
+            # The best move so far goes first in the next iteration
+            columns.remove(column)
+            columns.insert(0, column)
+
+            if self.WIN_SCORE - empty_cells - 1 <= abs(score):
+                break
+
+            if self.clock.left() < perf_counter() - iteration_start:
+                break
+
+            depth += 1
+
+        return best_column, best_score, finished_depth
+
+    def _search_root(self,
+                     current: int,
+                     mask: int,
+                     columns: list[int],
+                     depth: int,
+                     key: int,
+                     mirror_key: int) -> tuple[int, int]:
+        """Search all the moves of the root position to a given depth.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+            columns: legal columns in the order to try them.
+            depth: number of plies to search.
+            key: Zobrist key of the position.
+            mirror_key: Zobrist key of the mirrored position.
+
+        Returns:
+            tuple[int, int]: best column and its score.
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        alpha: int = -self.WIN_SCORE
+        beta: int = self.WIN_SCORE
+        best_column: int = columns[0]
+        opponent: int = current ^ mask
+
+        for column in columns:
+            move: int = (mask + self.column_bottom[column]) \
+                & self.board_mask & ~mask
+            if self.has_line(current | move):
+                return column, self.WIN_SCORE - 1
+
+            index: int = move.bit_length() - 1
+            numbers: list[int] = self.numbers[0]
+            score: int = -self._negamax(
+                opponent, mask | move, depth - 1, 1, -beta, -alpha,
+                key ^ numbers[index],
+                mirror_key ^ numbers[index + self.mirror_shift[column]])
+            if alpha < score:
+                alpha = score
+                best_column = column
+
+        return best_column, alpha
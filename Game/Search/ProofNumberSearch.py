@@ -0,0 +1,279 @@
+from typing import Optional
+
+from ..Board.Board import Board
+from .Negamax import Negamax
+from .SearchClock import SearchClock, SearchTimeout
+from .ProofTable import ProofTable
+
+
+class ProofNumberSearch:
+    """Depth-first proof-number search proving a forced win.
+
+    Answers a single question - can the side to move force a win - and
+    searches only as much of the tree as the answer needs: every node
+    has a proof number, the least number of positions still to prove
+    for a win, and a disproof number, the least to prove there is none,
+    and the search always follows the move closest to settling it. The
+    numbers are kept for the side to move of every node, phi is the
+    proof number of the side to move and delta the disproof number:
+    phi of a node is the smallest delta of its moves, delta is the sum
+    of the phi of its moves. A draw is a failure of the side the proof
+    is for, so the proof says win or no win, and never tells a draw
+    from a loss.
+
+    The depth-first variant (df-pn) keeps the numbers in a ProofTable
+    of bounded memory rather than a tree, and stays below a node until
+    its numbers cross the thresholds of the parent, with the 1 + epsilon
+    trick to stop switching between siblings of close numbers. Moves
+    that win at once, blocks of a single threat and moves under a cell
+    where the opponent wins are found directly, so the forced parts of
+    the tree cost one node per move.
+
+    The numbers in the table stay valid between proofs for the same
+    player of the same game, so a proof cut by its budget goes on from
+    where it stopped when started again with the same table.
+
+    Everyone but the side to move is treated as one opponent, which is
+    exact for two players.
+
+    Args:
+        board: A board to take the dimensions from.
+        player_id: ID of the player to prove the win for.
+        opponent_id: ID whose Zobrist numbers hash the opponent stones.
+        table: table of proof numbers, a new one of 16 MiB by default.
+
+    Attributes:
+        table: table of proof numbers.
+        nodes: number of nodes visited by the last proof.
+        clock: deadline of the last proof, None without a time budget.
+        rules: the Negamax of the board, to find lines and threats.
+
+    Methods:
+        prove(current, mask, max_nodes, time_budget): Prove or disprove
+            a forced win of the side to move.
+    """
+
+    # Results of prove()
+    DISPROVEN: int = -1
+    UNKNOWN: int = 0
+    PROVEN: int = 1
+
+    INFINITY: int = ProofTable.INFINITY
+
+    # Threshold of a node is 1 + EPSILON times the second best sibling
+    EPSILON: float = 0.25
+
+    def __init__(self,
+                 board: Board,
+                 player_id: int = 0,
+                 opponent_id: int = 1,
+                 table: Optional[ProofTable] = None):
+        """Copy the geometry of the board.
+
+        Args:
+            board: A board to take the dimensions from.
+            player_id: ID of the player to prove the win for.
+            opponent_id: ID whose Zobrist numbers hash the opponent stones.
+            table: table of proof numbers, a new one of 16 MiB by default.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.rules: Negamax = Negamax(board, player_id, opponent_id)
+        self.width: int = board.width
+        self.stride: int = board.stride
+        self.bottom_mask: int = board.bottom_mask
+        self.board_mask: int = board.board_mask
+
+        self.table: ProofTable = table if table is not None \
+            else ProofTable()
+
+        self.nodes: int = 0
+        self.max_nodes: Optional[int] = None
+        self.clock: Optional[SearchClock] = None
+
+    def _expand(self,
+                current: int,
+                mask: int,
+                attacker: bool) -> tuple[int, int, int, list[int]]:
+        """Find the numbers of a settled node or the moves worth trying.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+            attacker: True when the side to move is the one of the proof.
+
+        Returns:
+            tuple[int, int, int, list[int]]: phi, delta and the column
+                of a settled node, or 1, 1, -1 and the columns of the
+                moves to search.
+
+        Raises:
+            None
+        """
+        rules: Negamax = self.rules
+        playable: int = (mask + self.bottom_mask) & self.board_mask
+        wins: int = rules.winning_cells(current, mask) & playable
+        if wins:
+            return 0, self.INFINITY, \
+                ((wins & -wins).bit_length() - 1) // self.stride, []
+
+        # a draw settles the proof against the attacker
+        if mask == self.board_mask:
+            if attacker:
+                return self.INFINITY, 0, -1, []
+            return 0, self.INFINITY, -1, []
+
+        threats: int = rules.winning_cells(current ^ mask, mask)
+        forced: int = threats & playable
+        if forced & (forced - 1):
+            # two threats, only one could be blocked
+            return self.INFINITY, 0, -1, []
+        if forced:
+            playable = forced
+        # moves under a threat let the opponent win on top of them
+        playable &= ~(threats >> 1)
+        if not playable:
+            return self.INFINITY, 0, -1, []
+
+        columns: list[int] = [
+            column for column in rules.order
+            if playable & rules.column_bottom[column] * (
+                (1 << self.stride) - 1)
+        ]
+        return 1, 1, -1, columns
+
+    def _mid(self,
+             current: int,
+             mask: int,
+             key: int,
+             mirror_key: int,
+             attacker: bool,
+             phi_limit: int,
+             delta_limit: int) -> tuple[int, int, int]:
+        """Search a node until its numbers cross the thresholds.
+
+        Args:
+            current: bitboard of the side to move.
+            mask: bitboard of all the stones on the board.
+            key: Zobrist key of the position.
+            mirror_key: Zobrist key of the mirrored position.
+            attacker: True when the side to move is the one of the proof.
+            phi_limit: threshold of the proof number of the node.
+            delta_limit: threshold of the disproof number of the node.
+
+        Returns:
+            tuple[int, int, int]: phi, delta and the most promising
+                                  column of the node, -1 without one.
+
+        Raises:
+            SearchTimeout: When the node budget or the deadline is reached.
+        """
+        self.nodes += 1
+        if self.max_nodes is not None and self.max_nodes < self.nodes:
+            raise SearchTimeout()
+        if self.clock is not None and self.clock.next_read <= self.nodes:
+            self.clock.read(self.nodes)
+
+        canonical_key: int = min(key, mirror_key)
+        work: int = self.nodes
+        infinity: int = self.INFINITY
+        table: ProofTable = self.table
+
+        phi, delta, column, columns = self._expand(current, mask, attacker)
+        if not columns:
+            table.store(canonical_key, phi, delta, 1)
+            return phi, delta, column
+
+        # moves with their numbers, taken from the table once
+        rules: Negamax = self.rules
+        numbers: list[int] = rules.numbers[0 if attacker else 1]
+        opponent: int = current ^ mask
+        children: list[list[int]] = []
+        for column in columns:
+            move: int = (mask + rules.column_bottom[column]) \
+                & self.board_mask & ~mask
+            index: int = move.bit_length() - 1
+            child_key: int = key ^ numbers[index]
+            child_mirror: int = \
+                mirror_key ^ numbers[index + rules.mirror_shift[column]]
+            entry: Optional[tuple[int, int]] = table.lookup(
+                min(child_key, child_mirror))
+            child_phi, child_delta = (1, 1) if entry is None else entry
+            children.append([child_phi, child_delta, column, move,
+                             child_key, child_mirror])
+
+        while True:
+            phi = infinity
+            delta = 0
+            second: int = infinity
+            best: list[int] = children[0]
+            for child in children:
+                if child[1] < phi:
+                    second = phi
+                    phi = child[1]
+                    best = child
+                elif child[1] < second:
+                    second = child[1]
+                delta += child[0]
+            delta = min(delta, infinity)
+
+            if phi_limit <= phi or delta_limit <= delta:
+                break
+
+            best[0], best[1], _ = self._mid(
+                opponent, mask | best[3], best[4], best[5], not attacker,
+                min(infinity, delta_limit - delta + best[0]),
+                min(phi_limit, int(second * (1 + self.EPSILON)) + 1))
+
+        table.store(canonical_key, phi, delta, self.nodes - work + 1)
+        return phi, delta, best[2]
+
+    def prove(self,
+              current: int,
+              mask: int,
+              max_nodes: Optional[int] = None,
+              time_budget: Optional[float] = None) -> tuple[int, int]:
+        """Prove or disprove a forced win of the side to move.
+
+        Args:
+            current: bitboard of the side to move, the player of the proof.
+            mask: bitboard of all the stones on the board.
+            max_nodes: optional limit of nodes to visit.
+            time_budget: optional wall-clock time in milliseconds.
+
+        Returns:
+            tuple[int, int]: PROVEN with a winning column, DISPROVEN
+                             when there is no forced win, or UNKNOWN when
+                             the budget is over first, with -1.
+
+        Raises:
+            None
+        """
+        self.nodes = 0
+        self.max_nodes = max_nodes
+        self.clock = None
+        if time_budget is not None:
+            self.clock = SearchClock(time_budget)
+
+        rules: Negamax = self.rules
+        key: int = rules.hash(current, rules.numbers[0]) \
+            ^ rules.hash(current ^ mask, rules.numbers[1])
+        mirror_key: int = rules.hash(current, rules.numbers[0], True) \
+            ^ rules.hash(current ^ mask, rules.numbers[1], True)
+
+        try:
+            phi, delta, column = self._mid(
+                current, mask, key, mirror_key, True,
+                self.INFINITY, self.INFINITY)
+        except SearchTimeout:
+            return self.UNKNOWN, -1
+
+        if phi == 0:
+            return self.PROVEN, column
+        if delta == 0:
+            return self.DISPROVEN, -1
+        return self.UNKNOWN, -1
@@ -0,0 +1,170 @@
+from typing import Optional
+
+from array import array
+
+
+class ProofTable:
+    """Fixed-size table of proof and disproof numbers addressed by
+    Zobrist keys.
+
+    Entries are kept in flat typed arrays allocated once, so the memory
+    taken by the table never grows past the limit given at construction,
+    however long a proof runs. The table is split into buckets of two
+    slots, a new key replaces the entry that took less work to find -
+    the number of nodes searched below it - so the results of the large
+    subtrees are kept and the cheap ones are found again when needed.
+
+    Args:
+        memory_limit: maximum memory for the entries in bytes.
+
+    Attributes:
+        capacity: number of entries the table can hold.
+        hits: number of lookups that found the key.
+        misses: number of lookups that did not find the key.
+        stores: number of entries written.
+        replaced: number of stores that threw another key out.
+
+    Methods:
+        lookup(key): Find an entry.
+        store(key, phi, delta, work): Remember an entry.
+        clear(): Forget all the entries and counters.
+        get_stats(): Get counters as a dictionary.
+    """
+
+    # Proof numbers of a proven or disproven position, sums are cut to it
+    INFINITY: int = (1 << 31) - 1
+
+    # key + phi + delta + work
+    ENTRY_BYTES: int = 8 + 4 + 4 + 4
+
+    SLOTS: int = 2
+
+    def __init__(self, memory_limit: int = 16 << 20):
+        """Allocate the table.
+
+        Args:
+            memory_limit: maximum memory for the entries in bytes.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If memory_limit is not enough for a single bucket.
+        """
+        n_buckets: int = memory_limit // (self.ENTRY_BYTES * self.SLOTS)
+        if n_buckets < 1:
+            raise ValueError(
+                "Memory limit should be at least",
+                self.ENTRY_BYTES * self.SLOTS,
+                "bytes, and not", memory_limit)
+
+        self.n_buckets: int = n_buckets
+        self.capacity: int = n_buckets * self.SLOTS
+
+        self.keys: array = array('Q', bytes(8 * self.capacity))
+        self.phis: array = array('i', bytes(4 * self.capacity))
+        self.deltas: array = array('i', bytes(4 * self.capacity))
+        self.works: array = array('i', [-1]) * self.capacity
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stores: int = 0
+        self.replaced: int = 0
+
+    def lookup(self, key: int) -> Optional[tuple[int, int]]:
+        """Find an entry.
+
+        Args:
+            key: 64-bit Zobrist key of the position.
+
+        Returns:
+            tuple[int, int]: phi and delta of the entry, see
+                             ProofNumberSearch, or None if not found.
+
+        Raises:
+            None
+        """
+        slot: int = (key % self.n_buckets) * self.SLOTS
+        for i in (slot, slot + 1):
+            if self.keys[i] == key and 0 <= self.works[i]:
+                self.hits += 1
+                return self.phis[i], self.deltas[i]
+
+        self.misses += 1
+        return None
+
+    def store(self, key: int, phi: int, delta: int, work: int):
+        """Remember an entry.
+
+        The entry goes into the slot that already holds this key, or an
+        empty one, otherwise into the slot of less work.
+
+        Args:
+            key: 64-bit Zobrist key of the position.
+            phi: proof number for the side to move.
+            delta: disproof number for the side to move.
+            work: number of nodes searched to find the numbers.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        slot: int = (key % self.n_buckets) * self.SLOTS
+        works: array = self.works
+        if self.keys[slot] == key and 0 <= works[slot]:
+            i: int = slot
+        elif self.keys[slot + 1] == key and 0 <= works[slot + 1]:
+            i = slot + 1
+        elif works[slot] < 0:
+            i = slot
+        elif works[slot + 1] < 0:
+            i = slot + 1
+        else:
+            i = slot if works[slot] < works[slot + 1] else slot + 1
+            self.replaced += 1
+
+        self.keys[i] = key
+        self.phis[i] = phi
+        self.deltas[i] = delta
+        works[i] = min(work, self.INFINITY)
+        self.stores += 1
+
+    def clear(self):
+        """Forget all the entries and counters.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.works = array('i', [-1]) * self.capacity
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replaced = 0
+
+    def get_stats(self) -> dict:
+        """Get counters as a dictionary.
+
+        Args:
+            None
+
+        Returns:
+            dict: capacity, hits, misses, stores and replaced.
+
+        Raises:
+            None
+        """
+        return {
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "replaced": self.replaced,
+        }
@@ -0,0 +1,121 @@
+from time import perf_counter
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the deadline is reached."""
+
+
+class SearchClock:
+    """Deadline of a search, read every so many nodes.
+
+    Reading the clock at every node would cost more than a cheap node
+    itself, reading it every fixed number of nodes lets an expensive
+    node, like one of a large board, run far past the deadline. So the
+    number of nodes between the reads is adapted to the speed of the
+    search: after every read it is scaled to make the next read come
+    about INTERVAL seconds later, at most twice as many nodes as before,
+    so a sudden slow part of the tree is caught within a few reads.
+
+    The search counts its nodes and reads the clock once it reaches
+    next_read, inline, as a method call per node would be noticeable:
+
+        nodes += 1
+        if clock.next_read <= nodes:
+            clock.read(nodes)
+
+    Args:
+        time_budget: wall-clock time of the search in milliseconds.
+
+    Attributes:
+        start: time of the start of the search, by perf_counter().
+        deadline: time the search has to stop by.
+        interval: seconds between the reads of the clock to aim at.
+        period: number of nodes between the reads of the clock.
+        next_read: number of nodes to read the clock at.
+
+    Methods:
+        read(nodes): Check the deadline and plan the next read.
+        check(): Check the deadline before an expensive step.
+        left(): Seconds left until the deadline.
+    """
+
+    # Most seconds between the reads of the clock
+    INTERVAL: float = 0.001
+
+    def __init__(self, time_budget: float):
+        """Start the clock of a search.
+
+        Args:
+            time_budget: wall-clock time of the search in milliseconds.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.start: float = perf_counter()
+        self.deadline: float = self.start + time_budget / 1000
+
+        # a short budget is read more often, to stay within a few percent
+        self.interval: float = min(self.INTERVAL, time_budget / 1000 / 50)
+        self.period: int = 1
+        self.next_read: int = 1
+        self.last_read: float = self.start
+        self.last_nodes: int = 0
+
+    def read(self, nodes: int):
+        """Check the deadline and plan the next read.
+
+        Args:
+            nodes: number of nodes visited by the search.
+
+        Returns:
+            None
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        now: float = perf_counter()
+        if self.deadline < now:
+            raise SearchTimeout()
+
+        elapsed: float = now - self.last_read
+        visited: int = nodes - self.last_nodes
+        period: int = 2 * self.period
+        if 0 < elapsed:
+            period = min(period, max(1, int(visited * self.interval
+                                            / elapsed)))
+        self.period = period
+        self.next_read = nodes + period
+        self.last_read = now
+        self.last_nodes = nodes
+
+    def check(self):
+        """Check the deadline before an expensive step.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            SearchTimeout: When the deadline is reached.
+        """
+        if self.deadline < perf_counter():
+            raise SearchTimeout()
+
+    def left(self) -> float:
+        """Seconds left until the deadline, negative after it.
+
+        Args:
+            None
+
+        Returns:
+            float: seconds.
+
+        Raises:
+            None
+        """
+        return self.deadline - perf_counter()
@@ -0,0 +1,171 @@
+from typing import Optional
+
+from array import array
+
+
+class TranspositionTable:
+    """Fixed-size table of evaluated positions addressed by Zobrist keys.
+
+    Entries are kept in flat typed arrays allocated once, so the memory
+    taken by the table never grows past the limit given at construction.
+    The table is split into buckets of two slots: the first one keeps the
+    deepest result seen for its bucket, the second one always takes the
+    newest result, so deep results survive while fresh ones are still
+    remembered.
+
+    Args:
+        memory_limit: maximum memory for the entries in bytes.
+
+    Attributes:
+        capacity: number of entries the table can hold.
+        hits: number of lookups that found the key.
+        misses: number of lookups that did not find the key.
+        collisions: number of misses where the bucket held other keys.
+        stores: number of entries written.
+
+    Methods:
+        lookup(key): Find an entry.
+        store(key, depth, score, flag, move): Remember an entry.
+        clear(): Forget all the entries and counters.
+        get_stats(): Get counters as a dictionary.
+    """
+
+    # Kinds of scores kept in the table
+    EXACT: int = 0
+    LOWER: int = 1  # score is at least this, search failed high
+    UPPER: int = 2  # score is at most this, search failed low
+
+    # key + score + depth + move + flag
+    ENTRY_BYTES: int = 8 + 4 + 2 + 2 + 1
+
+    SLOTS: int = 2
+
+    def __init__(self, memory_limit: int = 16 << 20):
+        """Allocate the table.
+
+        Args:
+            memory_limit: maximum memory for the entries in bytes.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If memory_limit is not enough for a single bucket.
+        """
+        n_buckets: int = memory_limit // (self.ENTRY_BYTES * self.SLOTS)
+        if n_buckets < 1:
+            raise ValueError(
+                "Memory limit should be at least",
+                self.ENTRY_BYTES * self.SLOTS,
+                "bytes, and not", memory_limit)
+
+        self.n_buckets: int = n_buckets
+        self.capacity: int = n_buckets * self.SLOTS
+
+        self.keys: array = array('Q', bytes(8 * self.capacity))
+        self.scores: array = array('i', bytes(4 * self.capacity))
+        self.depths: array = array('h', [-1]) * self.capacity
+        self.moves: array = array('h', bytes(2 * self.capacity))
+        self.flags: array = array('b', bytes(self.capacity))
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.collisions: int = 0
+        self.stores: int = 0
+
+    def lookup(self, key: int) -> Optional[tuple[int, int, int, int]]:
+        """Find an entry.
+
+        Args:
+            key: 64-bit Zobrist key of the position.
+
+        Returns:
+            tuple[int, int, int, int]: depth, score, flag and move
+                                       of the entry, or None if not found.
+
+        Raises:
+            None
+        """
+        slot: int = (key % self.n_buckets) * self.SLOTS
+        for i in (slot, slot + 1):
+            if self.keys[i] == key and 0 <= self.depths[i]:
+                self.hits += 1
+                return (self.depths[i], self.scores[i],
+                        self.flags[i], self.moves[i])
+
+        self.misses += 1
+        if 0 <= self.depths[slot] or 0 <= self.depths[slot + 1]:
+            self.collisions += 1
+
+        return None
+
+    def store(self, key: int, depth: int, score: int, flag: int, move: int):
+        """Remember an entry.
+
+        The entry goes into the depth-preferred slot when it is searched
+        at least as deep as the one kept there, or when that slot already
+        holds this key, otherwise into the always-replace slot.
+
+        Args:
+            key: 64-bit Zobrist key of the position.
+            depth: number of plies the position was searched to.
+            score: score of the position.
+            flag: EXACT, LOWER or UPPER.
+            move: best move found, or -1.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        slot: int = (key % self.n_buckets) * self.SLOTS
+        if self.keys[slot] == key or self.depths[slot] <= depth:
+            i: int = slot
+        else:
+            i = slot + 1
+
+        self.keys[i] = key
+        self.depths[i] = depth
+        self.scores[i] = score
+        self.flags[i] = flag
+        self.moves[i] = move
+        self.stores += 1
+
+    def clear(self):
+        """Forget all the entries and counters.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.depths = array('h', [-1]) * self.capacity
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+
+    def get_stats(self) -> dict:
+        """Get counters as a dictionary.
+
+        Args:
+            None
+
+        Returns:
+            dict: capacity, hits, misses, collisions and stores.
+
+        Raises:
+            None
+        """
+        return {
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+        }
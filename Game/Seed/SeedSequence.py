@@ -0,0 +1,167 @@
+from typing import Union
+
+from hashlib import blake2b
+from random import Random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only numpy_generator() needs it
+    np = None
+
+Key = Union[int, str]
+
+
+class SeedSequence:
+    """A master seed and a path of keys naming an independent stream.
+
+    The seed of a stream is a hash of the master seed and the path, so
+    the same path gives the same numbers in any process, on any machine
+    and in any order of creation, and different paths give unrelated
+    numbers. Derive a stream for every player, game and worker from a
+    single master seed and a large simulation is reproduced bit for bit
+    however its games are spread over threads and processes.
+
+        seeds = SeedSequence(2024)
+        generator = seeds.child("game", 17, "player", 0).generator()
+
+    Sequences are plain values, they could be pickled and sent to the
+    worker processes, which derive their own streams from them.
+
+    Args:
+        seed: the master seed, a non-negative integer.
+        path: keys of the stream, the master stream by default.
+
+    Attributes:
+        seed: the master seed.
+        path: keys of the stream.
+
+    Methods:
+        child(*keys): Derive the stream of the keys.
+        spawn(n): Derive n streams numbered from 0.
+        state(): The 64-bit seed of the stream.
+        generator(): random.Random of the stream.
+        numpy_generator(): numpy.random.Generator of the stream.
+    """
+
+    def __init__(self, seed: int, path: tuple[Key, ...] = ()):
+        """Name a stream of the master seed.
+
+        Args:
+            seed: the master seed, a non-negative integer.
+            path: keys of the stream, the master stream by default.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If seed is not an integer or a key is not
+                       an integer or a string.
+            ValueError: If seed is negative.
+        """
+        if not isinstance(seed, int) or isinstance(seed, bool):
+            raise TypeError("Seed has to be an integer, and not", type(seed))
+        if seed < 0:
+            raise ValueError("Seed should not be negative, and not", seed)
+        for key in path:
+            if not isinstance(key, (int, str)) or isinstance(key, bool):
+                raise TypeError(
+                    "Keys have to be integers or strings, and not", key)
+
+        self.seed: int = seed
+        self.path: tuple[Key, ...] = tuple(path)
+
+    def __eq__(self, other: object) -> bool:
+        """Sequences of the same seed and path are the same stream."""
+        return (isinstance(other, SeedSequence) and
+                (self.seed, self.path) == (other.seed, other.path))
+
+    def __hash__(self) -> int:
+        """Hash of the seed and the path."""
+        return hash((self.seed, self.path))
+
+    def __repr__(self) -> str:
+        """SeedSequence(seed, path) to recreate the stream."""
+        return "SeedSequence({!r}, {!r})".format(self.seed, self.path)
+
+    def child(self, *keys: Key) -> "SeedSequence":
+        """Derive the stream of the keys below this one.
+
+        Args:
+            keys: integers or strings, like "player", 0.
+
+        Returns:
+            SeedSequence: the derived stream.
+
+        Raises:
+            TypeError: If a key is not an integer or a string.
+        """
+        return SeedSequence(self.seed, self.path + keys)
+
+    def spawn(self, n: int) -> list["SeedSequence"]:
+        """Derive streams numbered from 0 to n-1, one per worker.
+
+        Args:
+            n: number of streams.
+
+        Returns:
+            list[SeedSequence]: the derived streams.
+
+        Raises:
+            None
+        """
+        return [self.child(i) for i in range(0, n)]
+
+    def state(self) -> int:
+        """Get the 64-bit seed of the stream.
+
+        Keys are hashed with their types, so the key 1 and
+        the key "1" name different streams.
+
+        Args:
+            None
+
+        Returns:
+            int: seed from 0 to 2**64-1.
+
+        Raises:
+            None
+        """
+        digest = blake2b(digest_size=8)
+        digest.update(str(self.seed).encode())
+        for key in self.path:
+            tag: bytes = b"i" if isinstance(key, int) else b"s"
+            text: bytes = str(key).encode()
+            digest.update(tag + len(text).to_bytes(4, "little") + text)
+        return int.from_bytes(digest.digest(), "little")
+
+    def generator(self) -> Random:
+        """Create a random.Random of the stream.
+
+        Args:
+            None
+
+        Returns:
+            Random: a new generator, every call starts the stream over.
+
+        Raises:
+            None
+        """
+        return Random(self.state())
+
+    def numpy_generator(self):
+        """Create a numpy.random.Generator of the stream.
+
+        Args:
+            None
+
+        Returns:
+            numpy.random.Generator: a new generator, every call starts
+                                    the stream over.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "numpy_generator needs NumPy, try `pip install numpy`")
+        return np.random.default_rng(self.state())
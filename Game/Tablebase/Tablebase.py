@@ -0,0 +1,296 @@
+from typing import Optional
+
+import os
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+
+from ..Board.Board import Board
+
+
+class Tablebase:
+    """Perfect results of the late positions of a small board of two
+    players, read through mmap.
+
+    Every position reachable with at least min_stones stones, where
+    nobody has won yet and the board is not full, has its result for
+    the player to move: WIN, DRAW or LOSS with the perfect play of both
+    sides, and the distance - the number of moves to the end of the game,
+    the winner wins as fast as possible and the loser loses as slow as
+    possible. TablebaseBuilder solves the positions and writes the files.
+
+    Packed file:
+        header, HEADER: MAGIC, VERSION, width, height, line_length,
+                        min_stones, bytes per code, bits per value,
+                        number of positions
+        codes: a code per position, sorted, little-endian
+        values: value_bits per position, in order of the codes,
+                packed into bytes from the lowest bit up
+
+    The code of a position is the bitboard of the player to move plus
+    the bitboard of all the stones, which tells the stones apart as the
+    columns have a spare bit on top, see Board._check(). Codes are
+    canonical, the smaller of the position and its mirror image, as
+    both have the same result. A value is the result + 1 in the lowest
+    2 bits and the distance above them.
+
+    Args:
+        path: path to the tablebase file.
+
+    Attributes:
+        path: path to the tablebase file.
+        width, height, line_length: the board of the tablebase.
+        min_stones: positions of at least this many stones are solved.
+
+    Methods:
+        encode(current, mask, width, height): Canonical code of a position.
+        find(code): Find the value of a code.
+        probe(board, player_id): Result of a position.
+        best_move(board, player_id): The perfect move of a position.
+        close(): Unmap and close the tablebase file.
+    """
+
+    MAGIC: bytes = b"C4TB"
+    VERSION: int = 1
+    HEADER: Struct = Struct("<4sBHHHHBBQ")
+
+    # Results for the player to move
+    LOSS: int = -1
+    DRAW: int = 0
+    WIN: int = 1
+
+    def __init__(self, path: str):
+        """Map the tablebase file into memory and check its header.
+
+        Args:
+            path: path to the tablebase file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be opened.
+            ValueError: If the file is not a tablebase or is truncated.
+        """
+        self.path: str = path
+        self.file = open(path, "rb")
+        self.memory: Optional[mmap] = None
+        try:
+            size: int = os.fstat(self.file.fileno()).st_size
+            header: bytes = self.file.read(self.HEADER.size)
+            if len(header) < self.HEADER.size:
+                raise ValueError("Tablebase is too short for a header", path)
+
+            (magic, version, width, height, line_length, min_stones,
+             code_bytes, value_bits, n_positions) = self.HEADER.unpack(header)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(
+                    "Not a tablebase of version", self.VERSION,
+                    ", but", magic, version)
+            if size != self.HEADER.size + n_positions * code_bytes + \
+                    (n_positions * value_bits + 7) // 8:
+                raise ValueError("Tablebase is truncated", path, size)
+
+            self.memory = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise
+
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.min_stones: int = min_stones
+        self.code_bytes: int = code_bytes
+        self.value_bits: int = value_bits
+        self.size: int = n_positions
+        self.values_start: int = self.HEADER.size + n_positions * code_bytes
+
+        # Geometry to check the moves of best_move()
+        self.board: Board = Board(width, height, line_length, quiet=True)
+
+    def __len__(self) -> int:
+        """Number of positions in the tablebase."""
+        return self.size
+
+    def __enter__(self) -> "Tablebase":
+        """Use the tablebase in a with block."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the tablebase at the end of a with block."""
+        self.close()
+
+    @staticmethod
+    def encode(current: int, mask: int, width: int, height: int) -> int:
+        """Get the canonical code of a position.
+
+        Args:
+            current: bitboard of the player to move.
+            mask: bitboard of all the stones.
+            width: width of the board.
+            height: height of the board.
+
+        Returns:
+            int: the smaller of the codes of the position
+                 and of its mirror image.
+
+        Raises:
+            None
+        """
+        code: int = current + mask
+        stride: int = height + 1
+        column: int = (1 << stride) - 1
+        mirror: int = 0
+        for j in range(0, width):
+            mirror |= ((code >> (j * stride)) & column) \
+                << ((width - 1 - j) * stride)
+        return mirror if mirror < code else code
+
+    def find(self, code: int) -> Optional[int]:
+        """Find the value of a code by a binary search.
+
+        Args:
+            code: canonical code of a position.
+
+        Returns:
+            Optional[int]: value of the position, see the class,
+                           None when not found.
+
+        Raises:
+            None
+        """
+        if self.memory is None:
+            return None
+
+        memory: mmap = self.memory
+        size: int = self.code_bytes
+        start: int = self.HEADER.size
+        low: int = 0
+        high: int = self.size
+        while low < high:
+            middle: int = (low + high) // 2
+            offset: int = start + middle * size
+            found: int = int.from_bytes(
+                memory[offset:offset + size], "little")
+            if found < code:
+                low = middle + 1
+            elif code < found:
+                high = middle
+            else:
+                bit: int = middle * self.value_bits
+                offset = self.values_start + bit // 8
+                word: int = int.from_bytes(
+                    memory[offset:offset + (bit % 8 + self.value_bits + 7)
+                           // 8], "little")
+                return (word >> (bit % 8)) & ((1 << self.value_bits) - 1)
+        return None
+
+    def _covers(self, board: Board) -> bool:
+        """Check the board has the size and the stones of the tablebase."""
+        if (board.width, board.height, board.line_length) != \
+                (self.width, self.height, self.line_length):
+            return False
+        n_stones: int = board.width * board.height - board.empty_cells_left
+        # all the stones are of the players 0 and 1
+        return board.i_symbol <= 2 and self.min_stones <= n_stones and \
+            board.masks[0] | board.masks[1] == board.mask
+
+    def probe(self,
+              board: Board,
+              player_id: int) -> Optional[tuple[int, int]]:
+        """Get the result of a position for the player to move.
+
+        Args:
+            board: the board of the position.
+            player_id: ID of the player to move.
+
+        Returns:
+            Optional[tuple[int, int]]: WIN, DRAW or LOSS and the distance
+                                       in moves, None when the position
+                                       is not in the tablebase.
+
+        Raises:
+            None
+        """
+        if player_id not in (0, 1) or not self._covers(board):
+            return None
+
+        value: Optional[int] = self.find(self.encode(
+            board.masks[player_id], board.mask, self.width, self.height))
+        if value is None:
+            return None
+        return (value & 3) - 1, value >> 2
+
+    def best_move(self,
+                  board: Board,
+                  player_id: int) -> Optional[tuple[int, int, int]]:
+        """Find the perfect move of the player to move.
+
+        The fastest win, a draw, or the slowest loss, the first column
+        of the equal ones.
+
+        Args:
+            board: the board of the position.
+            player_id: ID of the player to move.
+
+        Returns:
+            Optional[tuple[int, int, int]]: column, WIN, DRAW or LOSS
+                                            after it and the distance,
+                                            None when the position is not
+                                            in the tablebase.
+
+        Raises:
+            None
+        """
+        if player_id not in (0, 1) or not self._covers(board) or \
+                not board.open_columns:
+            return None
+
+        current: int = board.masks[player_id]
+        mask: int = board.mask
+        full: int = self.board.board_mask
+        best: Optional[tuple[int, int, int]] = None
+        best_rank: tuple[int, int] = (-2, 0)
+        for column in range(0, self.width):
+            if not board.is_open(column):
+                continue
+            move: int = (mask + (1 << (column * self.board.stride))) & ~mask
+
+            result: int
+            distance: int
+            if self.board.has_line(current | move):
+                result, distance = self.WIN, 1
+            elif mask | move == full:
+                result, distance = self.DRAW, 1
+            else:
+                value: Optional[int] = self.find(self.encode(
+                    (current | move) ^ (mask | move), mask | move,
+                    self.width, self.height))
+                if value is None:
+                    return None
+                # the result of the opponent, one move later
+                result, distance = 1 - (value & 3), (value >> 2) + 1
+
+            # faster wins and slower losses first
+            rank: tuple[int, int] = (
+                result, -distance if result == self.WIN else distance)
+            if best_rank < rank:
+                best_rank = rank
+                best = (column, result, distance)
+        return best
+
+    def close(self):
+        """Unmap and close the tablebase file.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self.memory is not None:
+            self.memory.close()
+            self.memory = None
+        self.file.close()
@@ -0,0 +1,276 @@
+from typing import Callable, Iterator, Optional
+
+import os
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+from ..Board.Board import Board
+from .Tablebase import Tablebase
+
+
+class TablebaseBuilder:
+    """Solve all the late positions of a small board by retrograde
+    analysis and write a tablebase.
+
+    Positions are found layer by layer from the empty board, a layer
+    is all the positions of the same number of stones, without the ones
+    where somebody has won, and one of every mirror pair. Stones only
+    ever get added, so the results are then found backwards from the
+    full board: every position of a layer takes the best of its moves,
+    whose results are all in the layer above, solved before.
+
+    A layer is kept as a sorted array of the codes of its positions,
+    see Tablebase, 8 bytes a position, and the position is decoded from
+    its code when it is solved, the values take 2 bytes more. Only the
+    layer being found and the one before it are in memory until
+    min_stones, so raising min_stones builds the late layers of larger
+    boards, and the memory is taken by the kept layers and the largest
+    layer on the way. The 67 thousand positions of 4x4 build in about
+    two seconds, the million and a half of 5x4 in under a minute and
+    50 MB, the 25 million of 5x5 in about a quarter of an hour and
+    half a gigabyte. 6x5 is out of reach whatever the min_stones, it
+    has hundreds of millions of positions, a single middle layer more
+    than the whole of 5x5, and all of them are found on the way to the
+    late ones.
+
+    Args:
+        width: width of the board.
+        height: height of the board.
+        line_length: length of a winning line.
+        min_stones: positions of at least this many stones are solved.
+
+    Attributes:
+        width, height, line_length, min_stones: as given.
+
+    Methods:
+        layers(): Positions of the tablebase, layer by layer.
+        solve(): Values of the positions.
+        build(path, report): Solve the positions and write the tablebase.
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 line_length: int,
+                 min_stones: int = 0):
+        """Check the settings of the tablebase.
+
+        Args:
+            width: width of the board.
+            height: height of the board.
+            line_length: length of a winning line.
+            min_stones: positions of at least this many stones are solved.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the board is wrong, see Board.
+            ValueError: If the codes of the board do not fit in 64 bits.
+            ValueError: If min_stones is not from 0 to the number of cells.
+        """
+        self.board: Board = Board(width, height, line_length, quiet=True)
+
+        if 64 < width * self.board.stride:
+            raise ValueError(
+                "Codes of the board should fit in 64 bits, and not",
+                width * self.board.stride)
+        if not 0 <= min_stones <= width * height:
+            raise ValueError(
+                "Number of stones should be from 0 to", width * height,
+                ", and not", min_stones)
+
+        self.width: int = width
+        self.height: int = height
+        self.line_length: int = line_length
+        self.min_stones: int = min_stones
+
+    def _decode(self, code: int) -> tuple[int, int]:
+        """Get the stones of the player to move and all the stones.
+
+        A column of the code is the stones of the player plus the stones
+        of the column, one less than a power of two, so with one more
+        the highest bit tells the height of the column.
+        """
+        stride: int = self.board.stride
+        column_bits: int = (1 << stride) - 1
+        current: int = 0
+        mask: int = 0
+        for column in range(0, self.width):
+            shift: int = column * stride
+            bits: int = ((code >> shift) & column_bits) + 1
+            top: int = 1 << (bits.bit_length() - 1)
+            current |= (bits - top) << shift
+            mask |= (top - 1) << shift
+        return current, mask
+
+    def _moves(self, current: int, mask: int) -> list[tuple[int, bool]]:
+        """Get the new masks of the legal moves, and if they win."""
+        board: Board = self.board
+        moves: list[tuple[int, bool]] = []
+        for column in range(0, self.width):
+            if not mask & (1 << (column * board.stride + self.height - 1)):
+                move: int = (mask + (1 << (column * board.stride))) & ~mask
+                moves.append((mask | move, board.has_line(current | move)))
+        return moves
+
+    def layers(self,
+               report: Optional[Callable[[int, int], None]] = None
+               ) -> list[array]:
+        """Find the positions, layer by layer.
+
+        Args:
+            report: optional function called with the number of stones
+                    and of the positions of every layer found.
+
+        Returns:
+            list[array]: sorted codes of the positions of every layer
+                         from min_stones up, without the full board.
+
+        Raises:
+            None
+        """
+        n_cells: int = self.width * self.height
+        layer: array = array('Q', [0])
+        kept: list[array] = []
+        for n_stones in range(0, n_cells):
+            if report is not None:
+                report(n_stones, len(layer))
+            if self.min_stones <= n_stones:
+                kept.append(layer)
+            if n_stones + 1 == n_cells:
+                break
+
+            following: set[int] = set()
+            for code in layer:
+                current, mask = self._decode(code)
+                for new_mask, wins in self._moves(current, mask):
+                    if not wins:
+                        # the opponent is to move
+                        following.add(Tablebase.encode(
+                            (current | new_mask ^ mask) ^ new_mask,
+                            new_mask, self.width, self.height))
+            layer = array('Q', sorted(following))
+            del following
+        return kept
+
+    def solve(self,
+              report: Optional[Callable[[int, int], None]] = None
+              ) -> list[tuple[array, array]]:
+        """Find the values of the positions, see Tablebase.
+
+        Args:
+            report: optional function called with the number of stones
+                    and of the positions of every layer found and solved.
+
+        Returns:
+            list[tuple[array, array]]: sorted codes of every layer from
+                                       min_stones up, and their values.
+
+        Raises:
+            None
+        """
+        layers: list[array] = self.layers(report)
+        full: int = self.board.board_mask
+
+        solved: list[tuple[array, array]] = []
+        following: array = array('Q')
+        following_values: array = array('H')
+        for n_stones in range(len(layers) - 1, -1, -1):
+            layer: array = layers[n_stones]
+            values: array = array('H', bytes(2 * len(layer)))
+            for i, code in enumerate(layer):
+                current, mask = self._decode(code)
+                best_rank: tuple[int, int] = (-2, 0)
+                for new_mask, wins in self._moves(current, mask):
+                    result: int
+                    distance: int
+                    if wins:
+                        result, distance = Tablebase.WIN, 1
+                    elif new_mask == full:
+                        result, distance = Tablebase.DRAW, 1
+                    else:
+                        # the result of the opponent, one move later
+                        value: int = following_values[bisect_left(
+                            following, Tablebase.encode(
+                                (current | new_mask ^ mask) ^ new_mask,
+                                new_mask, self.width, self.height))]
+                        result, distance = 1 - (value & 3), (value >> 2) + 1
+
+                    # faster wins and slower losses first
+                    rank: tuple[int, int] = (
+                        result,
+                        -distance if result == Tablebase.WIN else distance)
+                    if best_rank < rank:
+                        best_rank = rank
+
+                result, distance = best_rank[0], abs(best_rank[1])
+                values[i] = result + 1 | distance << 2
+
+            solved.append((layer, values))
+            following, following_values = layer, values
+            if report is not None:
+                report(self.min_stones + n_stones, len(layer))
+        return solved
+
+    def build(self,
+              path: str,
+              report: Optional[Callable[[int, int], None]] = None) -> int:
+        """Solve the positions and write the tablebase.
+
+        The tablebase is written to a temporary file first and moved in
+        place once it is complete, so readers never see half of it.
+
+        Args:
+            path: path to the tablebase file.
+            report: optional function called with the number of stones
+                    and of the positions of every layer found and solved.
+
+        Returns:
+            int: number of positions in the tablebase.
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        solved: list[tuple[array, array]] = self.solve(report)
+        n_positions: int = sum(len(codes) for codes, values in solved)
+
+        stride: int = self.height + 1
+        code_bytes: int = (self.width * stride + 7) // 8
+        value_bits: int = 2 + (self.width * self.height).bit_length()
+
+        temporary: str = path + ".tmp"
+        with open(temporary, "wb") as table:
+            table.write(Tablebase.HEADER.pack(
+                Tablebase.MAGIC, Tablebase.VERSION,
+                self.width, self.height, self.line_length, self.min_stones,
+                code_bytes, value_bits, n_positions))
+
+            # layers hold different numbers of stones, so no code is
+            # in two of them, and merging sorts them all
+            in_order: Iterator[tuple[int, int]] = merge(
+                *[zip(codes, values) for codes, values in solved])
+            values_in_order: array = array('H')
+            for code, value in in_order:
+                table.write(code.to_bytes(code_bytes, "little"))
+                values_in_order.append(value)
+
+            # value_bits a value from the lowest bit up, a byte
+            # written as soon as it is complete
+            packed: bytearray = bytearray()
+            buffer: int = 0
+            n_bits: int = 0
+            for value in values_in_order:
+                buffer |= value << n_bits
+                n_bits += value_bits
+                while 8 <= n_bits:
+                    packed.append(buffer & 0xFF)
+                    buffer >>= 8
+                    n_bits -= 8
+            if n_bits:
+                packed.append(buffer)
+            table.write(packed)
+        os.replace(temporary, path)
+
+        return n_positions
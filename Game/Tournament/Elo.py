@@ -0,0 +1,175 @@
+from math import log, log10, sqrt
+
+
+class Elo:
+    """Elo ratings updated after every game.
+
+    Next to the ratings keeps the number of games and points of every
+    player, so a confidence interval of a rating could be computed at
+    any moment from the score against the opponents met.
+
+    Args:
+        names: names of the players to rate.
+        k_factor: how far a single game moves the ratings.
+        start: rating every player starts with.
+
+    Attributes:
+        ratings: {name: rating}
+        games: {name: number of games played}
+        points: {name: 1 per win plus 0.5 per draw}
+
+    Methods:
+        expected(a, b): Expected score of a against b.
+        update(a, b, score): Update ratings after a game.
+        interval(name): Confidence interval of the rating.
+        get_table(): Ratings with intervals, best first.
+    """
+
+    # Two-sided 95% normal quantile
+    Z_95: float = 1.96
+
+    def __init__(self,
+                 names: list[str],
+                 k_factor: float = 16.0,
+                 start: float = 1500.0):
+        """Give every player the starting rating.
+
+        Args:
+            names: names of the players to rate.
+            k_factor: how far a single game moves the ratings.
+            start: rating every player starts with.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If k_factor is not positive.
+        """
+        if k_factor <= 0:
+            raise ValueError(
+                "K-factor should be positive, and not", k_factor)
+
+        self.k_factor: float = k_factor
+        self.ratings: dict[str, float] = {name: start for name in names}
+        self.games: dict[str, int] = {name: 0 for name in names}
+        self.points: dict[str, float] = {name: 0.0 for name in names}
+        self.opponents: dict[str, float] = {name: 0.0 for name in names}
+
+    def expected(self, a: str, b: str) -> float:
+        """Expected score of a against b.
+
+        Args:
+            a: name of a player.
+            b: name of the opponent.
+
+        Returns:
+            float: from 0 (sure loss) to 1 (sure win).
+
+        Raises:
+            KeyError: If a player is unknown.
+        """
+        return 1 / (1 + 10 ** ((self.ratings[b] - self.ratings[a]) / 400))
+
+    def update(self, a: str, b: str, score: float):
+        """Update ratings after a game.
+
+        Args:
+            a: name of a player.
+            b: name of the opponent.
+            score: 1 when a won, 0.5 on a draw, 0 when b won.
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: If a player is unknown.
+        """
+        delta: float = self.k_factor * (score - self.expected(a, b))
+
+        self.opponents[a] += self.ratings[b]
+        self.opponents[b] += self.ratings[a]
+        self.ratings[a] += delta
+        self.ratings[b] -= delta
+        self.games[a] += 1
+        self.games[b] += 1
+        self.points[a] += score
+        self.points[b] += 1 - score
+
+    def interval(self, name: str) -> tuple[float, float]:
+        """Confidence interval of the rating.
+
+        The score against the average opponent is a binomial proportion,
+        its standard error is turned into Elo points through the slope
+        of the logistic curve at this score.
+
+        Args:
+            name: name of a player.
+
+        Returns:
+            tuple[float, float]: 95% interval around the rating,
+                                 infinite when no games are played.
+
+        Raises:
+            KeyError: If a player is unknown.
+        """
+        n: int = self.games[name]
+        rating: float = self.ratings[name]
+        if n == 0:
+            return (float("-inf"), float("inf"))
+
+        # Keep the score away from 0 and 1 where the slope is infinite
+        p: float = self.points[name] / n
+        p = min(max(p, 0.5 / n), 1 - 0.5 / n)
+
+        error: float = 400 / log(10) / sqrt(n * p * (1 - p))
+        margin: float = self.Z_95 * error
+        return (rating - margin, rating + margin)
+
+    def performance(self, name: str) -> float:
+        """Rating that explains the score against the opponents met.
+
+        Args:
+            name: name of a player.
+
+        Returns:
+            float: performance rating, the current rating without games.
+
+        Raises:
+            KeyError: If a player is unknown.
+        """
+        n: int = self.games[name]
+        if n == 0:
+            return self.ratings[name]
+
+        p: float = self.points[name] / n
+        p = min(max(p, 0.5 / n), 1 - 0.5 / n)
+        return self.opponents[name] / n + 400 * log10(p / (1 - p))
+
+    def get_table(self) -> list[dict]:
+        """Ratings with intervals, best first.
+
+        Args:
+            None
+
+        Returns:
+            list[dict]: {"name", "rating", "low", "high", "games", "points",
+                         "performance"} for every player.
+
+        Raises:
+            None
+        """
+        table: list[dict] = []
+        for name in self.ratings:
+            low, high = self.interval(name)
+            table.append({
+                "name": name,
+                "rating": self.ratings[name],
+                "low": low,
+                "high": high,
+                "games": self.games[name],
+                "points": self.points[name],
+                "performance": self.performance(name),
+            })
+
+        table.sort(key=lambda row: row["rating"], reverse=True)
+        return table
@@ -0,0 +1,383 @@
+from typing import Callable, Iterator, Optional
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+from ..Game import Game
+from ..Player.Player import Player
+from ..Seed.SeedSequence import SeedSequence
+from .Elo import Elo
+
+
+class Tournament:
+    """Play many games between players on all the cores.
+
+    Players are given as factories - picklable callables returning a new
+    Player, like a Player subclass or functools.partial of one - so every
+    game builds fresh players inside a worker process. Games are played
+    in the boring order without any output, and results are streamed
+    back as soon as the games finish, while Elo ratings and scores are
+    updated in the order of the pairings, a game waiting for the ones
+    before it, so the ratings are the same in whatever order the games
+    finish.
+
+    Pairings:
+        "round_robin" - every player meets every other player once as the
+            first and once as the second to move in every round, all the
+            games of all rounds are scheduled at once.
+        "swiss" - every round players with close scores meet, avoiding
+            rematches where possible, the odd player out gets a bye,
+            never twice while some other player had none.
+            Rounds are played one after the other.
+
+    With a master seed every game gets a seed derived from the round
+    and the names of its players, so the games are the same whatever
+    process plays them and in whatever order, see Seed.SeedSequence.
+
+    Args:
+        roster: {name: factory of a Player}.
+        board: {"width": int, "height": int, "line_length": int}.
+        pairing: "round_robin" or "swiss".
+        rounds: number of rounds.
+        workers: number of processes, None for one per core,
+                 0 to play in the current process.
+        k_factor: K-factor of the Elo ratings.
+        seed: optional master seed of all the games.
+
+    Attributes:
+        elo: Elo ratings of the players.
+        scores: {name: points} for Swiss pairings.
+        results: list of results of the games played, in the order
+                 of the pairings.
+        byes: names of the players who had a bye.
+
+    Methods:
+        run(): Play the games and yield their results.
+        play_match(factories, board, seed): Play a single game.
+    """
+
+    PAIRINGS: tuple[str, str] = ("round_robin", "swiss")
+
+    def __init__(self,
+                 roster: dict[str, Callable[[], Player]],
+                 board: dict,
+                 pairing: str = "round_robin",
+                 rounds: int = 1,
+                 workers: Optional[int] = None,
+                 k_factor: float = 16.0,
+                 seed: Optional[int] = None):
+        """Check the settings of the tournament.
+
+        Args:
+            roster: {name: factory of a Player}.
+            board: {"width": int, "height": int, "line_length": int}.
+            pairing: "round_robin" or "swiss".
+            rounds: number of rounds.
+            workers: number of processes, None for one per core,
+                     0 to play in the current process.
+            k_factor: K-factor of the Elo ratings.
+            seed: optional master seed of all the games.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there are less than two players.
+            ValueError: If pairing is unknown.
+            ValueError: If rounds is not positive.
+        """
+        if len(roster) < 2:
+            raise ValueError(
+                "Tournament needs at least two players, and not", len(roster))
+
+        if pairing not in self.PAIRINGS:
+            raise ValueError(
+                "Pairing should be one of", self.PAIRINGS,
+                ", and not", pairing)
+
+        if rounds < 1:
+            raise ValueError(
+                "Number of rounds should be positive, and not", rounds)
+
+        self.roster: dict[str, Callable[[], Player]] = roster
+        self.board: dict = board
+        self.pairing: str = pairing
+        self.rounds: int = rounds
+        self.workers: Optional[int] = workers
+        self.seeds: Optional[SeedSequence] = (
+            None if seed is None else SeedSequence(seed))
+
+        self.elo: Elo = Elo(list(roster), k_factor)
+        self.scores: dict[str, float] = {name: 0.0 for name in roster}
+        self.met: set[tuple[str, str]] = set()
+        self.byes: set[str] = set()
+        self.results: list[dict] = []
+
+    @staticmethod
+    def play_match(factories: list[Callable[[], Player]],
+                   board: dict,
+                   seed: Optional[SeedSequence] = None) -> tuple[int, int]:
+        """Play a single game, this is what runs in the worker processes.
+
+        Args:
+            factories: factories of the players in the order of moves.
+            board: {"width": int, "height": int, "line_length": int}.
+            seed: optional seed of the game, see Game settings["seed"].
+
+        Returns:
+            tuple[int, int]: seat of the winner or -1 on a draw,
+                             and the number of stones placed.
+
+        Raises:
+            None
+        """
+        settings: dict = {
+            "players": [factory() for factory in factories],
+            "board": board,
+            "quiet": True,
+        }
+        if seed is not None:
+            settings["seed"] = seed
+        game: Game = Game(settings)
+        stats: dict = game.simulate(1)
+
+        winner: int = -1
+        if 1 in stats["wins"]:
+            winner = stats["wins"].index(1)
+
+        return winner, stats["moves"]
+
+    def _round_robin(self) -> list[tuple[int, str, str]]:
+        """Get games of all the rounds of a round robin.
+
+        Args:
+            None
+
+        Returns:
+            list[tuple[int, str, str]]: round, first and second player.
+
+        Raises:
+            None
+        """
+        names: list[str] = list(self.roster)
+        return [
+            (i_round, first, second)
+            for i_round in range(0, self.rounds)
+            for first in names
+            for second in names
+            if first != second
+        ]
+
+    def _swiss(self, i_round: int) -> list[tuple[int, str, str]]:
+        """Get games of a round of a Swiss tournament.
+
+        Players are sorted by points and paired top down, every player
+        takes the closest opponent below it in the table who was not met
+        yet, or the closest one if all of them were met.
+
+        Args:
+            i_round: index of the round.
+
+        Returns:
+            list[tuple[int, str, str]]: round, first and second player.
+
+        Raises:
+            None
+        """
+        standings: list[str] = sorted(
+            self.roster, key=lambda name: self.scores[name], reverse=True)
+
+        # The odd player out with the least points gets a bye,
+        # among the players who had none, once everyone had one
+        # it starts over
+        if len(standings) % 2 == 1:
+            if self.byes.issuperset(standings):
+                self.byes.clear()
+            bye: str = [
+                name for name in standings if name not in self.byes][-1]
+            standings.remove(bye)
+            self.byes.add(bye)
+            self.scores[bye] += 1
+
+        games: list[tuple[int, str, str]] = []
+        while standings:
+            player: str = standings.pop(0)
+            opponent: str = standings[0]
+            for name in standings:
+                if (player, name) not in self.met:
+                    opponent = name
+                    break
+            standings.remove(opponent)
+
+            self.met.add((player, opponent))
+            self.met.add((opponent, player))
+
+            # Colors alternate between the rounds
+            if i_round % 2 == 0:
+                games.append((i_round, player, opponent))
+            else:
+                games.append((i_round, opponent, player))
+
+        return games
+
+    @staticmethod
+    def _result(game: tuple[int, str, str],
+                winner: int,
+                moves: int) -> dict:
+        """Describe the result of a game.
+
+        Args:
+            game: round, first and second player.
+            winner: seat of the winner or -1 on a draw.
+            moves: number of stones placed.
+
+        Returns:
+            dict: {"round", "first", "second", "winner", "moves"},
+                  winner is the name or None on a draw.
+
+        Raises:
+            None
+        """
+        i_round, first, second = game
+
+        name: Optional[str] = None
+        if winner == 0:
+            name = first
+        elif winner == 1:
+            name = second
+
+        return {
+            "round": i_round,
+            "first": first,
+            "second": second,
+            "winner": name,
+            "moves": moves,
+        }
+
+    def _record(self, result: dict):
+        """Update the ratings and scores with the result of a game.
+
+        Args:
+            result: result of the game, see _result().
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        first: str = result["first"]
+        second: str = result["second"]
+
+        score: float = 0.5
+        if result["winner"] == first:
+            score = 1.0
+        elif result["winner"] == second:
+            score = 0.0
+
+        self.elo.update(first, second, score)
+        self.scores[first] += score
+        self.scores[second] += 1 - score
+        self.results.append(result)
+
+    def _seed(self,
+              game: tuple[int, str, str]) -> Optional[SeedSequence]:
+        """Derive the seed of a game from the master seed.
+
+        Args:
+            game: round, first and second player.
+
+        Returns:
+            Optional[SeedSequence]: seed of the game,
+                                    None without a master seed.
+
+        Raises:
+            None
+        """
+        if self.seeds is None:
+            return None
+        return self.seeds.child("game", *game)
+
+    def _play(self,
+              executor: Optional[ProcessPoolExecutor],
+              games: list[tuple[int, str, str]]) -> Iterator[dict]:
+        """Play a batch of games and yield their results as they finish.
+
+        Results of a pool are yielded as soon as the games finish, but
+        recorded in the order of the games: a result waits for the ones
+        before it, so the ratings are updated in the same order as in
+        the current process and do not change from run to run.
+
+        Args:
+            executor: pool of processes or None to play here.
+            games: round, first and second player of every game.
+
+        Returns:
+            Iterator[dict]: results, see _result().
+
+        Raises:
+            None
+        """
+        if executor is None:
+            for game in games:
+                winner, moves = self.play_match(
+                    [self.roster[game[1]], self.roster[game[2]]],
+                    self.board, self._seed(game))
+                result: dict = self._result(game, winner, moves)
+                self._record(result)
+                yield result
+            return
+
+        futures: dict[Future, int] = {
+            executor.submit(
+                Tournament.play_match,
+                [self.roster[game[1]], self.roster[game[2]]],
+                self.board,
+                self._seed(game)
+            ): i for i, game in enumerate(games)
+        }
+
+        # Results that finished before some of the games in front of them
+        waiting: dict[int, dict] = {}
+        following: int = 0
+        for future in as_completed(futures):
+            i: int = futures[future]
+            winner, moves = future.result()
+            result = self._result(games[i], winner, moves)
+
+            waiting[i] = result
+            while following in waiting:
+                self._record(waiting.pop(following))
+                following += 1
+            yield result
+
+    def run(self) -> Iterator[dict]:
+        """Play the games and yield their results as they finish.
+
+        Ratings, scores and Tournament.results take the results in the
+        order of the pairings, and are complete once the iterator is.
+        Swiss rounds are played one after the other, so all the results
+        of a round are recorded before the next round is paired.
+
+        Args:
+            None
+
+        Returns:
+            Iterator[dict]: {"round", "first", "second", "winner", "moves"}
+                            for every game, winner is None on a draw.
+
+        Raises:
+            None
+        """
+        executor: Optional[ProcessPoolExecutor] = None
+        if self.workers != 0:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            if self.pairing == "round_robin":
+                yield from self._play(executor, self._round_robin())
+            else:
+                for i_round in range(0, self.rounds):
+                    yield from self._play(executor, self._swiss(i_round))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
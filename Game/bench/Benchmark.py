@@ -0,0 +1,151 @@
+from typing import Callable
+
+from math import sqrt
+from random import Random
+from statistics import median, quantiles
+from time import perf_counter
+
+
+class Benchmark:
+    """A seeded workload timed over several rounds.
+
+    The setup gets a random generator seeded with the seed of the run
+    and prepares everything the workload needs, so the preparation is
+    not timed and every run of the same seed does the same work. It
+    returns the round - a function doing the work once and returning
+    the number of operations it made, like moves or boards.
+
+    The speed of a machine shared with others changes from minute to
+    minute, up to twice on a busy virtual machine, so every round is
+    preceded by a round of calibration(), a fixed loop of plain Python,
+    and the time of the round is also taken relative to it. Relative
+    times of the same code stay close from run to run, whatever the
+    speed of the machine at the moment.
+
+    Args:
+        name: unique name of the benchmark.
+        setup: function of a generator returning the round.
+        description: what is measured.
+
+    Attributes:
+        name, setup, description: as given.
+
+    Methods:
+        calibration(): Run the calibration loop once.
+        run(seed, repeat): Time the rounds.
+    """
+
+    # Iterations of the calibration loop, a few milliseconds
+    CALIBRATION_LOOPS: int = 20000
+
+    def __init__(self,
+                 name: str,
+                 setup: Callable[[Random], Callable[[], int]],
+                 description: str = ""):
+        """Describe the benchmark, nothing is run yet.
+
+        Args:
+            name: unique name of the benchmark.
+            setup: function of a generator returning the round.
+            description: what is measured.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self.name: str = name
+        self.setup: Callable[[Random], Callable[[], int]] = setup
+        self.description: str = description
+
+    @classmethod
+    def calibration(cls) -> int:
+        """Run the calibration loop once, the same work in every run.
+
+        Args:
+            None
+
+        Returns:
+            int: number of operations, iterations of the loop.
+
+        Raises:
+            None
+        """
+        total: int = 0
+        values: dict[int, int] = {}
+        items: list[int] = []
+        for i in range(0, cls.CALIBRATION_LOOPS):
+            total += (i * 7) & 255
+            values[i & 1023] = total
+            items.append(values.get(i & 511, 0))
+        return cls.CALIBRATION_LOOPS
+
+    def run(self, seed: int = 0, repeat: int = 9) -> dict:
+        """Time the rounds of the workload.
+
+        One round is run first without timing, to warm the caches up.
+        Every timed round is preceded by a timed round of calibration().
+
+        Args:
+            seed: seed of the workload.
+            repeat: number of timed rounds.
+
+        Returns:
+            dict: timings
+                {
+                    "ops": operations per round,
+                    "best": seconds per operation of the fastest round,
+                    "median": seconds per operation, median of the rounds,
+                    "ops_per_second": operations per second of the best,
+                    "calibration": seconds per operation of
+                                   calibration(), median of the rounds,
+                    "relative": time of the round over the time of
+                                its calibration, median of the rounds,
+                    "noise": uncertainty of the relative time, the
+                             upper over the lower quartile of the rounds
+                             less one, over the square root of the
+                             number of rounds, 0.0 for a single round
+                }
+
+        Raises:
+            ValueError: If repeat is not positive.
+        """
+        if repeat <= 0:
+            raise ValueError(
+                "Number of rounds should be positive, and not", repeat)
+
+        work: Callable[[], int] = self.setup(Random(seed))
+        work()
+        self.calibration()
+
+        ops: int = 0
+        times: list[float] = []
+        calibrations: list[float] = []
+        relatives: list[float] = []
+        for i in range(0, repeat):
+            start: float = perf_counter()
+            loops: int = self.calibration()
+            calibrations.append((perf_counter() - start) / loops)
+
+            start = perf_counter()
+            ops = work()
+            times.append((perf_counter() - start) / max(1, ops))
+            relatives.append(times[-1] / calibrations[-1])
+
+        # The median of many rounds is surer than any of them
+        noise: float = 0.0
+        if 1 < repeat:
+            quartiles: list[float] = quantiles(relatives, n=4)
+            noise = (quartiles[2] / quartiles[0] - 1) / sqrt(repeat)
+
+        best: float = min(times)
+        return {
+            "ops": ops,
+            "best": best,
+            "median": median(times),
+            "ops_per_second": 1 / best if 0 < best else 0.0,
+            "calibration": median(calibrations),
+            "relative": median(relatives),
+            "noise": noise
+        }
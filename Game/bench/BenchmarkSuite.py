@@ -0,0 +1,403 @@
+from typing import Callable, Optional
+
+import json
+import platform
+from random import Random
+
+from ..Board.Board import Board
+from ..Board.LineBoard import LineBoard
+from ..Game import Game
+from ..Player.Player import Player
+from ..Player.PlayerAlgoRandom import PlayerAlgoRandom
+from ..Player.PlayerAlgoRandomLegal import PlayerAlgoRandomLegal
+from ..Seed.SeedSequence import SeedSequence
+from .Benchmark import Benchmark
+
+
+class BenchmarkSuite:
+    """Benchmarks of the hot paths of the Board and of whole games.
+
+    Results of a run are a JSON-friendly dict, saved and compared to a
+    stored baseline: a benchmark regressed when its time relative to
+    the calibration loop, see Benchmark, is slower than the baseline by
+    more than the threshold and the noise of both runs.
+
+    Args:
+        benchmarks: benchmarks to run, all of default() by default.
+
+    Attributes:
+        benchmarks: benchmarks to run.
+
+    Methods:
+        default(): The standard benchmarks.
+        run(pattern, seed, repeat, report): Run the benchmarks.
+        compare(results, baseline, threshold): Find the regressions.
+        save(results, path), load(path): JSON files of the results.
+    """
+
+    def __init__(self, benchmarks: Optional[list[Benchmark]] = None):
+        """Collect the benchmarks.
+
+        Args:
+            benchmarks: benchmarks to run, all of default() by default.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if benchmarks is None:
+            benchmarks = self.default()
+        self.benchmarks: list[Benchmark] = benchmarks
+
+    @staticmethod
+    def random_games(generator: Random,
+                     board: Board,
+                     n_games: int,
+                     n_players: int = 2) -> list[list[int]]:
+        """Play random legal games on the board and keep their columns.
+
+        Args:
+            generator: seeded random generator.
+            board: board to play on, reset before every game.
+            n_games: number of games.
+            n_players: number of players moving in turns.
+
+        Returns:
+            list[list[int]]: columns of the moves of every game.
+
+        Raises:
+            None
+        """
+        games: list[list[int]] = []
+        for i_game in range(0, n_games):
+            board.reset()
+            while not board.is_solved():
+                open_columns: list[int] = [
+                    j for j in range(0, board.width)
+                    if board.columns_height[j] < board.height
+                ]
+                board.apply(generator.choice(open_columns),
+                            len(board.column_moves) % n_players, "Player")
+            games.append(list(board.column_moves))
+        return games
+
+    @staticmethod
+    def board_init(width: int, height: int, line_length: int,
+                   n_boards: int) -> Callable[[Random], Callable[[], int]]:
+        """Create empty boards."""
+        def setup(generator: Random) -> Callable[[], int]:
+            def work() -> int:
+                for i in range(0, n_boards):
+                    Board(width, height, line_length, quiet=True)
+                return n_boards
+            return work
+        return setup
+
+    @staticmethod
+    def board_apply(engine: type, width: int, height: int, line_length: int,
+                    n_games: int) -> Callable[[Random], Callable[[], int]]:
+        """Replay random games move by move with Board.apply()."""
+        def setup(generator: Random) -> Callable[[], int]:
+            board: Board = engine(width, height, line_length, quiet=True)
+            games: list[list[int]] = BenchmarkSuite.random_games(
+                generator, board, n_games)
+
+            def work() -> int:
+                n_moves: int = 0
+                for game in games:
+                    board.reset()
+                    for i, column in enumerate(game):
+                        board.apply(column, i % 2, "Player")
+                    n_moves += len(game)
+                return n_moves
+            return work
+        return setup
+
+    @staticmethod
+    def board_put(width: int, height: int, line_length: int,
+                  n_games: int) -> Callable[[Random], Callable[[], int]]:
+        """Put all the stones of random games and take them back."""
+        def setup(generator: Random) -> Callable[[], int]:
+            board: Board = Board(width, height, line_length, quiet=True)
+            games: list[list[int]] = BenchmarkSuite.random_games(
+                generator, board, n_games)
+            board.reset()
+
+            def work() -> int:
+                n_moves: int = 0
+                for game in games:
+                    for i, column in enumerate(game):
+                        board._put(column, i % 2)
+                    for i in range(len(game) - 1, -1, -1):
+                        board._unput(game[i], i % 2)
+                    n_moves += len(game)
+                return n_moves
+            return work
+        return setup
+
+    @staticmethod
+    def board_check(width: int, height: int, line_length: int,
+                    n_games: int) -> Callable[[Random], Callable[[], int]]:
+        """Look for a line after the last move of random positions."""
+        def setup(generator: Random) -> Callable[[], int]:
+            boards: list[Board] = []
+            games: list[list[int]] = BenchmarkSuite.random_games(
+                generator, Board(width, height, line_length, quiet=True),
+                n_games)
+            for game in games:
+                board: Board = Board(width, height, line_length, quiet=True)
+                # stop before the end, most positions have no line
+                board.replay(game[:generator.randrange(1, len(game) + 1)])
+                boards.append(board)
+
+            def work() -> int:
+                for i in range(0, 10):
+                    for board in boards:
+                        board._check(board.column_moves[-1])
+                return 10 * len(boards)
+            return work
+        return setup
+
+    @staticmethod
+    def board_replay(width: int, height: int, line_length: int,
+                     n_games: int) -> Callable[[Random], Callable[[], int]]:
+        """Load random games at once with Board.replay()."""
+        def setup(generator: Random) -> Callable[[], int]:
+            board: Board = Board(width, height, line_length, quiet=True)
+            games: list[list[int]] = BenchmarkSuite.random_games(
+                generator, board, n_games)
+
+            def work() -> int:
+                for game in games:
+                    board.replay(game)
+                return sum(len(game) for game in games)
+            return work
+        return setup
+
+    @staticmethod
+    def board_str(width: int, height: int, line_length: int,
+                  n_boards: int) -> Callable[[Random], Callable[[], int]]:
+        """Print out boards with a random game on them."""
+        def setup(generator: Random) -> Callable[[], int]:
+            board: Board = Board(width, height, line_length, quiet=True)
+            BenchmarkSuite.random_games(generator, board, 1)
+
+            def work() -> int:
+                for i in range(0, n_boards):
+                    str(board)
+                return n_boards
+            return work
+        return setup
+
+    @staticmethod
+    def game_boring(width: int, height: int, line_length: int,
+                    n_players: int,
+                    n_games: int,
+                    legal: bool = False
+                    ) -> Callable[[Random], Callable[[], int]]:
+        """Play whole games of random players by Game.simulate(),
+        of PlayerAlgoRandomLegal when legal is True."""
+        def setup(generator: Random) -> Callable[[], int]:
+            seed: int = generator.getrandbits(32)
+            players: list[Player] = [
+                PlayerAlgoRandomLegal(max_sleep=0) if legal
+                else PlayerAlgoRandom(n_moves=width, max_sleep=0)
+                for i in range(0, n_players)
+            ]
+            game: Game = Game({
+                "players": players,
+                "board": {
+                    "width": width,
+                    "height": height,
+                    "line_length": line_length
+                },
+                "quiet": True
+            })
+
+            def work() -> int:
+                # the same games every run, from generators of their own
+                seeds: SeedSequence = SeedSequence(seed)
+                for i, player in enumerate(players):
+                    player.set_generator(
+                        seeds.child("player", i).generator())
+                game.simulate(n_games)
+                return n_games
+            return work
+        return setup
+
+    @classmethod
+    def default(cls) -> list[Benchmark]:
+        """The standard benchmarks, a few seconds in total.
+
+        Args:
+            None
+
+        Returns:
+            list[Benchmark]: the benchmarks.
+
+        Raises:
+            None
+        """
+        return [
+            Benchmark("board_init_7x6", cls.board_init(7, 6, 4, 2000),
+                      "Board.__init__ of the classic board"),
+            Benchmark("board_init_50x50", cls.board_init(50, 50, 10, 200),
+                      "Board.__init__ of a large m,n,k board"),
+            Benchmark("board_apply_7x6",
+                      cls.board_apply(Board, 7, 6, 4, 200),
+                      "Board.apply per move, random games"),
+            Benchmark("board_apply_50x50",
+                      cls.board_apply(Board, 50, 50, 10, 2),
+                      "Board.apply per move, large m,n,k board"),
+            Benchmark("line_board_apply_50x50",
+                      cls.board_apply(LineBoard, 50, 50, 10, 2),
+                      "LineBoard.apply per move, large m,n,k board"),
+            Benchmark("board_put_7x6", cls.board_put(7, 6, 4, 200),
+                      "Board._put and Board._unput per move"),
+            Benchmark("board_check_7x6", cls.board_check(7, 6, 4, 200),
+                      "Board._check per call, random positions"),
+            Benchmark("board_check_50x50", cls.board_check(50, 50, 10, 5),
+                      "Board._check per call, large m,n,k board"),
+            Benchmark("board_replay_7x6", cls.board_replay(7, 6, 4, 200),
+                      "Board.replay per move, random games"),
+            Benchmark("board_str_7x6", cls.board_str(7, 6, 4, 1000),
+                      "Board.__str__ of the classic board"),
+            Benchmark("board_str_50x50", cls.board_str(50, 50, 10, 20),
+                      "Board.__str__ of a large m,n,k board"),
+            Benchmark("game_boring_2p_7x6",
+                      cls.game_boring(7, 6, 4, 2, 200),
+                      "whole random games of 2 players per game"),
+            Benchmark("game_boring_4p_20x20",
+                      cls.game_boring(20, 20, 5, 4, 10),
+                      "whole random games of 4 players per game"),
+            Benchmark("game_legal_2p_7x6",
+                      cls.game_boring(7, 6, 4, 2, 200, legal=True),
+                      "whole random legal games of 2 players per game"),
+            Benchmark("game_legal_2p_6x40",
+                      cls.game_boring(6, 40, 6, 2, 20, legal=True),
+                      "whole random legal games on a tall board"),
+            Benchmark("game_boring_2p_6x40",
+                      cls.game_boring(6, 40, 6, 2, 20),
+                      "whole random games on a tall board"),
+        ]
+
+    def run(self,
+            pattern: str = "",
+            seed: int = 0,
+            repeat: int = 9,
+            report: Optional[Callable[[str, dict], None]] = None) -> dict:
+        """Run the benchmarks with the pattern in their names.
+
+        Args:
+            pattern: substring of the names, all the benchmarks by default.
+            seed: seed of the workloads.
+            repeat: number of timed rounds of every benchmark.
+            report: optional function called with the name and the
+                    timings of every benchmark once it is done.
+
+        Returns:
+            dict: results
+                {
+                    "seed": seed, "repeat": repeat,
+                    "python": version of Python, "machine": platform,
+                    "benchmarks": {name: timings, see Benchmark.run()}
+                }
+
+        Raises:
+            None
+        """
+        timings: dict[str, dict] = {}
+        for benchmark in self.benchmarks:
+            if pattern in benchmark.name:
+                timings[benchmark.name] = benchmark.run(seed, repeat)
+                if report is not None:
+                    report(benchmark.name, timings[benchmark.name])
+
+        return {
+            "seed": seed,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "benchmarks": timings
+        }
+
+    @staticmethod
+    def compare(results: dict,
+                baseline: dict,
+                threshold: float = 0.2) -> dict[str, dict]:
+        """Compare the results to a baseline.
+
+        Relative times are compared, and the noise of both runs, see
+        Benchmark.run(), is allowed on top of the threshold. Baselines
+        without relative times are compared by the best times alone.
+
+        Args:
+            results: results of run().
+            baseline: results of an earlier run().
+            threshold: allowed slow down, 0.2 for 20% slower.
+
+        Returns:
+            dict: for every benchmark in both
+                {name: {"ratio": time / time of the baseline,
+                        "allowed": slow down allowed with the noise,
+                        "regression": True when slower than allowed}}
+
+        Raises:
+            None
+        """
+        comparison: dict[str, dict] = {}
+        for name, timings in results["benchmarks"].items():
+            if name not in baseline["benchmarks"]:
+                continue
+            base_timings: dict = baseline["benchmarks"][name]
+
+            key: str = "best"
+            allowed: float = threshold
+            if "relative" in timings and "relative" in base_timings:
+                key = "relative"
+                allowed += timings["noise"] + base_timings["noise"]
+
+            base: float = base_timings[key]
+            ratio: float = timings[key] / base if 0 < base else 1.0
+            comparison[name] = {
+                "ratio": ratio,
+                "allowed": allowed,
+                "regression": 1 + allowed < ratio
+            }
+        return comparison
+
+    @staticmethod
+    def save(results: dict, path: str):
+        """Write the results to a JSON file.
+
+        Args:
+            results: results of run().
+            path: path to the file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the file could not be written.
+        """
+        with open(path, "w") as output:
+            json.dump(results, output, indent=4)
+            output.write("\n")
+
+    @staticmethod
+    def load(path: str) -> dict:
+        """Read the results from a JSON file.
+
+        Args:
+            path: path to the file.
+
+        Returns:
+            dict: results of an earlier run().
+
+        Raises:
+            OSError: If the file could not be read.
+        """
+        with open(path) as source:
+            return json.load(source)
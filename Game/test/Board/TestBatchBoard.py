@@ -0,0 +1,76 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ...Board.Board import Board
+from ...Board.BatchBoard import BatchBoard
+
+
+@unittest.skipIf(np is None, "BatchBoard needs NumPy")
+class TestBatchBoard(unittest.TestCase):
+
+    def replay_and_compare(self, width, height, line_length, n_players):
+        """Play random games in a batch and replay them on Boards."""
+        batch = BatchBoard(200, width, height, line_length, n_players, seed=1)
+        history = []
+        while not batch.done.all():
+            columns = batch.random_columns()
+            history.append(np.where(batch.done, -1, columns))
+            batch.step(columns)
+
+        for i, columns in enumerate(np.array(history).T):
+            board = Board(width, height, line_length, quiet=True)
+            for k, column in enumerate(columns[columns >= 0]):
+                board.apply(int(column), k % n_players, "Player")
+            self.assertTrue(board.is_solved())
+            self.assertEqual(board.winner, batch.winner[i])
+            self.assertEqual(len(board.player_moves), batch.n_moves[i])
+
+    def test_bitboards(self):
+        self.replay_and_compare(7, 6, 4, 2)
+        self.replay_and_compare(4, 4, 3, 3)
+
+    def test_sliding_windows(self):
+        batch = BatchBoard(1, 9, 7, 4)
+        self.assertIsNone(batch.masks)
+        self.replay_and_compare(9, 7, 4, 2)
+        self.replay_and_compare(10, 8, 5, 3)
+
+    def test_step(self):
+        batch = BatchBoard(3, 7, 6, 4)
+        for i in range(0, 3):
+            self.assertFalse(batch.step([0, 1, 2]).any())
+            batch.step([6, 6, 6])
+        self.assertTrue(batch.step([0, 1, 2]).all())
+        self.assertEqual(batch.winner.tolist(), [0, 0, 0])
+        self.assertEqual(batch.cells[1, 0].tolist(), [0, 1, 0, 0, 0, 0, 2])
+
+        batch = BatchBoard(1, 7, 6, 4)
+        with self.assertRaises(ValueError):
+            batch.step([7])
+        for i in range(0, 6):
+            batch.step([0])
+        with self.assertRaises(ValueError):
+            batch.step([0])
+
+    def test_playout_from_position(self):
+        board = Board(7, 6, 4, quiet=True)
+        for column in [3, 0, 3, 0, 3]:
+            board.apply(column, len(board.player_moves) % 2, "Player")
+        batch = BatchBoard(500, 7, 6, 4, seed=2)
+        batch.set_position(board, next_player=1)
+        self.assertEqual(batch.heights[0].tolist(), board.columns_height)
+
+        stats = batch.playout()
+        self.assertEqual(stats["games"], 500)
+        self.assertEqual(sum(stats["wins"]) + stats["draws"], 500)
+        self.assertTrue(batch.done.all())
+        # player 0 threatens to win right away, random player 1 rarely blocks
+        self.assertLess(stats["wins"][1], stats["wins"][0])
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
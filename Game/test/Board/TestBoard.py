@@ -1,4 +1,5 @@
 import unittest
+from random import Random
 
 from ...Board.Board import Board
 
@@ -51,6 +52,229 @@ class TestBoard(unittest.TestCase):
         self.assertTrue(board.apply(3, player1_id, "Player1"))
         self.assertTrue(board.is_solved())
 
+    def test_winning_diagonals(self):
+        board = Board(7, 6, 4)
+        player1_id = board.next_unused_stone()
+        player2_id = board.next_unused_stone()
+        for column, player_id in [(0, player1_id), (1, player2_id),
+                                  (1, player1_id), (2, player2_id),
+                                  (2, player2_id), (2, player1_id),
+                                  (3, player2_id), (3, player2_id),
+                                  (3, player2_id)]:
+            self.assertTrue(board.apply(column, player_id, "Player"))
+            self.assertFalse(board.is_solved())
+        self.assertTrue(board.apply(3, player1_id, "Player1"))
+        self.assertTrue(board.is_solved())
+        self.assertEqual(board.winner, player1_id)
+
+        board = Board(7, 6, 4)
+        for column, player_id in [(6, player1_id), (5, player2_id),
+                                  (5, player1_id), (4, player2_id),
+                                  (4, player2_id), (4, player1_id),
+                                  (3, player2_id), (3, player2_id),
+                                  (3, player2_id)]:
+            self.assertTrue(board.apply(column, player_id, "Player"))
+            self.assertFalse(board.is_solved())
+        self.assertTrue(board.apply(3, player1_id, "Player1"))
+        self.assertTrue(board.is_solved())
+
+    def test_no_line_across_columns(self):
+        board = Board(7, 6, 4)
+        player1_id = board.next_unused_stone()
+        player2_id = board.next_unused_stone()
+        # three stones on top of the column and one in the next column
+        for i in range(0, 3):
+            board.apply(0, player2_id, "Player2")
+        for i in range(0, 3):
+            board.apply(0, player1_id, "Player1")
+        board.apply(1, player1_id, "Player1")
+        self.assertFalse(board.is_solved())
+
+    def test_win_with_the_last_stone(self):
+        board = Board(3, 3, 3)
+        player1_id = board.next_unused_stone()
+        player2_id = board.next_unused_stone()
+        for i, column in enumerate([0, 1, 2, 0, 1, 2, 1, 0]):
+            board.apply(column, i % 2, "Player")
+        self.assertFalse(board.is_solved())
+        self.assertTrue(board.apply(2, player1_id, "Player1"))
+        self.assertTrue(board.is_solved())
+        self.assertEqual(board.winner, player1_id)
+        self.assertNotEqual(board.winner, player2_id)
+
+    def test_draw(self):
+        board = Board(3, 3, 3)
+        board.next_unused_stone()
+        board.next_unused_stone()
+        for i, column in enumerate([0, 1, 2, 1, 0, 2, 1, 0]):
+            self.assertTrue(board.apply(column, i % 2, "Player"))
+        self.assertFalse(board.apply(2, 0, "Player1"))
+        self.assertTrue(board.is_solved())
+        self.assertEqual(board.winner, -1)
+
+    def test_zobrist_key(self):
+        board = Board(7, 6, 4)
+        self.assertEqual(board.get_key(), 0)
+        for column, player_id in [(0, 0), (1, 1), (2, 0), (3, 1)]:
+            board.apply(column, player_id, "Player")
+        other = Board(7, 6, 4)
+        for column, player_id in [(2, 0), (3, 1), (0, 0), (1, 1)]:
+            other.apply(column, player_id, "Player")
+        self.assertNotEqual(board.get_key(), 0)
+        self.assertEqual(board.get_key(), other.get_key())
+
+        other.apply(4, 0, "Player")
+        self.assertNotEqual(board.get_key(), other.get_key())
+
+    def test_undo(self):
+        board = Board(7, 6, 4)
+        with self.assertRaises(ValueError):
+            board.undo()
+
+        for column in [3, 3, 4]:
+            board.apply(column, 0, "Player1")
+        key = board.get_key()
+        board.apply(5, 1, "Player2")
+        with self.assertRaises(ValueError):
+            board.unapply(4)
+        board.unapply(5)
+        self.assertEqual(board.get_key(), key)
+        self.assertEqual(board.columns_height, [0, 0, 0, 2, 1, 0, 0])
+        self.assertEqual(board.empty_cells_left, 7 * 6 - 3)
+        self.assertEqual(board.get_player_moves(), [0, 0, 0])
+
+        for i in range(0, 3):
+            self.assertEqual(board.undo(), [4, 3, 3][i])
+        self.assertEqual(board.get_key(), 0)
+        self.assertEqual(board.mask, 0)
+        self.assertEqual(board.board, Board(7, 6, 4).board)
+
+    def test_undo_the_win(self):
+        board = Board(7, 6, 4)
+        for i in range(0, 4):
+            board.apply(0, 0, "Player1")
+        self.assertTrue(board.is_solved())
+        self.assertEqual(board.undo(), 0)
+        self.assertFalse(board.is_solved())
+        self.assertEqual(board.winner, -1)
+        board.apply(1, 0, "Player1")
+        self.assertFalse(board.is_solved())
+
+    def test_reset(self):
+        board = Board(7, 6, 4, quiet=True)
+        player1_id = board.next_unused_stone()
+        for i in range(0, 4):
+            board.apply(0, player1_id, "Player1")
+        board.reset()
+        self.assertFalse(board.is_solved())
+        self.assertEqual(board.get_player_moves(), [])
+        self.assertEqual(board.get_key(), 0)
+        self.assertEqual(board.empty_cells_left, 7 * 6)
+        self.assertEqual(board.next_unused_stone(), 1)
+
+    def test_cells_and_printout(self):
+        board = Board(3, 2, 2)
+        player1_id = board.next_unused_stone()
+        player2_id = board.next_unused_stone()
+        board.apply(1, player1_id, "Player1")
+        board.apply(1, player2_id, "Player2")
+        self.assertEqual(board.get_cell(1, 1), board.get_symbol(player1_id))
+        self.assertEqual(board.get_cell(0, 1), board.get_symbol(player2_id))
+        self.assertEqual(board.get_cell(1, 0), board.EMPTY_SYMBOL)
+        self.assertEqual(board.board, [[' ', '▱', ' '], [' ', '▰', ' ']])
+        self.assertEqual(str(board), "\n\n 0 1 2 \n\n| |▱| |\n| |▰| |\n\n")
+
+    def test_replay(self):
+        board = Board(7, 6, 4, quiet=True)
+        for column in [3, 4, 3, 4, 3, 4, 3]:
+            board.apply(column, len(board.player_moves) % 2, "Player")
+        self.assertTrue(board.is_solved())
+
+        replayed = Board(7, 6, 4, quiet=True)
+        replayed.replay(board.column_moves)
+        self.assertEqual(replayed.winner, board.winner)
+        self.assertEqual(replayed.solved_at, board.solved_at)
+        self.assertEqual(replayed.get_key(), board.get_key())
+        self.assertEqual(replayed.columns_height, board.columns_height)
+        self.assertEqual(replayed.get_player_moves(), board.player_moves)
+        replayed.undo()
+        self.assertFalse(replayed.is_solved())
+
+        # the outcome is found on request only
+        replayed.replay(board.column_moves, verify=False)
+        self.assertFalse(replayed.is_solved())
+        replayed.verify()
+        self.assertEqual(replayed.winner, board.winner)
+
+        # seats of any order
+        replayed.replay([0, 0, 0, 1, 0], seats=[1, 1, 1, 0, 1])
+        self.assertEqual(replayed.winner, 1)
+
+        with self.assertRaises(ValueError):
+            replayed.replay([1, 2] + [0] * 7)
+        # nothing is left of the game that did not fit
+        self.assertEqual((replayed.mask, replayed.key), (0, 0))
+        self.assertEqual(replayed.masks[0] | replayed.masks[1], 0)
+        self.assertEqual(replayed.column_moves, [])
+        self.assertEqual(replayed.empty_cells_left, 7 * 6)
+        with self.assertRaises(ValueError):
+            replayed.replay([7])
+        with self.assertRaises(ValueError):
+            replayed.replay([0, 1], seats=[0])
+        # the game went on after the win
+        with self.assertRaises(ValueError):
+            replayed.replay(board.column_moves + [0])
+
+    def test_open_columns(self):
+        board = Board(3, 2, 2, quiet=True)
+        generator = Random(1)
+        for column in [1, 1, 0, 2, 0]:
+            board._put(column, 0)
+        self.assertEqual(board.open_columns, [2])
+        self.assertTrue(board.is_open(2))
+        self.assertFalse(board.is_open(1))
+        self.assertFalse(board.is_open(3))
+        self.assertEqual(board.random_open_column(generator), 2)
+
+        board._put(2, 0)
+        self.assertEqual(board.open_columns, [])
+        with self.assertRaises(ValueError):
+            board.random_open_column(generator)
+
+        board._unput(0, 0)
+        board._unput(2, 0)
+        self.assertEqual(sorted(board.open_columns), [0, 2])
+        self.assertEqual(
+            [board.open_columns[board.open_index[j]] for j in [0, 2]], [0, 2])
+
+        board.replay([0, 0, 1])
+        self.assertEqual(sorted(board.open_columns), [1, 2])
+        board.reset()
+        self.assertEqual(board.open_columns, [0, 1, 2])
+
+    def test_mirror_key(self):
+        board = Board(7, 6, 4, quiet=True)
+        mirror = Board(7, 6, 4, quiet=True)
+        for i, column in enumerate([0, 1, 1, 5, 2]):
+            board.apply(column, i % 2, "Player")
+            mirror.apply(6 - column, i % 2, "Player")
+        self.assertEqual(board.get_mirror_key(), mirror.get_key())
+        self.assertEqual(mirror.get_mirror_key(), board.get_key())
+        key, mirrored = board.get_canonical_key()
+        self.assertEqual((key, not mirrored), mirror.get_canonical_key())
+        self.assertEqual(board.mirror_column(0), 6)
+
+        replayed = Board(7, 6, 4, quiet=True)
+        replayed.replay(board.column_moves)
+        self.assertEqual(replayed.get_mirror_key(), board.get_mirror_key())
+        while board.column_moves:
+            board.undo()
+        self.assertEqual((board.get_key(), board.get_mirror_key()), (0, 0))
+
+        # a symmetric position is its own mirror image
+        board.apply(3, 0, "Player")
+        self.assertEqual(board.get_canonical_key(), (board.get_key(), False))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from random import Random
+
+from ...Board.Board import Board
+from ...Board.LineBoard import LineBoard
+
+
+class TestLineBoard(unittest.TestCase):
+
+    def test_line_index(self):
+        board = LineBoard(7, 6, 4)
+        # 24 horizontal, 21 vertical and 12 + 12 diagonal lines
+        self.assertEqual(len(board.lines), 69)
+        self.assertEqual(len(board.lines_through[0]), 3)
+        # the cell in the middle of the bottom row
+        self.assertEqual(len(board.lines_through[3 * board.stride]), 7)
+        self.assertIs(LineBoard(7, 6, 4).lines, board.lines)
+
+    def test_same_games_as_board(self):
+        generator = Random(3)
+        for i_game in range(0, 200):
+            width = generator.randint(1, 12)
+            height = generator.randint(1, 9)
+            line_length = generator.randint(1, min(width, height))
+            board = Board(width, height, line_length, quiet=True)
+            line_board = LineBoard(width, height, line_length, quiet=True)
+            while not board.is_solved():
+                column = generator.randrange(width)
+                player_id = len(board.player_moves) % 3
+                if line_board.is_solved():
+                    # a blocked draw, nobody wins the rest of the game
+                    self.assertEqual(line_board.get_outcome(),
+                                     Board.OUTCOME_BLOCKED)
+                    board.apply(column, player_id, "Player")
+                    continue
+                applied = board.apply(column, player_id, "Player")
+                line_applied = line_board.apply(column, player_id, "Player")
+                if line_board.get_outcome() != Board.OUTCOME_BLOCKED:
+                    self.assertEqual(applied, line_applied)
+                    self.assertEqual(board.is_solved(),
+                                     line_board.is_solved())
+            self.assertEqual(board.winner, line_board.winner)
+
+    def test_undo(self):
+        board = LineBoard(7, 6, 4, quiet=True)
+        for i in range(0, 3):
+            board.apply(i, 0, "Player1")
+        board.apply(3, 0, "Player1")
+        self.assertTrue(board.is_solved())
+        board.undo()
+        self.assertFalse(board.is_solved())
+        board.apply(3, 1, "Player2")
+        self.assertFalse(board.is_solved())
+        self.assertEqual(max(board.get_counts(0)), 3)
+        self.assertEqual(max(board.get_counts(1)), 1)
+
+        for i in range(0, 4):
+            board.undo()
+        self.assertEqual(max(board.get_counts(0)), 0)
+        self.assertEqual(max(board.get_counts(1)), 0)
+
+    def test_blocked_draw(self):
+        board = LineBoard(3, 3, 3, quiet=True)
+        self.assertEqual(board.get_outcome(), Board.OUTCOME_PLAYING)
+        for i, column in enumerate([2, 2, 2, 1, 1, 0, 0]):
+            board.apply(column, i % 2, "Player")
+        self.assertFalse(board.is_solved())
+        self.assertLess(0, board.open_lines)
+
+        board.apply(0, 1, "Player2")
+        self.assertEqual(board.open_lines, 0)
+        self.assertTrue(board.is_solved())
+        self.assertEqual(board.winner, -1)
+        self.assertEqual(board.empty_cells_left, 1)
+        self.assertEqual(board.get_outcome(), Board.OUTCOME_BLOCKED)
+
+        board.undo()
+        self.assertLess(0, board.open_lines)
+        self.assertEqual(board.get_outcome(), Board.OUTCOME_PLAYING)
+
+        board.reset()
+        self.assertEqual(board.open_lines, len(board.lines))
+
+    def test_no_early_draw(self):
+        board = LineBoard(3, 3, 3, quiet=True, early_draw=False)
+        for i, column in enumerate([2, 2, 2, 1, 1, 0, 0, 0]):
+            board.apply(column, i % 2, "Player")
+        self.assertEqual(board.open_lines, 0)
+        self.assertFalse(board.is_solved())
+        board.apply(1, 0, "Player1")
+        self.assertEqual(board.get_outcome(), Board.OUTCOME_DRAW)
+    def test_replay(self):
+        generator = Random(4)
+        for i_game in range(0, 50):
+            board = LineBoard(5, 4, 3, quiet=True)
+            while not board.is_solved():
+                column = generator.randrange(5)
+                if board.columns_height[column] < board.height:
+                    board.apply(column, len(board.player_moves) % 3, "P")
+            replayed = LineBoard(5, 4, 3, quiet=True)
+            replayed.replay(board.column_moves,
+                            [i % 3 for i in range(0, len(board.column_moves))])
+            self.assertEqual(replayed.get_outcome(), board.get_outcome())
+            self.assertEqual(replayed.winner, board.winner)
+            self.assertEqual(replayed.counts, board.counts)
+            self.assertEqual(replayed.open_lines, board.open_lines)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
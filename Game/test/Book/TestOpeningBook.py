@@ -0,0 +1,78 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from ...Board.Board import Board
+from ...Book.OpeningBook import OpeningBook
+from ...Book.OpeningBookBuilder import OpeningBookBuilder
+from ...Player.PlayerAlgoSolver import PlayerAlgoSolver
+from ...Search.Negamax import Negamax
+
+
+class TestOpeningBook(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "book.c4b")
+        self.builder = OpeningBookBuilder(5, 4, 3, plies=2, max_depth=4)
+        self.n_positions = self.builder.build(self.path)
+        self.book = OpeningBook(self.path)
+
+    def tearDown(self):
+        self.book.close()
+        self.directory.cleanup()
+
+    def test_build(self):
+        self.assertEqual(len(self.builder.positions()), self.n_positions)
+        self.assertEqual(len(self.book), self.n_positions)
+        self.assertEqual((self.book.width, self.book.height,
+                          self.book.line_length, self.book.plies),
+                         (5, 4, 3, 2))
+        keys = [
+            OpeningBook.RECORD.unpack_from(
+                self.book.memory,
+                OpeningBook.HEADER.size + i * OpeningBook.RECORD.size)[0]
+            for i in range(0, len(self.book))
+        ]
+        self.assertEqual(keys, sorted(set(keys)))
+
+        with self.assertRaises(ValueError):
+            OpeningBookBuilder(5, 4, 3, plies=-1)
+
+    def test_lookup(self):
+        board = Board(5, 4, 3, quiet=True)
+        board.replay([0, 1])
+        column, score, depth = self.book.lookup(board, 0)
+        search = Negamax(board, 0, 1)
+        self.assertEqual(search.search(board.masks[0], board.mask, 10000, 4)
+                         [1:], (score, depth))
+
+        mirror = Board(5, 4, 3, quiet=True)
+        mirror.replay([4, 3])
+        self.assertEqual(self.book.lookup(mirror, 0),
+                         (4 - column, score, depth))
+
+        # too many stones, another board
+        board.replay([0, 1, 2])
+        self.assertIsNone(self.book.lookup(board, 1))
+        self.assertIsNone(self.book.lookup(Board(7, 6, 4, quiet=True), 0))
+        self.assertIsNone(self.book.find(1))
+
+    def test_solver(self):
+        solver = PlayerAlgoSolver(time_budget=1)
+        solver.set_book(self.book)
+        solver.set_ID(0)
+        board = Board(5, 4, 3, quiet=True)
+        self.assertEqual(solver.choose(board), self.book.lookup(board, 0)[0])
+        self.assertEqual(solver.last_depth, self.book.lookup(board, 0)[2])
+
+    def test_not_a_book(self):
+        path = os.path.join(self.directory.name, "empty.c4b")
+        with open(path, "wb") as file:
+            file.write(b"C4GR" + bytes(20))
+        with self.assertRaises(ValueError):
+            OpeningBook(path)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from asyncio import run, wait_for
+from threading import active_count
+from time import perf_counter
+
+from ...Game import Game
+from ...Host.AsyncHost import AsyncHost
+from ...Player.PlayerAlgoRandom import PlayerAlgoRandom
+
+
+class PlayerBroken(PlayerAlgoRandom):
+
+    async def amove(self, board):
+        raise RuntimeError("Broken player")
+
+
+class TestAsyncHost(unittest.TestCase):
+
+    def make_game(self, boring: bool, n_players: int = 2) -> Game:
+        return Game({
+            "players": [
+                PlayerAlgoRandom(n_moves=7, max_sleep=0)
+                for i in range(0, n_players)
+            ],
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "boring": boring,
+            "quiet": True
+        })
+
+    def test_invalid_max_games(self):
+        with self.assertRaises(ValueError):
+            AsyncHost(max_games=0)
+
+    def test_many_games(self):
+        games = [self.make_game(i % 2 == 0, 2 + i % 3)
+                 for i in range(0, 1000)]
+        threads = active_count()
+        host = AsyncHost(max_games=300)
+        results = host.serve(games)
+
+        self.assertEqual(active_count(), threads)
+        self.assertEqual(host.finished, 1000)
+        self.assertEqual(host.active, 0)
+        for game, result in zip(games, results):
+            self.assertTrue(game.board.is_solved())
+            self.assertEqual(result["winner"], game.board.winner)
+            self.assertEqual(result["moves"], len(game.board.player_moves))
+            self.assertIn(result["outcome"], ("win", "draw"))
+
+    def test_delays(self):
+        # not quiet players await their delays, and the loop is not blocked
+        games = [self.make_game(False) for i in range(0, 20)]
+        for game in games:
+            for player in game.players:
+                player.max_sleep = 2
+        start = perf_counter()
+        results = AsyncHost().serve(games)
+        self.assertEqual(len(results), 20)
+        # a game is about 20 delays of 1ms on average, and all at once
+        self.assertLess(perf_counter() - start, 2.0)
+
+    def test_broken_player(self):
+        # every player fails, the game does not wait for them forever
+        game = Game({
+            "players": [
+                PlayerBroken(n_moves=7, max_sleep=0) for i in range(0, 2)
+            ],
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "boring": False,
+            "quiet": True
+        })
+        with self.assertRaises(RuntimeError):
+            run(wait_for(game.aplay(), 5))
+
+        # one player fails, the error is not lost when the other one
+        # could finish the game
+        game = Game({
+            "players": [
+                PlayerBroken(n_moves=7, max_sleep=0),
+                PlayerAlgoRandom(n_moves=7, max_sleep=0)
+            ],
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "boring": False,
+            "quiet": True
+        })
+        with self.assertRaises(RuntimeError):
+            AsyncHost().serve([game])
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
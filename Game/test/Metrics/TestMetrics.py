@@ -0,0 +1,141 @@
+import os
+import json
+import unittest
+from tempfile import TemporaryDirectory
+
+from ...Game import Game
+from ...Input.Input import Input
+from ...Metrics.Histogram import Histogram
+from ...Metrics.MetricsRegistry import MetricsRegistry
+from ...Player.Player import Player
+from ...Player.PlayerAlgoRandom import PlayerAlgoRandom
+from ...Scheduler.SchedulerFair import SchedulerFair
+
+
+class InputList(Input):
+    """Columns from a list, one by one."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+
+    def get_int(self):
+        return self.columns.pop(0)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = Histogram((1.0, 2.0))
+        for value in [0.5, 1.0, 1.5, 3.0]:
+            histogram.observe(value)
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.sum, 6.0)
+        self.assertEqual(histogram.cumulative(),
+                         [(1.0, 2), (2.0, 3), (float("inf"), 4)])
+
+        with self.assertRaises(ValueError):
+            Histogram((2.0, 1.0))
+
+    def test_registry(self):
+        metrics = MetricsRegistry(bounds=(0.1, 1.0))
+        metrics.count("moves_total", player="Ale")
+        metrics.count("moves_total", 2, player="Ale")
+        metrics.observe("wait_seconds", 0.5, player='A"le')
+        with self.assertRaises(KeyError):
+            with metrics.timer("wait_seconds", player="Fede"):
+                raise KeyError
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["moves_total"],
+                         [{"labels": {"player": "Ale"}, "value": 3}])
+        series = snapshot["histograms"]["wait_seconds"]
+        self.assertEqual(sorted(item["count"] for item in series), [1, 1])
+        self.assertEqual(series[0]["buckets"], [[0.1, 0], [1.0, 1], [None, 1]])
+        self.assertLess(0, snapshot["moves_per_second"])
+
+        text = metrics.to_prometheus()
+        self.assertIn('connectfour_moves_total{player="Ale"} 3\n', text)
+        self.assertIn(
+            'connectfour_wait_seconds_bucket{player="A\\"le",le="+Inf"} 1\n',
+            text)
+        self.assertIn("# TYPE connectfour_wait_seconds histogram\n", text)
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            metrics.export_json(path)
+            with open(path) as source:
+                self.assertEqual(json.load(source)["counters"],
+                                 snapshot["counters"])
+            path = os.path.join(directory, "metrics.prom")
+            metrics.export_prometheus(path)
+            with open(path) as source:
+                self.assertIn("connectfour_moves_per_second", source.read())
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["counters"], {})
+
+    def test_game(self):
+        metrics = MetricsRegistry()
+        # the second column is out of the board and asked again
+        players = [
+            Player(name="Fede", _input=InputList([0, 9, 0, 0, 0])),
+            Player(name="Ale", _input=InputList([1, 1, 1]))
+        ]
+        game = Game({
+            "players": players,
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "quiet": True,
+            "metrics": metrics
+        })
+        game.play()
+        snapshot = metrics.snapshot()
+
+        def series(kind, name):
+            return {item["labels"].get("player"): item
+                    for item in snapshot[kind][name]}
+
+        self.assertEqual(series("counters", "player_retries_total")
+                         ["Fede"]["value"], 1)
+        self.assertEqual(series("counters", "moves_total")["Fede"]["value"], 4)
+        self.assertEqual(series("counters", "moves_total")["Ale"]["value"], 3)
+        self.assertEqual(series("histograms", "input_seconds")
+                         ["Fede"]["count"], 5)
+        self.assertEqual(series("histograms", "player_move_seconds")
+                         ["Ale"]["count"], 3)
+        # the column out of the board is not applied at all
+        self.assertEqual(series("histograms", "board_apply_seconds")
+                         [None]["count"], 7)
+
+        with self.assertRaises(TypeError):
+            Game(dict(game_settings(), metrics={}))
+
+    def test_scheduler_waits(self):
+        metrics = MetricsRegistry()
+        game = Game(dict(
+            game_settings(),
+            boring=False,
+            scheduler=SchedulerFair(),
+            metrics=metrics
+        ))
+        game.play()
+        for thread in game.threads:
+            thread.join()
+        waits = metrics.snapshot()["histograms"]["scheduler_wait_seconds"]
+        self.assertEqual(len(waits), 2)
+        self.assertLessEqual(
+            len(game.board.player_moves),
+            sum(item["count"] for item in waits))
+
+
+def game_settings():
+    return {
+        "players": [
+            PlayerAlgoRandom(n_moves=7, max_sleep=0) for i in range(0, 2)
+        ],
+        "board": {"width": 7, "height": 100, "line_length": 4},
+        "quiet": True
+    }
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from io import StringIO
+
+from ...Board.Board import Board
+from ...Game import Game
+from ...Output.OutputANSI import OutputANSI
+from ...Output.OutputBuffered import OutputBuffered
+from ...Output.OutputSilent import OutputSilent
+from ...Player.PlayerAlgoRandom import PlayerAlgoRandom
+
+
+class CountingStream(StringIO):
+
+    def __init__(self):
+        super().__init__()
+        self.n_writes = 0
+
+    def write(self, text: str) -> int:
+        self.n_writes += 1
+        return super().write(text)
+
+
+class TestOutput(unittest.TestCase):
+
+    def test_buffered(self):
+        stream = CountingStream()
+        output = OutputBuffered(stream)
+        board = Board(3, 3, 3, output=output)
+        board.apply(0, 0, "Player1")
+        output.render(board)
+        self.assertEqual(stream.getvalue(), "")
+
+        output.flush()
+        self.assertEqual(stream.n_writes, 1)
+        self.assertIn("Board says:", stream.getvalue())
+        self.assertIn(str(board), stream.getvalue())
+
+        output.flush()
+        self.assertEqual(stream.n_writes, 1)
+
+    def test_game_output(self):
+        stream = CountingStream()
+        game = Game({
+            "players": [
+                PlayerAlgoRandom(n_moves=7, max_sleep=0) for i in range(0, 2)
+            ],
+            # a tall board, random players do not lose turns on full columns
+            "board": {"width": 7, "height": 100, "line_length": 4},
+            "output": OutputBuffered(stream)
+        })
+        game.play()
+        n_turns = len(game.board.player_moves)
+        # the empty board and a write per turn, no more
+        self.assertLessEqual(stream.n_writes, n_turns + 2)
+        self.assertIn(str(game.board), stream.getvalue())
+
+        with self.assertRaises(TypeError):
+            Game({
+                "players": [],
+                "board": {"width": 7, "height": 6, "line_length": 4},
+                "output": stream
+            })
+
+        game = Game({
+            "players": [],
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "quiet": True
+        })
+        self.assertIsInstance(game.output, OutputSilent)
+
+    def test_ansi(self):
+        stream = StringIO()
+        output = OutputANSI(stream)
+        board = Board(3, 3, 3, output=output)
+        output.render(board)
+        output.flush()
+        self.assertTrue(stream.getvalue().startswith(OutputANSI.CLEAR))
+        self.assertIn("Board says:", stream.getvalue())
+
+        # only the new stone is written, at the bottom of the second column
+        stream.truncate(0)
+        stream.seek(0)
+        board.apply(1, 0, "Player1")
+        output.render(board)
+        output.flush()
+        text = stream.getvalue()
+        self.assertNotIn(OutputANSI.CLEAR, text)
+        self.assertIn(OutputANSI.MOVE.format(7, 4) + board.get_symbol(0),
+                      text)
+
+        # a stone taken back draws the board again
+        stream.truncate(0)
+        stream.seek(0)
+        board.undo()
+        output.render(board)
+        output.flush()
+        self.assertIn(OutputANSI.CLEAR + str(board), stream.getvalue())
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -1,7 +1,10 @@
 import unittest
+from random import Random
 from unittest.mock import Mock
 
+from ...Game import Game
 from ...Player.Player import Player
+from ...Player.PlayerAlgoRandomLegal import PlayerAlgoRandomLegal
 from ...Board.Board import Board
 
 
@@ -17,6 +20,24 @@ class TestPlayer(unittest.TestCase):
         player = Player(name=name)
         self.assertEqual(player.get_name(), name)
 
+    def test_seeded_name(self):
+        self.assertEqual(Player(generator=Random(1)).get_name(),
+                         Player(generator=Random(1)).get_name())
+        player = Player(name="TestName")
+        player.set_generator(Random(1))
+        self.assertEqual(player.get_name(), "TestName")
+
+        names = []
+        for i in range(0, 2):
+            game = Game({
+                "players": [Player(), Player()],
+                "board": {"width": 7, "height": 6, "line_length": 4},
+                "quiet": True,
+                "seed": 7
+            })
+            names.append([player.get_name() for player in game.players])
+        self.assertEqual(names[0], names[1])
+
     def test_set_get_ID(self):
         player = Player()
         test_id = 5
@@ -43,6 +64,46 @@ class TestPlayer(unittest.TestCase):
             player.get_name()
         )
 
+    def test_move_full_column(self):
+        board = Board(2, 2, 2, quiet=True)
+        board.apply(0, 1, "Other")
+        board.apply(0, 1, "Other")
+        input_mock = Mock()
+        # a full column and a column off the board are asked again
+        input_mock.get_int.side_effect = [0, 2] * 2000 + [1, 0]
+
+        player = Player(_input=input_mock)
+        player.set_ID(0)
+        player.set_quiet(True)
+        player.move(board)
+        self.assertEqual(board.column_moves, [0, 0, 1])
+
+        board.apply(1, 1, "Other")
+        with self.assertRaises(ValueError):
+            player.move(board)
+
+    def test_move_without_ID(self):
+        # an open column is not asked again, the error goes up
+        input_mock = Mock()
+        input_mock.get_int.return_value = 0
+        player = Player(_input=input_mock)
+        player.set_quiet(True)
+        with self.assertRaises(ValueError):
+            player.move(Board(2, 2, 2, quiet=True))
+        self.assertEqual(input_mock.get_int.call_count, 1)
+
+    def test_random_legal(self):
+        board = Board(5, 40, 4, quiet=True)
+        players = [PlayerAlgoRandomLegal(max_sleep=0, generator=Random(i))
+                   for i in range(0, 2)]
+        for i, player in enumerate(players):
+            player.set_ID(i)
+        while not board.is_solved():
+            players[len(board.column_moves) % 2].move(board)
+        # no turn is lost, the players move in turns
+        self.assertEqual(board.player_moves,
+                         [i % 2 for i in range(0, len(board.player_moves))])
+
 
 if __name__ == '__main__':
     runner = unittest.main()
\ No newline at end of file
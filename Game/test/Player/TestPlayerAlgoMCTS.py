@@ -0,0 +1,91 @@
+import unittest
+
+from ...Game import Game
+from ...Player.PlayerAlgoMCTS import PlayerAlgoMCTS
+from ...Board.Board import Board
+
+
+class TestPlayerAlgoMCTS(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board(7, 6, 4, quiet=True)
+        self.player = PlayerAlgoMCTS(
+            name="MCTS", time_budget=5000, max_iterations=2000,
+            workers=0, seed=1)
+        self.player.set_ID(self.board.next_unused_stone())
+        self.opponent_id = self.board.next_unused_stone()
+
+    def test_invalid_budgets(self):
+        with self.assertRaises(ValueError):
+            PlayerAlgoMCTS(time_budget=0)
+        with self.assertRaises(ValueError):
+            PlayerAlgoMCTS(max_iterations=0)
+        with self.assertRaises(ValueError):
+            PlayerAlgoMCTS(workers=-1)
+
+    def test_takes_the_win(self):
+        for column in [0, 1, 2]:
+            self.board.apply(column, self.player.get_ID(), "MCTS")
+            self.board.apply(column, self.opponent_id, "Opponent")
+        self.player.move(self.board)
+        self.assertTrue(self.board.is_solved())
+        self.assertEqual(self.board.winner, self.player.get_ID())
+
+    def test_reuses_the_tree(self):
+        self.board.apply(self.player.choose(self.board),
+                         self.player.get_ID(), "MCTS")
+        self.board.apply(3, self.opponent_id, "Opponent")
+        node = self.player.search.root.children[
+            self.board.column_moves[0]].children[3]
+        self.player.choose(self.board)
+        self.assertIs(self.player.search.root, node)
+
+        # another game on the same board starts a new tree
+        self.board.reset()
+        self.player.choose(self.board)
+        self.assertEqual(self.player.search.root.column, -1)
+
+    def test_three_players(self):
+        board = Board(5, 4, 3, quiet=True)
+        ids = [board.next_unused_stone() for i in range(0, 3)]
+        # the next player completes a line in column 0 unless blocked
+        for column, player_id in [(0, 0), (1, 1), (2, 2), (0, 0)]:
+            board.apply(column, player_id, "Player")
+        board.apply(4, 1, "Player")
+        self.player.set_ID(ids[2])
+        self.assertEqual(self.player.choose(board), 0)
+
+    def test_game_seed(self):
+        def play(seed):
+            game = Game({
+                "players": [
+                    PlayerAlgoMCTS(time_budget=5000, max_iterations=100,
+                                   workers=0)
+                    for i in range(0, 2)
+                ],
+                "board": {"width": 5, "height": 4, "line_length": 3},
+                "quiet": True,
+                "seed": seed
+            })
+            game.simulate(2)
+            return game.board.column_moves
+
+        # the seed of the game reaches the random games of the search
+        self.assertEqual(play(3), play(3))
+        self.assertNotEqual(play(3), play(4))
+
+    def test_worker_processes(self):
+        player = PlayerAlgoMCTS(
+            time_budget=5000, max_iterations=50, workers=2, batch=4, seed=1)
+        player.set_ID(self.player.get_ID())
+        try:
+            player.move(self.board)
+        finally:
+            player.close()
+        self.assertEqual(sum(self.board.columns_height), 1)
+        self.assertLessEqual(player.search.playouts, 50 * 4)
+        self.assertEqual(player.search.iterations, 50)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from time import perf_counter
+
+from ...Game import Game
+from ...Board.Board import Board
+from ...Player.PlayerAlgoMaxN import PlayerAlgoMaxN
+from ...Search.MaxN import MaxN
+
+
+class TestPlayerAlgoMaxN(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board(7, 6, 4, quiet=True)
+        self.ids = [self.board.next_unused_stone() for i in range(0, 3)]
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            PlayerAlgoMaxN(algorithm="minimax")
+        with self.assertRaises(ValueError):
+            PlayerAlgoMaxN(time_budget=0)
+
+    def test_takes_the_win(self):
+        self.board.replay([0, 0, 6, 1, 1, 6, 2, 2, 6], [0, 1, 2] * 3)
+        for algorithm in MaxN.ALGORITHMS:
+            player = PlayerAlgoMaxN(algorithm=algorithm, time_budget=200)
+            player.set_ID(self.ids[0])
+            self.assertEqual(player.choose(self.board), 3)
+            self.assertEqual(player.last_score, MaxN.MAX_SUM - 1)
+
+    def test_blocks_the_next_player(self):
+        # the second player wins in column 3 unless blocked
+        self.board.replay([6, 0, 5, 6, 1, 5, 5, 2, 4], [0, 1, 2] * 3)
+        player = PlayerAlgoMaxN(time_budget=200)
+        player.set_ID(self.ids[0])
+        self.assertEqual(player.choose(self.board), 3)
+
+    def test_algorithms(self):
+        # the first player threatens columns 0 and 4, blocking one of
+        # them is enough for max^n, where the third player blocks the
+        # other, and lost for paranoid, where the third player does not
+        self.board.replay([1, 1, 5, 2, 2, 6, 3], [0, 1, 2, 0, 1, 2, 0])
+        maxn = PlayerAlgoMaxN(algorithm=MaxN.MAXN, time_budget=200)
+        maxn.set_ID(self.ids[1])
+        self.assertIn(maxn.choose(self.board), (0, 4))
+        self.assertLess(0, maxn.last_score)
+
+        paranoid = PlayerAlgoMaxN(algorithm=MaxN.PARANOID, time_budget=200)
+        paranoid.set_ID(self.ids[1])
+        paranoid.choose(self.board)
+        self.assertEqual(paranoid.last_score, 0)
+
+    def test_search_takes_moves_back(self):
+        self.board.replay([3, 3, 2, 4, 4])
+        search = MaxN(self.board, self.ids[2])
+        scores = search.evaluate()
+        owners = list(search.owners)
+        search.search(100, 4)
+        self.assertEqual(search.evaluate(), scores)
+        self.assertEqual(search.owners, owners)
+        self.assertEqual(search.heights, self.board.columns_height)
+        self.assertEqual(len(scores), 3)
+        self.assertLessEqual(sum(scores), MaxN.HEURISTIC_SUM)
+
+    def test_many_players(self):
+        players = [
+            PlayerAlgoMaxN(algorithm=MaxN.ALGORITHMS[i % 2], time_budget=50)
+            for i in range(0, 8)
+        ]
+        game = Game({
+            "players": players,
+            "board": {"width": 12, "height": 8, "line_length": 4},
+            "boring": True,
+            "quiet": True
+        })
+        start = perf_counter()
+        moves = 0
+        for state in game.iter_play():
+            moves += 1
+            if 24 <= moves:
+                break
+        self.assertLess(perf_counter() - start, 24 * 0.2)
+        self.assertTrue(all(0 < player.last_depth for player in players))
+
+    def test_latency(self):
+        # Nodes of a large board with all the seats taken are slow,
+        # every move still ends close to its budget
+        board = Board(50, 50, 10, quiet=True)
+        players = [
+            PlayerAlgoMaxN(algorithm=MaxN.ALGORITHMS[i % 2], time_budget=50)
+            for i in range(0, 42)
+        ]
+        for player in players:
+            player.set_ID(board.next_unused_stone())
+        for player in players[:6]:
+            start = perf_counter()
+            player.move(board)
+            self.assertLess(perf_counter() - start, 0.05 * 1.5)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
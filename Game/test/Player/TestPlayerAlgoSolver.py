@@ -0,0 +1,60 @@
+import unittest
+from time import perf_counter
+
+from ...Player.PlayerAlgoSolver import PlayerAlgoSolver
+from ...Board.Board import Board
+
+
+class TestPlayerAlgoSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board(7, 6, 4)
+        self.solver = PlayerAlgoSolver(name="Solver", time_budget=200)
+        self.solver.set_ID(self.board.next_unused_stone())
+        self.opponent_id = self.board.next_unused_stone()
+
+    def test_invalid_time_budget(self):
+        with self.assertRaises(ValueError):
+            PlayerAlgoSolver(time_budget=0)
+
+    def test_takes_the_win(self):
+        for column in [0, 1, 2]:
+            self.board.apply(column, self.solver.get_ID(), "Solver")
+            self.board.apply(column, self.opponent_id, "Opponent")
+        self.solver.move(self.board)
+        self.assertTrue(self.board.is_solved())
+        self.assertEqual(self.board.winner, self.solver.get_ID())
+
+    def test_blocks_the_opponent(self):
+        for column in [6, 6, 0]:
+            self.board.apply(column, self.solver.get_ID(), "Solver")
+        for column in [3, 3, 3]:
+            self.board.apply(column, self.opponent_id, "Opponent")
+        self.assertEqual(self.solver.choose(self.board), 3)
+
+    def test_mirrored_position(self):
+        # the table keeps the positions of both sides of the mirror
+        columns = [(1, 3), (1, 2), (1, 4), (0, 5)]
+        for column, opponent in columns:
+            self.board.apply(column, self.solver.get_ID(), "Solver")
+            self.board.apply(opponent, self.opponent_id, "Opponent")
+        first = self.solver.choose(self.board)
+
+        mirror = Board(7, 6, 4, quiet=True)
+        for column, opponent in columns:
+            mirror.apply(6 - column, self.solver.get_ID(), "Solver")
+            mirror.apply(6 - opponent, self.opponent_id, "Opponent")
+        self.assertEqual(mirror.get_canonical_key()[0],
+                         self.board.get_canonical_key()[0])
+        self.assertEqual(self.solver.choose(mirror), 6 - first)
+
+    def test_time_budget(self):
+        start = perf_counter()
+        self.solver.move(self.board)
+        self.assertLess(perf_counter() - start, 0.4)
+        self.assertLess(0, self.solver.last_depth)
+        self.assertEqual(self.board.columns_height[3], 1)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
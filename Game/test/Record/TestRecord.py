@@ -0,0 +1,123 @@
+import os
+import unittest
+from random import Random
+from tempfile import TemporaryDirectory
+
+from ...Board.Board import Board
+from ...Record.GameRecord import GameRecord
+from ...Record.RecordHeader import RecordHeader
+from ...Record.RecordIndex import RecordIndex
+from ...Record.RecordReader import RecordReader
+from ...Record.RecordWriter import RecordWriter
+
+
+class TestRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.c4r")
+        self.header = RecordHeader(7, 6, 4, ["Fede", "Ale", "Ну"])
+
+        generator = Random(5)
+        self.records = []
+        board = Board(7, 6, 4, quiet=True)
+        for i_game in range(0, 50):
+            board.reset()
+            while not board.is_solved():
+                column = generator.randrange(7)
+                if board.columns_height[column] < board.height:
+                    # every other game the players move in any order
+                    player_id = len(board.player_moves) % 3
+                    if i_game % 2:
+                        player_id = generator.randrange(3)
+                    board.apply(column, player_id, "Player")
+            self.records.append(GameRecord.from_board(board))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pack(self):
+        record = GameRecord([3, 3, 4, 6], [0, 1, 2, 0], winner=2)
+        # players in order: 4 moves of 3 bits in 2 bytes
+        data = record.pack(7, 3)
+        self.assertEqual(len(data), 2 + 2)
+        self.assertEqual(GameRecord.unpack_from(data, 0, 7, 3),
+                         (record, len(data)))
+
+        record.seats = [2, 1, 2, 0]
+        data = record.pack(7, 3)
+        self.assertEqual(len(data), 2 + 3)
+        self.assertEqual(GameRecord.unpack_from(data, 0, 7, 3)[0], record)
+
+        # a single column takes no bits at all
+        record = GameRecord([0] * 200, [i % 2 for i in range(0, 200)])
+        self.assertEqual(len(record.pack(1, 2)), 3)
+
+        with self.assertRaises(ValueError):
+            GameRecord([7], [0]).pack(7, 3)
+        with self.assertRaises(ValueError):
+            GameRecord([0], [0, 1])
+
+    def test_long_name(self):
+        # 128 * "a" and then 2-byte letters, the 255th byte is inside one
+        name = "a" * 128 + "Ж" * 100
+        data = RecordHeader(7, 6, 4, [name]).pack()
+        self.assertEqual(data[RecordHeader.FORMAT.size], 254)
+        with open(self.path, "wb") as file:
+            file.write(data)
+        with open(self.path, "rb") as file:
+            header = RecordHeader.read(file)
+        self.assertEqual(header.names, ["a" * 128 + "Ж" * 63])
+
+    def test_write_and_read(self):
+        with RecordWriter(self.path, self.header) as writer:
+            for record in self.records[:30]:
+                writer.write(record)
+        with RecordWriter(self.path, self.header) as writer:
+            for record in self.records[30:]:
+                writer.write(record)
+
+        with RecordReader(self.path) as reader:
+            self.assertEqual(reader.header, self.header)
+            self.assertEqual(reader.header.names[2], "Ну")
+            self.assertEqual(list(reader), self.records)
+            self.assertEqual(len(reader), 50)
+            for i_game in [49, 0, 31, 30, 7]:
+                self.assertEqual(reader[i_game], self.records[i_game])
+            with self.assertRaises(IndexError):
+                reader.read(50)
+
+        with self.assertRaises(ValueError):
+            RecordWriter(self.path, RecordHeader(7, 6, 4, ["Fede", "Ale"]))
+
+    def test_index(self):
+        with RecordWriter(self.path, self.header) as writer:
+            for record in self.records:
+                writer.write(record)
+        with open(self.path + RecordIndex.SUFFIX, "rb") as index:
+            written = index.read()
+
+        os.remove(self.path + RecordIndex.SUFFIX)
+        with RecordReader(self.path) as reader:
+            self.assertEqual(reader[42], self.records[42])
+        with open(self.path + RecordIndex.SUFFIX, "rb") as index:
+            self.assertEqual(index.read(), written)
+
+    def test_broken_archive(self):
+        with RecordWriter(self.path, self.header) as writer:
+            writer.write(self.records[0])
+        with open(self.path, "ab") as archive:
+            archive.write(b"\x7f")
+
+        with RecordReader(self.path, use_index=False) as reader:
+            with self.assertRaises(ValueError):
+                list(reader)
+
+        with open(self.path, "wb") as archive:
+            archive.write(b"C4GA\x01")
+        with self.assertRaises(ValueError):
+            RecordReader(self.path)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
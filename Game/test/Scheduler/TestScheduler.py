@@ -0,0 +1,117 @@
+import unittest
+from threading import Thread
+from time import perf_counter
+
+from ...Game import Game
+from ...Player.PlayerAlgoRandom import PlayerAlgoRandom
+from ...Player.PlayerHuman import PlayerHuman
+from ...Scheduler.Scheduler import Scheduler
+from ...Scheduler.SchedulerFair import SchedulerFair
+from ...Scheduler.SchedulerLuck import SchedulerLuck
+from ...Scheduler.SchedulerWeighted import SchedulerWeighted
+
+
+class TestScheduler(unittest.TestCase):
+
+    def play(self, scheduler: Scheduler, height: int = 6) -> Game:
+        game = Game({
+            "players": [
+                PlayerAlgoRandom(n_moves=7, max_sleep=0)
+                for i in range(0, 3)
+            ],
+            "board": {"width": 7, "height": height, "line_length": 4},
+            "boring": False,
+            "quiet": True,
+            "scheduler": scheduler
+        })
+        game.play()
+        for thread in game.threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+        self.assertTrue(game.board.is_solved())
+        return game
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            SchedulerFair(max_delay=-1)
+        with self.assertRaises(ValueError):
+            SchedulerWeighted({0: -1})
+        with self.assertRaises(ValueError):
+            SchedulerWeighted({0: 0, 1: 0}).start([0, 1])
+        with self.assertRaises(ValueError):
+            SchedulerFair().start([])
+        with self.assertRaises(NotImplementedError):
+            Scheduler().start([0])
+        with self.assertRaises(ValueError):
+            SchedulerLuck(max_delays={0: -1})
+        with self.assertRaises(ValueError):
+            SchedulerWeighted({0: 1}, max_delays={0: -1})
+
+    def test_max_delays(self):
+        scheduler = SchedulerLuck(max_delay=10, max_delays={1: 0, 2: 50})
+        self.assertEqual(scheduler.get_max_delay(0), 10)
+        self.assertEqual(scheduler.get_max_delay(1), 0)
+        self.assertEqual(scheduler.get_max_delay(2), 50)
+        scheduler.start([0, 2])
+        for i in range(0, 20):
+            self.assertLessEqual(scheduler.delay(2), 0.01)
+        scheduler.start([0, 1, 2])
+        self.assertEqual(scheduler.delay(2), 0.0)
+
+        human = PlayerHuman(name="Human")
+        robot = PlayerAlgoRandom(n_moves=7, name="Robot")
+        game = Game({
+            "players": [human, robot],
+            "board": {"width": 7, "height": 6, "line_length": 4},
+            "quiet": False
+        })
+        self.assertEqual(
+            game.scheduler.get_max_delay(human.get_ID()),
+            Game.MAX_DELAY_HUMAN)
+        self.assertEqual(
+            game.scheduler.get_max_delay(robot.get_ID()), Game.MAX_DELAY)
+
+    def test_fair(self):
+        # random players lose their turn on a full column,
+        # a tall board keeps all the columns open
+        game = self.play(SchedulerFair(), height=100)
+        moves = game.board.get_player_moves()
+        self.assertEqual(moves, [i % 3 for i in range(0, len(moves))])
+
+    def test_luck(self):
+        moves = []
+        for i in range(0, 5):
+            moves += self.play(SchedulerLuck(seed=i)).board.get_player_moves()
+        self.assertTrue(any(a == b for a, b in zip(moves, moves[1:])))
+
+    def test_weighted(self):
+        scheduler = SchedulerWeighted({0: 0, 1: 3}, seed=1)
+        scheduler.start([0, 1, 2])
+        turns = [scheduler.next_player(-1) for i in range(0, 4000)]
+        self.assertEqual(turns.count(0), 0)
+        self.assertAlmostEqual(turns.count(1) / turns.count(2), 3, delta=0.5)
+
+        moves = self.play(SchedulerWeighted({0: 0}, seed=2)).board.player_moves
+        self.assertNotIn(0, moves)
+
+    def test_shutdown_is_immediate(self):
+        scheduler = SchedulerFair(max_delay=60000)
+        scheduler.start([0, 1])
+        results = []
+
+        def wait(player_id: int):
+            results.append(scheduler.acquire(player_id))
+
+        threads = [Thread(target=wait, args=(i,)) for i in range(0, 2)]
+        for thread in threads:
+            thread.start()
+        start = perf_counter()
+        scheduler.shutdown()
+        for thread in threads:
+            thread.join()
+        self.assertLess(perf_counter() - start, 1.0)
+        self.assertEqual(results, [False, False])
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
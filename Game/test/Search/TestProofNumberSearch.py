@@ -0,0 +1,88 @@
+import unittest
+from random import Random
+from time import perf_counter
+
+from ...Board.Board import Board
+from ...Search.Negamax import Negamax
+from ...Search.ProofNumberSearch import ProofNumberSearch
+from ...Search.ProofTable import ProofTable
+
+
+class TestProofNumberSearch(unittest.TestCase):
+
+    def test_table(self):
+        table = ProofTable(memory_limit=2 * 20)
+        self.assertEqual(table.capacity, 2)
+        self.assertIsNone(table.lookup(1))
+        table.store(1, 3, 4, 100)
+        table.store(2, 5, 6, 10)
+        table.store(3, 7, 8, 50)
+        # The entry of more work survives
+        self.assertEqual(table.lookup(1), (3, 4))
+        self.assertIsNone(table.lookup(2))
+        self.assertEqual(table.lookup(3), (7, 8))
+        self.assertEqual(table.replaced, 1)
+
+        table.clear()
+        self.assertIsNone(table.lookup(1))
+        with self.assertRaises(ValueError):
+            ProofTable(memory_limit=1)
+
+    def test_prove(self):
+        board = Board(4, 4, 3, quiet=True)
+        search = ProofNumberSearch(board)
+        result, column = search.prove(0, 0)
+        self.assertEqual(result, ProofNumberSearch.PROVEN)
+
+        # the opponent loses after the winning column
+        board.replay([column])
+        score = Negamax(board, 1, 0).search(
+            board.masks[1], board.mask, 100000, 16)[1]
+        self.assertLess(score, -Negamax.WIN_SCORE // 2)
+
+    def test_negamax(self):
+        generator = Random(7)
+        for i in range(0, 20):
+            board = Board(4, 4, 3, quiet=True)
+            n_stones = generator.randrange(4, 12)
+            for j in range(0, n_stones):
+                board.apply(board.random_open_column(generator), j % 2, "")
+                if board.is_solved():
+                    break
+            else:
+                player = n_stones % 2
+                result = ProofNumberSearch(board, player, 1 - player).prove(
+                    board.masks[player], board.mask)[0]
+                score = Negamax(board, player, 1 - player).search(
+                    board.masks[player], board.mask, 100000, 16)[1]
+                self.assertEqual(result == ProofNumberSearch.PROVEN,
+                                 Negamax.WIN_SCORE // 2 < score)
+
+    def test_budget(self):
+        board = Board(5, 4, 4, quiet=True)
+        board.replay([1, 2, 3])
+        search = ProofNumberSearch(board, 1, 0)
+        self.assertEqual(search.prove(board.masks[1], board.mask, 2000),
+                         (ProofNumberSearch.UNKNOWN, -1))
+        self.assertEqual(search.nodes, 2001)
+
+        # The table keeps the numbers, the proof goes on from there
+        result = search.prove(board.masks[1], board.mask)[0]
+        self.assertEqual(result, ProofNumberSearch.DISPROVEN)
+        again = ProofNumberSearch(board, 1, 0)
+        self.assertEqual(again.prove(board.masks[1], board.mask)[0], result)
+        self.assertLess(search.nodes, again.nodes)
+
+    def test_time_budget(self):
+        # Nodes of a large board are slow, the proof still stops
+        # close to the deadline
+        board = Board(50, 50, 10, quiet=True)
+        search = ProofNumberSearch(board)
+        start = perf_counter()
+        self.assertEqual(search.prove(0, 0, time_budget=50),
+                         (ProofNumberSearch.UNKNOWN, -1))
+        self.assertLess(perf_counter() - start, 0.05 * 1.5)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from time import perf_counter, sleep
+
+from ...Board.Board import Board
+from ...Search.Negamax import Negamax
+from ...Search.SearchClock import SearchClock, SearchTimeout
+
+
+class TestSearchClock(unittest.TestCase):
+
+    def test_deadline(self):
+        clock = SearchClock(10)
+        clock.read(1)
+        clock.check()
+        sleep(0.02)
+        with self.assertRaises(SearchTimeout):
+            clock.read(2)
+        with self.assertRaises(SearchTimeout):
+            clock.check()
+
+    def test_period(self):
+        clock = SearchClock(1000)
+        # fast nodes, the period grows but at most twice every read
+        nodes = 0
+        for i in range(0, 5):
+            nodes = clock.next_read
+            clock.read(nodes)
+        self.assertEqual(clock.period, 32)
+
+        # slow nodes, the clock is read at every node again
+        sleep(0.01)
+        clock.read(nodes + 1)
+        self.assertEqual(clock.period, 1)
+
+    def test_latency(self):
+        # Nodes of a large board are slow, the search still stops
+        # close to the deadline
+        board = Board(50, 50, 10, quiet=True)
+        search = Negamax(board)
+        start = perf_counter()
+        search.search(0, 0, 50)
+        self.assertLess(perf_counter() - start, 0.05 * 1.5)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
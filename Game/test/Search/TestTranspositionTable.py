@@ -0,0 +1,42 @@
+import unittest
+
+from ...Search.TranspositionTable import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def test_memory_limit(self):
+        table = TranspositionTable(memory_limit=1000)
+        self.assertLessEqual(
+            table.capacity * TranspositionTable.ENTRY_BYTES, 1000)
+        with self.assertRaises(ValueError):
+            TranspositionTable(memory_limit=1)
+
+    def test_store_and_lookup(self):
+        table = TranspositionTable(memory_limit=1000)
+        self.assertIsNone(table.lookup(0))
+        table.store(0, 3, -5, TranspositionTable.UPPER, 2)
+        self.assertEqual(table.lookup(0),
+                         (3, -5, TranspositionTable.UPPER, 2))
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 1)
+
+    def test_replacement(self):
+        table = TranspositionTable(memory_limit=2 * 17)
+        self.assertEqual(table.capacity, 2)
+        table.store(1, 5, 10, TranspositionTable.EXACT, 0)
+        table.store(2, 1, 20, TranspositionTable.EXACT, 1)
+        table.store(3, 2, 30, TranspositionTable.EXACT, 2)
+        # The deep entry survives, the newest one replaces the shallow one
+        self.assertEqual(table.lookup(1)[1], 10)
+        self.assertIsNone(table.lookup(2))
+        self.assertEqual(table.lookup(3)[1], 30)
+        self.assertEqual(table.collisions, 1)
+
+        table.clear()
+        self.assertIsNone(table.lookup(1))
+        self.assertEqual(table.get_stats()["stores"], 0)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
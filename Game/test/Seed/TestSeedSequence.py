@@ -0,0 +1,40 @@
+import pickle
+import unittest
+
+from ...Seed.SeedSequence import SeedSequence
+
+
+class TestSeedSequence(unittest.TestCase):
+
+    def test_streams(self):
+        seeds = SeedSequence(2024)
+        # the same in every process, version and machine
+        self.assertEqual(SeedSequence(0).state(), 8493733112532773764)
+        self.assertEqual(seeds.child("player", 0).state(),
+                         SeedSequence(2024, ("player", 0)).state())
+        self.assertEqual(seeds.child("player", 0).generator().random(),
+                         seeds.child("player", 0).generator().random())
+
+        states = {
+            seeds.state(),
+            seeds.child(1).state(),
+            seeds.child("1").state(),
+            seeds.child(1, 2).state(),
+            seeds.child(12).state(),
+            SeedSequence(2025).child(1).state(),
+        }
+        self.assertEqual(len(states), 6)
+        self.assertEqual(seeds.spawn(3)[2], seeds.child(2))
+        self.assertEqual(pickle.loads(pickle.dumps(seeds.child("a"))),
+                         seeds.child("a"))
+
+        with self.assertRaises(ValueError):
+            SeedSequence(-1)
+        with self.assertRaises(TypeError):
+            SeedSequence(1.5)
+        with self.assertRaises(TypeError):
+            seeds.child(None)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,117 @@
+import os
+import unittest
+from random import Random
+from tempfile import TemporaryDirectory
+
+from ...Board.Board import Board
+from ...Player.PlayerAlgoSolver import PlayerAlgoSolver
+from ...Search.Negamax import Negamax
+from ...Tablebase.Tablebase import Tablebase
+from ...Tablebase.TablebaseBuilder import TablebaseBuilder
+
+
+class TestTablebase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "tablebase.c4t")
+        self.n_positions = TablebaseBuilder(4, 4, 3).build(self.path)
+        self.tablebase = Tablebase(self.path)
+
+    def tearDown(self):
+        self.tablebase.close()
+        self.directory.cleanup()
+
+    def random_board(self, generator, n_stones):
+        """Play random moves until nobody has won, None otherwise."""
+        board = Board(4, 4, 3, quiet=True)
+        for i in range(0, n_stones):
+            board.apply(board.random_open_column(generator), i % 2, "")
+            if board.is_solved():
+                return None
+        return board
+
+    def test_build(self):
+        self.assertEqual(len(self.tablebase), self.n_positions)
+        self.assertEqual((self.tablebase.width, self.tablebase.height,
+                          self.tablebase.line_length,
+                          self.tablebase.min_stones), (4, 4, 3, 0))
+        self.assertEqual(self.tablebase.probe(Board(4, 4, 3, quiet=True), 0),
+                         (Tablebase.WIN, 9))
+
+        with self.assertRaises(ValueError):
+            TablebaseBuilder(4, 4, 3, min_stones=17)
+
+    def test_probe(self):
+        generator = Random(5)
+        for i in range(0, 40):
+            n_stones = generator.randrange(4, 14)
+            board = self.random_board(generator, n_stones)
+            if board is None:
+                continue
+            player = n_stones % 2
+            result, distance = self.tablebase.probe(board, player)
+            score = Negamax(board, player, 1 - player).search(
+                board.masks[player], board.mask, 100000, 16)[1]
+            self.assertEqual(result, (0 < score) - (score < 0))
+            if result != Tablebase.DRAW:
+                self.assertEqual(Negamax.WIN_SCORE - abs(score), distance)
+
+            column, after, length = self.tablebase.best_move(board, player)
+            self.assertEqual((after, length), (result, distance))
+            self.assertTrue(board.is_open(column))
+
+    def test_mirror(self):
+        board = Board(4, 4, 3, quiet=True)
+        board.replay([0, 0, 1])
+        mirror = Board(4, 4, 3, quiet=True)
+        mirror.replay([3, 3, 2])
+        self.assertEqual(self.tablebase.probe(board, 1),
+                         self.tablebase.probe(mirror, 1))
+        column, result, distance = self.tablebase.best_move(board, 1)
+        self.assertEqual(self.tablebase.best_move(mirror, 1)[1:],
+                         (result, distance))
+
+    def test_min_stones(self):
+        path = os.path.join(self.directory.name, "late.c4t")
+        n_positions = TablebaseBuilder(4, 4, 3, min_stones=10).build(path)
+        self.assertLess(n_positions, self.n_positions)
+        with Tablebase(path) as late:
+            board = Board(4, 4, 3, quiet=True)
+            self.assertIsNone(late.probe(board, 0))
+            generator = Random(3)
+            board = None
+            while board is None:
+                board = self.random_board(generator, 10)
+            self.assertEqual(late.probe(board, 0),
+                             self.tablebase.probe(board, 0))
+
+        # another board, more players
+        self.assertIsNone(self.tablebase.probe(Board(5, 4, 3), 0))
+        board = Board(4, 4, 3, quiet=True)
+        board.replay([0, 1, 2], [0, 1, 2])
+        self.assertIsNone(self.tablebase.best_move(board, 0))
+
+    def test_solver(self):
+        solver = PlayerAlgoSolver(time_budget=1)
+        solver.set_tablebase(self.tablebase)
+        solver.set_ID(0)
+        board = Board(4, 4, 3, quiet=True)
+        board.replay([1, 2, 1, 2])
+        column, result, distance = self.tablebase.best_move(board, 0)
+        self.assertEqual(solver.choose(board), column)
+        self.assertEqual(solver.last_depth, distance)
+        self.assertEqual(solver.last_score, Negamax.WIN_SCORE - 1)
+
+    def test_not_a_tablebase(self):
+        path = os.path.join(self.directory.name, "short.c4t")
+        with open(self.path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-1])
+        with self.assertRaises(ValueError):
+            Tablebase(path)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
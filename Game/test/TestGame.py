@@ -2,6 +2,7 @@ import unittest
 from time import sleep
 
 from ..Game import Game
+from ..Board.LineBoard import LineBoard
 from ..Player.PlayerHuman import PlayerHuman
 from ..Player.PlayerAlgoRandom import PlayerAlgoRandom
 
@@ -121,6 +122,91 @@ class TestGame(unittest.TestCase):
         print("ASYNC player_moves", player_moves)
         self.assertTrue(two_consecutive_moves)
 
+    def test_board_engine(self):
+        settings = self.settings.copy()
+        settings["board"] = dict(self.settings["board"], engine=LineBoard)
+        game = Game(settings)
+        self.assertIsInstance(game.board, LineBoard)
+
+        settings["board"] = dict(self.settings["board"], engine=dict)
+        with self.assertRaises(TypeError):
+            Game(settings)
+
+    def test_simulate(self):
+        settings = self.settings.copy()
+        settings["players"] = [
+            PlayerAlgoRandom(n_moves=self.board_width, max_sleep=1000)
+            for i in range(0, 2)
+        ]
+        settings["quiet"] = True
+        game = Game(settings)
+        board = game.board
+
+        stats = game.simulate(200)
+        self.assertIs(game.board, board)
+        self.assertEqual(stats["games"], 200)
+        self.assertEqual(sum(stats["wins"]) + stats["draws"], 200)
+        self.assertEqual(stats["blocked"], 0)
+        self.assertEqual(sum(stats["lengths"].values()), 200)
+        self.assertLessEqual(4 * 2 - 1, stats["min_length"])
+        self.assertLessEqual(stats["max_length"], 7 * 6)
+        self.assertAlmostEqual(stats["moves"], 200 * stats["mean_length"])
+        self.assertFalse(any(player.quiet for player in game.players))
+
+    def test_step(self):
+        game = Game(self.settings.copy())
+        ids = [player.get_ID() for player in game.players]
+        state = game.step(3)
+        self.assertEqual(state["player"], ids[0])
+        self.assertEqual((state["column"], state["row"]), (3, 0))
+        self.assertEqual(state["next_player"], ids[1])
+        self.assertEqual(state["outcome"], "playing")
+
+        # the turn stays with the second player after a wrong column
+        with self.assertRaises(ValueError):
+            game.step(game.board.width)
+        state = game.step(3)
+        self.assertEqual((state["player"], state["row"]), (ids[1], 1))
+
+        game = Game(self.settings.copy())
+        for column in [0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3, 0]:
+            state = game.step(column)
+        self.assertEqual(state["winner"], ids[0])
+        self.assertFalse(state["draw"])
+        self.assertEqual(state["next_player"], -1)
+        with self.assertRaises(ValueError):
+            game.step(4)
+
+    def test_iter_play(self):
+        settings = self.settings.copy()
+        settings["players"] = self.board_players_algo
+        settings["quiet"] = True
+        game = Game(settings)
+        states = list(game.iter_play())
+        self.assertTrue(game.board.is_solved())
+        self.assertEqual(len(states), len(game.board.column_moves))
+        self.assertEqual(states[-1]["outcome"], game.board.get_outcome())
+        self.assertTrue(all(state["next_player"] != -1
+                            for state in states[:-1]))
+
+    def test_seed(self):
+        def play(seed):
+            settings = self.settings.copy()
+            settings["players"] = [
+                PlayerAlgoRandom(n_moves=self.board_width, max_sleep=0)
+                for i in range(0, 3)
+            ]
+            settings["quiet"] = True
+            settings["seed"] = seed
+            game = Game(settings)
+            game.simulate(5)
+            return game.board.column_moves
+
+        self.assertEqual(play(11), play(11))
+        self.assertNotEqual(play(11), play(12))
+        with self.assertRaises(TypeError):
+            play("11")
+
     def test_large_board_initialization(self):
         large_board_settings = {
             "players": self.board_players_human,
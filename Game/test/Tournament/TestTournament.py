@@ -0,0 +1,116 @@
+import unittest
+from functools import partial
+from time import sleep
+
+from ...Tournament.Tournament import Tournament
+from ...Tournament.Elo import Elo
+from ...Player.PlayerAlgoRandom import PlayerAlgoRandom
+
+
+def slow_player() -> PlayerAlgoRandom:
+    sleep(1)
+    return PlayerAlgoRandom(n_moves=7, max_sleep=0)
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.board = {"width": 7, "height": 6, "line_length": 4}
+        self.roster = {
+            name: partial(PlayerAlgoRandom, n_moves=7, max_sleep=0)
+            for name in ["A", "B", "C"]
+        }
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            Tournament({"A": self.roster["A"]}, self.board)
+        with self.assertRaises(ValueError):
+            Tournament(self.roster, self.board, pairing="knockout")
+        with self.assertRaises(ValueError):
+            Tournament(self.roster, self.board, rounds=0)
+
+    def test_round_robin(self):
+        tournament = Tournament(self.roster, self.board, rounds=2, workers=0)
+        results = list(tournament.run())
+        self.assertEqual(len(results), 3 * 2 * 2)
+        self.assertEqual(
+            sum(row["games"] for row in tournament.elo.get_table()), 24)
+        self.assertAlmostEqual(sum(tournament.elo.ratings.values()), 4500)
+        pairs = [(result["first"], result["second"]) for result in results]
+        self.assertEqual(pairs.count(("A", "B")), 2)
+        self.assertEqual(pairs.count(("B", "A")), 2)
+
+    def test_swiss(self):
+        tournament = Tournament(self.roster, self.board, pairing="swiss",
+                                rounds=3, workers=0)
+        results = list(tournament.run())
+        # one game and one bye every round
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(tournament.scores.values()), 3 + 3)
+        # every player had one bye
+        self.assertEqual(tournament.byes, {"A", "B", "C"})
+
+    def test_process_pool(self):
+        tournament = Tournament(self.roster, self.board, workers=2)
+        results = list(tournament.run())
+        self.assertEqual(len(results), 6)
+        for result in results:
+            self.assertIn(result["winner"], [None, "A", "B", "C"])
+            self.assertLessEqual(result["moves"], 7 * 6)
+
+    def test_streaming(self):
+        # the games of the slow player are first in the pairings,
+        # the others finish and are yielded before them
+        roster = dict(self.roster, A=slow_player)
+        tournament = Tournament(roster, self.board, workers=4)
+        results = list(tournament.run())
+        self.assertEqual((results[0]["first"], results[0]["second"]),
+                         ("B", "C"))
+        # and are recorded in the order of the pairings
+        self.assertEqual(
+            [(result["first"], result["second"])
+             for result in tournament.results],
+            [("A", "B"), ("A", "C"), ("B", "A"),
+             ("B", "C"), ("C", "A"), ("C", "B")])
+
+    def test_seed(self):
+        def play(workers):
+            tournament = Tournament(self.roster, self.board, rounds=2,
+                                    workers=workers, seed=7)
+            for result in tournament.run():
+                pass
+            results = [
+                (result["round"], result["first"], result["second"],
+                 str(result["winner"]), result["moves"])
+                for result in tournament.results]
+            return results, tournament.elo.ratings
+
+        # the same games and ratings whatever process plays them
+        self.assertEqual(play(0), play(2))
+
+
+class TestElo(unittest.TestCase):
+
+    def test_update(self):
+        elo = Elo(["A", "B"], k_factor=32)
+        self.assertAlmostEqual(elo.expected("A", "B"), 0.5)
+        elo.update("A", "B", 1.0)
+        self.assertAlmostEqual(elo.ratings["A"], 1516)
+        self.assertAlmostEqual(elo.ratings["B"], 1484)
+        self.assertLess(0.5, elo.expected("A", "B"))
+
+    def test_interval(self):
+        elo = Elo(["A", "B"])
+        self.assertEqual(elo.interval("A"), (float("-inf"), float("inf")))
+        elo.update("A", "B", 0.5)
+        low, high = elo.interval("A")
+        for i in range(0, 99):
+            elo.update("A", "B", 0.5)
+        narrow_low, narrow_high = elo.interval("A")
+        self.assertLess(narrow_high - narrow_low, high - low)
+        self.assertLess(narrow_low, elo.ratings["A"])
+        self.assertLess(elo.ratings["A"], narrow_high)
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from random import Random
+
+from ...Board.Board import Board
+from ...bench.Benchmark import Benchmark
+from ...bench.BenchmarkSuite import BenchmarkSuite
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_seeded_workload(self):
+        rounds = []
+
+        def setup(generator):
+            value = generator.random()
+
+            def work():
+                rounds.append(value)
+                return 10
+            return work
+
+        timings = Benchmark("values", setup).run(seed=3, repeat=2)
+        self.assertEqual(timings["ops"], 10)
+        self.assertLessEqual(timings["best"], timings["median"])
+        self.assertLess(0, timings["relative"])
+        self.assertLessEqual(0, timings["noise"])
+        # a warm-up round and the timed rounds, all of the same seed
+        self.assertEqual(len(rounds), 3)
+        Benchmark("values", setup).run(seed=3, repeat=1)
+        self.assertEqual(len(set(rounds)), 1)
+
+        with self.assertRaises(ValueError):
+            Benchmark("values", setup).run(repeat=0)
+
+    def test_suite(self):
+        suite = BenchmarkSuite()
+        self.assertEqual(
+            len({benchmark.name for benchmark in suite.benchmarks}),
+            len(suite.benchmarks))
+
+        results = suite.run("board_init_7x6", repeat=1)
+        self.assertEqual(list(results["benchmarks"]), ["board_init_7x6"])
+        comparison = suite.compare(results, results, threshold=0.2)
+        self.assertFalse(comparison["board_init_7x6"]["regression"])
+
+        timings = results["benchmarks"]["board_init_7x6"]
+        baseline = {"benchmarks": {"board_init_7x6": dict(
+            timings, relative=timings["relative"] / 2)}}
+        comparison = suite.compare(results, baseline, threshold=0.2)
+        self.assertAlmostEqual(comparison["board_init_7x6"]["ratio"], 2)
+        self.assertTrue(comparison["board_init_7x6"]["regression"])
+
+        # a slower machine, the calibration is slower as well
+        baseline = {"benchmarks": {"board_init_7x6": dict(
+            timings, best=timings["best"] / 2,
+            calibration=timings["calibration"] / 2)}}
+        comparison = suite.compare(results, baseline, threshold=0.2)
+        self.assertFalse(comparison["board_init_7x6"]["regression"])
+
+        # noisy runs are allowed more
+        baseline = {"benchmarks": {"board_init_7x6": dict(
+            timings, relative=timings["relative"] / 1.3, noise=0.2)}}
+        comparison = suite.compare(results, baseline, threshold=0.2)
+        self.assertFalse(comparison["board_init_7x6"]["regression"])
+
+        # baselines without relative times compare the best times
+        baseline = {"benchmarks": {"board_init_7x6": {
+            "best": timings["best"] / 2}}}
+        comparison = suite.compare(results, baseline, threshold=0.2)
+        self.assertTrue(comparison["board_init_7x6"]["regression"])
+
+    def test_random_games(self):
+        suite = BenchmarkSuite()
+        board = Board(7, 6, 4, quiet=True)
+        games = suite.random_games(Random(5), board, 3)
+        self.assertEqual(games, suite.random_games(Random(5), board, 3))
+        for game in games:
+            board.replay(game)
+            self.assertTrue(board.is_solved())
+
+
+if __name__ == '__main__':
+    runner = unittest.main()
@@ -0,0 +1,32 @@
+import sys
+from argparse import ArgumentParser
+
+from Game.Book.OpeningBookBuilder import OpeningBookBuilder
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        description="Search the early positions of a board into a book")
+    parser.add_argument("path", help="where to write the book")
+    parser.add_argument("--width", type=int, default=7)
+    parser.add_argument("--height", type=int, default=6)
+    parser.add_argument("--line-length", type=int, default=4)
+    parser.add_argument(
+        "--plies", type=int, default=4,
+        help="positions of up to PLIES stones, 4 by default")
+    parser.add_argument(
+        "--time-budget", type=int, default=1000,
+        help="milliseconds of search per position, 1000 by default")
+    parser.add_argument(
+        "--max-depth", type=int, default=None,
+        help="limit of plies searched per position")
+    args = parser.parse_args()
+
+    def report(done: int, total: int):
+        print("\r{} of {} positions".format(done, total),
+              end="", file=sys.stderr, flush=True)
+
+    builder = OpeningBookBuilder(
+        args.width, args.height, args.line_length, args.plies,
+        time_budget=args.time_budget, max_depth=args.max_depth)
+    n_positions = builder.build(args.path, report)
+    print("\nWrote", n_positions, "positions to", args.path)
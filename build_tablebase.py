@@ -0,0 +1,25 @@
+import sys
+from argparse import ArgumentParser
+
+from Game.Tablebase.TablebaseBuilder import TablebaseBuilder
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        description="Solve the late positions of a small board")
+    parser.add_argument("path", help="where to write the tablebase")
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--height", type=int, default=4)
+    parser.add_argument("--line-length", type=int, default=3)
+    parser.add_argument(
+        "--min-stones", type=int, default=0,
+        help="positions of at least MIN_STONES stones, 0 by default")
+    args = parser.parse_args()
+
+    def report(n_stones: int, n_positions: int):
+        print("\r{} positions of {} stones".format(n_positions, n_stones),
+              end="", file=sys.stderr, flush=True)
+
+    builder = TablebaseBuilder(
+        args.width, args.height, args.line_length, args.min_stones)
+    n_positions = builder.build(args.path, report)
+    print("\nWrote", n_positions, "positions to", args.path)
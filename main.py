@@ -1,3 +1,6 @@
+from argparse import ArgumentParser
+from json import dumps
+
 from Game.Game import Game
 from Game.Player.PlayerHuman import PlayerHuman
 from Game.Player.PlayerAlgoRandom import PlayerAlgoRandom
@@ -66,4 +69,22 @@ if __name__ == "__main__":
     # Begin the play only when this file is run from console,
     # othervise variables are loaded into runtime when file
     # is included as module or called from another script
-    Game(settings).play()
+    parser = ArgumentParser(description="Connect Four")
+    parser.add_argument(
+        "--simulate", type=int, metavar="N_GAMES",
+        help="play N_GAMES between random players without any output "
+             "and print the statistics as JSON")
+    parser.add_argument(
+        "--players", type=int, default=2,
+        help="number of random players to simulate, 2 by default")
+    args = parser.parse_args()
+
+    if args.simulate is None:
+        Game(settings).play()
+    else:
+        settings["players"] = [
+            PlayerAlgoRandom(n_moves=board_width)
+            for i in range(0, args.players)
+        ]
+        settings["quiet"] = True
+        print(dumps(Game(settings).simulate(args.simulate), indent=4))
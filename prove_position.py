@@ -0,0 +1,45 @@
+import sys
+from argparse import ArgumentParser
+
+from Game.Board.Board import Board
+from Game.Search.ProofNumberSearch import ProofNumberSearch
+from Game.Search.ProofTable import ProofTable
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        description="Prove or disprove a forced win of the side to move")
+    parser.add_argument(
+        "moves", nargs="*", type=int,
+        help="columns of the moves of the position, in order")
+    parser.add_argument("--width", type=int, default=7)
+    parser.add_argument("--height", type=int, default=6)
+    parser.add_argument("--line-length", type=int, default=4)
+    parser.add_argument(
+        "--max-nodes", type=int, default=None,
+        help="limit of nodes to visit")
+    parser.add_argument(
+        "--time-budget", type=int, default=None,
+        help="limit of milliseconds to search")
+    parser.add_argument(
+        "--table-memory", type=int, default=256 << 20,
+        help="bytes for the table of proof numbers, 256 MiB by default")
+    args = parser.parse_args()
+
+    board = Board(args.width, args.height, args.line_length, quiet=True)
+    board.replay(args.moves)
+    if board.is_solved():
+        sys.exit("The game is over in this position")
+
+    player = len(args.moves) % 2
+    search = ProofNumberSearch(
+        board, player, 1 - player, ProofTable(args.table_memory))
+    result, column = search.prove(
+        board.masks[player], board.mask, args.max_nodes, args.time_budget)
+
+    if result == ProofNumberSearch.PROVEN:
+        print("Win by column", column, end="")
+    elif result == ProofNumberSearch.DISPROVEN:
+        print("No forced win", end="")
+    else:
+        print("Unknown within the budget", end="")
+    print(", {} nodes".format(search.nodes))
@@ -2,7 +2,25 @@ import unittest
 
 from Game.test.TestGame import TestGame
 from Game.test.Player.TestPlayer import TestPlayer
+from Game.test.Player.TestPlayerAlgoSolver import TestPlayerAlgoSolver
+from Game.test.Player.TestPlayerAlgoMCTS import TestPlayerAlgoMCTS
+from Game.test.Player.TestPlayerAlgoMaxN import TestPlayerAlgoMaxN
 from Game.test.Board.TestBoard import TestBoard
+from Game.test.Board.TestBatchBoard import TestBatchBoard
+from Game.test.Board.TestLineBoard import TestLineBoard
+from Game.test.Search.TestTranspositionTable import TestTranspositionTable
+from Game.test.Search.TestProofNumberSearch import TestProofNumberSearch
+from Game.test.Search.TestSearchClock import TestSearchClock
+from Game.test.Tournament.TestTournament import TestTournament, TestElo
+from Game.test.Host.TestAsyncHost import TestAsyncHost
+from Game.test.Scheduler.TestScheduler import TestScheduler
+from Game.test.Output.TestOutput import TestOutput
+from Game.test.Record.TestRecord import TestRecord
+from Game.test.bench.TestBenchmark import TestBenchmark
+from Game.test.Metrics.TestMetrics import TestMetrics
+from Game.test.Seed.TestSeedSequence import TestSeedSequence
+from Game.test.Book.TestOpeningBook import TestOpeningBook
+from Game.test.Tablebase.TestTablebase import TestTablebase
 
 if __name__ == '__main__':
     runner = unittest.main()
\ No newline at end of file
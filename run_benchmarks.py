@@ -0,0 +1,68 @@
+import os
+import sys
+from argparse import ArgumentParser
+from json import dumps
+
+from Game.bench.BenchmarkSuite import BenchmarkSuite
+
+BASELINE = os.path.join(os.path.dirname(__file__), "Game", "bench",
+                        "baseline.json")
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        description="Benchmarks of Connect Four, compared to a baseline")
+    parser.add_argument(
+        "pattern", nargs="?", default="",
+        help="run only the benchmarks with PATTERN in the name")
+    parser.add_argument(
+        "--repeat", type=int, default=9,
+        help="timed rounds of every benchmark, 9 by default")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="seed of the workloads, 0 by default")
+    parser.add_argument(
+        "--output", metavar="PATH",
+        help="write the results as JSON to PATH")
+    parser.add_argument(
+        "--baseline", metavar="PATH", default=BASELINE,
+        help="results to compare to, Game/bench/baseline.json by default")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="allowed slow down against the baseline on top of the "
+             "noise of the runs, 0.2 for 20%%")
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="store the results as the new baseline, with more rounds "
+             "like --repeat 25 its noise is lower")
+    args = parser.parse_args()
+
+    def report(name: str, timings: dict):
+        print("{:<26} {:>12.0f} ops/s  best {:.3e} s  median {:.3e} s"
+              "  relative {:.3f} \u00b1{:.0%}".format(
+                  name, timings["ops_per_second"],
+                  timings["best"], timings["median"],
+                  timings["relative"], timings["noise"]))
+
+    suite = BenchmarkSuite()
+    results = suite.run(args.pattern, args.seed, args.repeat, report)
+
+    if args.output:
+        suite.save(results, args.output)
+
+    if args.save_baseline:
+        suite.save(results, args.baseline)
+        print("Saved the baseline to", args.baseline)
+    elif os.path.exists(args.baseline):
+        comparison = suite.compare(
+            results, suite.load(args.baseline), args.threshold)
+        regressions = {
+            name: "{:.3f} > {:.3f}".format(item["ratio"], 1 + item["allowed"])
+            for name, item in comparison.items() if item["regression"]
+        }
+        print("Compared to", args.baseline, dumps({
+            name: round(item["ratio"], 3) for name, item in comparison.items()
+        }, indent=4))
+        if regressions:
+            print("Slower than the baseline by more than",
+                  "{:.0%} and the noise:".format(args.threshold), regressions)
+            sys.exit(1)